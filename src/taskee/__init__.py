@@ -1,5 +1,27 @@
-from .taskee import Taskee
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .filters import TaskFilter
+
+if TYPE_CHECKING:
+    from .registry import Profile
+    from .taskee import Taskee
 
 __version__ = "0.0.4"
 
-__all__ = ["Taskee"]
+__all__ = ["Profile", "TaskFilter", "Taskee"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import lazily so that the CLI can start without loading Earth Engine
+    if name == "Profile":
+        from .registry import Profile
+
+        return Profile
+    if name == "Taskee":
+        from .taskee import Taskee
+
+        return Taskee
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,73 @@
 from __future__ import annotations
 
-import ee
+import functools
+import os
+import sys
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable
+
 import rich_click as click  # type: ignore
-from rich.status import Status
 
-from taskee.cli.commands import dashboard, log, tasks, test
 from taskee.events import ErrorEvent, EventEnum
+from taskee.filters import TaskFilter
 from taskee.notifiers import NotifierEnum
-from taskee.taskee import Taskee
+from taskee.utils import HISTORY_PATH
+
+if TYPE_CHECKING:
+    from taskee.registry import Credentials, Profile
+
+# Earth Engine, pydantic, and the command modules are imported by the commands that
+# need them, so that `taskee --help` and `taskee test` start quickly.
 
 click.rich_click.SHOW_ARGUMENTS = True
 click.rich_click.USE_MARKDOWN = True
 
-modes = {"log": log.start, "dashboard": dashboard.start}
+MODES = ("log", "dashboard")
+
+
+class _LazyChoice(click.Choice):
+    """A choice whose options are only loaded when they're first needed."""
+
+    def __init__(
+        self, get_choices: Callable[[], Sequence[str]], case_sensitive: bool = True
+    ):
+        self.get_choices = get_choices
+        self.case_sensitive = case_sensitive
+
+    @functools.cached_property
+    def choices(self) -> Sequence[str]:  # type: ignore[override]
+        return tuple(self.get_choices())
+
+
+def _get_operation_types() -> list[str]:
+    from taskee.operation import OperationType
+
+    return list(OperationType.__members__.keys())
+
+
+def _get_operation_states() -> list[str]:
+    from taskee.operation import OperationState
+
+    return list(OperationState.__members__.keys())
+
 
 PRIVATE_KEY_OPTION = click.option(
-    "private_key",
+    "private_keys",
     "-k",
     "--private-key",
-    default=None,
+    multiple=True,
     type=click.Path(exists=True, dir_okay=False),
-    help="Optional path to private key file for Earth Engine authentication.",
+    help="Optional path to private key file for Earth Engine authentication. Repeat "
+    "to monitor several accounts.",
+)
+
+PROJECT_OPTION = click.option(
+    "projects",
+    "-p",
+    "--project",
+    multiple=True,
+    help="Cloud project to monitor tasks in. Repeat to monitor several projects.",
 )
 
 NOTIFIERS_OPTION = click.option(
@@ -43,6 +90,77 @@ INTERVAL_OPTION = click.option(
     help="Minutes between queries to Earth Engine for task updates.",
 )
 
+ADAPTIVE_OPTION = click.option(
+    "adaptive",
+    "-a",
+    "--adaptive",
+    is_flag=True,
+    default=False,
+    help="Check more often when tasks are active and back off when they're not.",
+)
+
+MIN_INTERVAL_OPTION = click.option(
+    "min_interval_mins",
+    "--min-interval-mins",
+    default=1.0,
+    help="Minimum minutes between queries with --adaptive.",
+)
+
+MAX_INTERVAL_OPTION = click.option(
+    "max_interval_mins",
+    "--max-interval-mins",
+    default=60.0,
+    help="Maximum minutes between queries with --adaptive.",
+)
+
+SINCE_OPTION = click.option(
+    "since_days",
+    "-s",
+    "--since",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Only track tasks created within this many days.",
+)
+
+HISTORY_FILE_OPTION = click.option(
+    "history_file",
+    "--history-file",
+    default=HISTORY_PATH,
+    type=click.Path(dir_okay=False),
+    help="The event history database.",
+)
+
+TYPE_FILTER_OPTION = click.option(
+    "task_types",
+    "-t",
+    "--type",
+    multiple=True,
+    type=_LazyChoice(_get_operation_types, case_sensitive=False),
+    help="Only include tasks of this type. Repeat to include several types.",
+)
+
+STATE_FILTER_OPTION = click.option(
+    "task_states",
+    "--state",
+    multiple=True,
+    type=_LazyChoice(_get_operation_states, case_sensitive=False),
+    help="Only include tasks currently in this state. Repeat to include several.",
+)
+
+DESCRIPTION_FILTER_OPTION = click.option(
+    "description",
+    "--description",
+    default=None,
+    help="Only include tasks with descriptions matching this pattern, e.g. nightly_*.",
+)
+
+SCRIPT_URI_FILTER_OPTION = click.option(
+    "script_uri",
+    "--script-uri",
+    default=None,
+    help="Only include tasks started by scripts with URIs matching this pattern.",
+)
+
 WATCH_FOR_ARG = click.argument(
     "watch_for",
     nargs=-1,
@@ -72,17 +190,107 @@ def taskee() -> None:
 
 
 @taskee.command(name="start", short_help="Start running the notification system.")
-@click.argument("mode", nargs=1, type=click.Choice(choices=modes.keys()))
+@click.argument("mode", nargs=1, type=click.Choice(choices=MODES))
 @WATCH_FOR_ARG
 @NOTIFIERS_OPTION
 @INTERVAL_OPTION
+@ADAPTIVE_OPTION
+@MIN_INTERVAL_OPTION
+@MAX_INTERVAL_OPTION
+@SINCE_OPTION
+@click.option(
+    "digest_window",
+    "-d",
+    "--digest-window",
+    default=None,
+    type=click.FloatRange(min=0),
+    help="Combine task notifications into one digest per this many seconds.",
+)
+@click.option(
+    "immediate_failures",
+    "--immediate-failures",
+    is_flag=True,
+    default=False,
+    help="Send failure notifications immediately instead of including them in digests.",
+)
+@click.option(
+    "snapshot_path",
+    "--snapshot",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="File to save task states to, so events missed while stopped are reported "
+    "on restart.",
+)
+@click.option(
+    "record_history",
+    "--history",
+    is_flag=True,
+    default=False,
+    help="Record events to the event history for `taskee history`.",
+)
+@HISTORY_FILE_OPTION
 @PRIVATE_KEY_OPTION
+@PROJECT_OPTION
+@TYPE_FILTER_OPTION
+@DESCRIPTION_FILTER_OPTION
+@SCRIPT_URI_FILTER_OPTION
+@click.option(
+    "timings",
+    "--timings",
+    is_flag=True,
+    default=False,
+    help="Log how long each phase of every update took (log mode only).",
+)
+@click.option(
+    "metrics_port",
+    "--metrics-port",
+    default=None,
+    type=click.IntRange(min=1, max=65535),
+    help="Serve Prometheus metrics at http://localhost:PORT/metrics.",
+)
+@click.option(
+    "subscriptions_path",
+    "--subscriptions",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+    help="JSON file of rules that route matching events to specific notifiers.",
+)
+@click.option(
+    "rate_limits",
+    "--rate-limit",
+    multiple=True,
+    type=(
+        click.Choice(list(NotifierEnum.__members__.keys()), case_sensitive=False),
+        click.IntRange(min=1),
+        click.FloatRange(min=0, min_open=True),
+    ),
+    metavar="NOTIFIER BURST PER_MINUTE",
+    help="Limit a notifier to bursts of BURST notifications, refilled at PER_MINUTE. "
+    "Notifications over the limit are deferred or summarized.",
+)
 def start_command(
     mode: str,
     watch_for: tuple[str, ...],
     notifiers: tuple[str, ...],
     interval_mins: float,
-    private_key: str | None,
+    adaptive: bool,
+    min_interval_mins: float,
+    max_interval_mins: float,
+    since_days: float | None,
+    digest_window: float | None,
+    immediate_failures: bool,
+    snapshot_path: str | None,
+    record_history: bool,
+    history_file: str,
+    private_keys: tuple[str, ...],
+    projects: tuple[str, ...],
+    task_types: tuple[str, ...],
+    description: str | None,
+    script_uri: str | None,
+    timings: bool,
+    metrics_port: int | None,
+    subscriptions_path: str | None,
+    rate_limits: tuple[tuple[str, int, float], ...],
 ) -> None:
     """
     Start running the notification system. Select a mode
@@ -93,10 +301,23 @@ def start_command(
 
     ```bash
     $ taskee start dashboard failed completed -n pushbullet -i 5
-    $ taskee start log all
+    $ taskee start log all --since 7
     $ taskee start log --private-key .private-key.json
+    $ taskee start log all --digest-window 60 --immediate-failures
+    $ taskee start dashboard -k first-key.json -k second-key.json
+    $ taskee start log all --history
+    $ taskee start log --adaptive -i 5 --min-interval-mins 1 --max-interval-mins 60
+    $ taskee start log --type export_image --description "nightly_*"
+    $ taskee start log --timings
+    $ taskee start log --metrics-port 9090
+    $ taskee start log --subscriptions subscriptions.json
+    $ taskee start log -n pushbullet --rate-limit pushbullet 5 1
     ```
     """
+    from taskee.cli.commands import dashboard, log
+    from taskee.scheduler import AdaptiveScheduler
+    from taskee.taskee import Taskee
+
     if "all" in notifiers:
         notifiers = tuple(NotifierEnum.__members__.keys())
     if "all" in watch_for:
@@ -104,16 +325,62 @@ def start_command(
     elif len(watch_for) == 0:
         watch_for = ("completed", "failed", "error")
 
-    if private_key:
-        credentials = ee.ServiceAccountCredentials(email=None, key_file=private_key)
-    else:
-        credentials = "persistent"
+    scheduler = None
+    if adaptive:
+        # Widen the bounds if needed so that they always contain the base interval
+        scheduler = AdaptiveScheduler(
+            interval_seconds=interval_mins * 60.0,
+            min_seconds=min(min_interval_mins, interval_mins) * 60.0,
+            max_seconds=max(max_interval_mins, interval_mins) * 60.0,
+        )
 
-    mode_func = modes[mode]
-    t = Taskee(notifiers=notifiers, watch_for=watch_for, credentials=credentials)
+    if timings and mode != "log":
+        raise click.UsageError("--timings is only supported in log mode.")
+
+    mode_func = {"log": log.start, "dashboard": dashboard.start}[mode]
+    mode_kwargs = {"timings": timings} if mode == "log" else {}
+
+    subscriptions = []
+    if subscriptions_path is not None:
+        from taskee.routing import load_subscriptions
+
+        try:
+            subscriptions = load_subscriptions(subscriptions_path)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--subscriptions") from None
+
+    metrics = None
+    if metrics_port is not None:
+        from taskee.metrics import Metrics, start_metrics_server
+
+        metrics = Metrics()
+        try:
+            start_metrics_server(metrics, metrics_port)
+        except OSError as e:
+            raise click.ClickException(
+                f"Couldn't serve metrics on port {metrics_port}: {e}"
+            ) from None
+
+    t = Taskee(
+        notifiers=notifiers,
+        watch_for=watch_for,
+        profiles=_get_profiles(private_keys, projects),
+        max_age=_days_to_timedelta(since_days),
+        queued=True,
+        digest_window=digest_window,
+        digest_bypass=("failed",) if immediate_failures else tuple(),
+        snapshot_path=snapshot_path,
+        history_path=history_file if record_history else None,
+        task_filter=_get_task_filter(task_types, (), description, script_uri),
+        metrics=metrics,
+        subscriptions=subscriptions,
+        rate_limits={
+            name: (burst, per_minute) for name, burst, per_minute in rate_limits
+        },
+    )
 
     try:
-        mode_func(t, interval_minutes=interval_mins)
+        mode_func(t, interval_minutes=interval_mins, scheduler=scheduler, **mode_kwargs)
     except Exception as e:
         if "error" in [event.lower() for event in watch_for]:
             t.event_queue.append(ErrorEvent())
@@ -121,21 +388,161 @@ def start_command(
         raise e
     except KeyboardInterrupt:
         return
+    finally:
+        t.flush()
 
 
 @taskee.command(name="tasks")
 @click.option("max_tasks", "-m", "--max-tasks", default=30, help="Max tasks displayed.")
+@click.option(
+    "output_format",
+    "-f",
+    "--format",
+    default="table",
+    type=click.Choice(["table", "json", "ndjson", "csv"], case_sensitive=False),
+    help="Output format. Machine-readable formats stream every task as it's fetched.",
+)
+@SINCE_OPTION
 @PRIVATE_KEY_OPTION
-def tasks_command(max_tasks: int, private_key: str | None) -> None:
-    """Display a table of current Earth Engine tasks."""
-    if private_key:
-        credentials = ee.ServiceAccountCredentials(email=None, key_file=private_key)
-    else:
-        credentials = "persistent"
+@PROJECT_OPTION
+@TYPE_FILTER_OPTION
+@STATE_FILTER_OPTION
+@DESCRIPTION_FILTER_OPTION
+@SCRIPT_URI_FILTER_OPTION
+def tasks_command(
+    max_tasks: int,
+    output_format: str,
+    since_days: float | None,
+    private_keys: tuple[str, ...],
+    projects: tuple[str, ...],
+    task_types: tuple[str, ...],
+    task_states: tuple[str, ...],
+    description: str | None,
+    script_uri: str | None,
+) -> None:
+    """
+    Display a table of current Earth Engine tasks, or stream all tasks as JSON, NDJSON,
+    or CSV. Streamed tasks are written newest first as they are fetched.
+    \
+
+    **Examples**
+
+    ```bash
+    $ taskee tasks --max-tasks 50
+    $ taskee tasks --format ndjson --since 1 | jq .description
+    $ taskee tasks --format csv > tasks.csv
+    $ taskee tasks --state running --state pending
+    ```
+    """
+    from rich.status import Status
+
+    from taskee.cli.commands import tasks
+
+    profiles = _get_profiles(private_keys, projects)
+    max_age = _days_to_timedelta(since_days)
+    task_filter = _get_task_filter(task_types, task_states, description, script_uri)
+
+    if output_format.lower() != "table":
+        from taskee.registry import initialize_registries
+
+        registries = initialize_registries(profiles, task_filter)
+        tasks.stream_tasks(
+            (task for r in registries for task in r.iter_tasks(max_age)),
+            output_format.lower(),
+            file=sys.stdout,
+        )
+        return
+
+    from taskee.taskee import Taskee
 
     with Status("Retrieving tasks from Earth Engine...", spinner="bouncingBar"):
-        t = Taskee(notifiers=tuple(), credentials=credentials)
-        tasks.tasks(t.tasks, max_tasks=max_tasks)
+        t = Taskee(
+            notifiers=tuple(),
+            profiles=profiles,
+            max_age=max_age,
+            task_filter=task_filter.without_states() if task_filter else None,
+        )
+        # States can only be filtered once the tasks are retrieved
+        shown = tuple(
+            task
+            for task in t.tasks
+            if task_filter is None or task_filter.matches_state(task.metadata.state)
+        )
+        tasks.tasks(shown, max_tasks=max_tasks, show_project=len(t.profiles) > 1)
+
+
+@taskee.command(name="history", short_help="Search the event history.")
+@click.argument(
+    "event_types",
+    nargs=-1,
+    type=click.Choice(choices=list(EventEnum.__members__.keys()), case_sensitive=False),
+)
+@click.option(
+    "task_types",
+    "-t",
+    "--type",
+    multiple=True,
+    type=_LazyChoice(_get_operation_types, case_sensitive=False),
+    help="Only show events for this task type.",
+)
+@click.option(
+    "description",
+    "--description",
+    default=None,
+    help="Only show events for tasks with descriptions matching this pattern.",
+)
+@click.option(
+    "since_days",
+    "-s",
+    "--since",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    help="Only show events from the last this many days.",
+)
+@click.option("limit", "-l", "--limit", default=50, help="Max events displayed.")
+@HISTORY_FILE_OPTION
+def history_command(
+    event_types: tuple[str, ...],
+    task_types: tuple[str, ...],
+    description: str | None,
+    since_days: float | None,
+    limit: int,
+    history_file: str,
+) -> None:
+    """
+    Search events recorded with `taskee start --history`, newest first. Select any
+    event types to show (default all).
+    \
+
+    **Examples**
+
+    ```bash
+    $ taskee history failed --type export_image --since 7
+    $ taskee history --description "nightly_*"
+    ```
+    """
+    from taskee.cli.commands import history
+    from taskee.history import EventHistory
+
+    if not os.path.exists(history_file):
+        click.echo(
+            f"No history recorded at {history_file}. Run `taskee start --history` to "
+            "record events."
+        )
+        return
+
+    max_age = _days_to_timedelta(since_days)
+    event_history = EventHistory(history_file, read_only=True)
+    records = event_history.query(
+        event_types=event_types,
+        task_types=task_types,
+        description=description,
+        since=datetime.now() - max_age if max_age is not None else None,
+        limit=limit,
+    )
+    event_history.close()
+
+    history.history(records)
 
 
 @taskee.command(name="test", short_help="Send test notifications.")
@@ -151,6 +558,8 @@ def test_command(notifiers: tuple[str, ...]) -> None:
     $ taskee test -n all
     ```
     """
+    from taskee.cli.commands import test
+
     if "all" in notifiers:
         notifiers = tuple(NotifierEnum.__members__.keys())
 
@@ -158,5 +567,51 @@ def test_command(notifiers: tuple[str, ...]) -> None:
     test.test(notifier_instances)
 
 
+def _get_profiles(
+    private_keys: tuple[str, ...], projects: tuple[str, ...]
+) -> list[Profile]:
+    """Get a profile for each combination of private key and project.
+
+    Without private keys, persistent credentials are used. Without projects, each key
+    monitors its own project (or the default project for persistent credentials).
+    """
+    import ee
+
+    from taskee.registry import Profile
+
+    credentials: list[Credentials] = [
+        ee.ServiceAccountCredentials(email=None, key_file=key) for key in private_keys
+    ] or ["persistent"]
+
+    return [
+        Profile(credentials=creds, project=project)
+        for creds in credentials
+        for project in (projects or (None,))
+    ]
+
+
+def _get_task_filter(
+    task_types: tuple[str, ...],
+    task_states: tuple[str, ...],
+    description: str | None,
+    script_uri: str | None,
+) -> TaskFilter | None:
+    """Get a task filter from the CLI filter options, if any were given."""
+    if not (task_types or task_states or description or script_uri):
+        return None
+
+    return TaskFilter(
+        types=task_types,
+        states=task_states,
+        description=description,
+        script_uri=script_uri,
+    )
+
+
+def _days_to_timedelta(days: float | None) -> timedelta | None:
+    """Convert an optional number of days from the CLI to a timedelta."""
+    return timedelta(days=days) if days is not None else None
+
+
 if __name__ == "__main__":
     taskee()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import threading
 import time
 from collections import deque
+from collections.abc import Hashable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import humanize  # type: ignore
@@ -13,14 +16,57 @@ from rich.progress_bar import ProgressBar
 from rich.table import Table
 from rich.text import Text
 
-from taskee.cli.commands.tasks import create_task_table
+from taskee.cli.commands.tasks import TaskRows, create_task_table
+from taskee.cli.keys import KeyReader
+from taskee.cli.rows import RowCache
 from taskee.cli.styles import get_style
+from taskee.notifiers import RateLimited
+from taskee.operation import Operation
+from taskee.scheduler import AdaptiveScheduler
 from taskee.taskee import Taskee
 
 if TYPE_CHECKING:
     from taskee.events import _Event
 
 
+class _EventRows(RowCache["_Event"]):
+    """Formatted event table rows. Events never change, so only times are updated."""
+
+    def __init__(self, watch_for: list[type[_Event]]):
+        super().__init__()
+        self.watch_for = watch_for
+
+    def _get_key(self, event: _Event) -> Hashable:
+        # Logged events are kept alive by the event log, so their ids are unique
+        return id(event)
+
+    def _format(self, event: _Event) -> tuple[str, ...]:
+        event_style = get_style(event.__class__)
+        event_name = event.__class__.__name__.replace("Event", "")
+        muted_style = "[dim]" if event.__class__ not in self.watch_for else ""
+
+        return (
+            f"[{event_style.color}]{event_name}[/] {event_style.emoji}",
+            f"{muted_style}{event.message}",
+        )
+
+    def _format_time(self, event: _Event, now: float) -> str:
+        return humanize.naturaltime(now - event.time.timestamp())
+
+    def _join(self, cells: tuple[str, ...], relative: str) -> tuple[str, ...]:
+        return (*cells, relative)
+
+
+@dataclass(frozen=True)
+class _DashboardState:
+    """An immutable snapshot of the dashboard state published by the poller."""
+
+    tasks: tuple[Operation, ...]
+    events: tuple[_Event, ...]
+    last_checked: float
+    interval_seconds: float
+
+
 class _Dashboard:
     REFRESH_SECONDS = 1
     MAX_ROWS = 20
@@ -30,12 +76,26 @@ class _Dashboard:
         self,
         t: Taskee,
         interval_minutes: float = 5.0,
+        scheduler: AdaptiveScheduler | None = None,
     ):
         self.event_log: deque[_Event] = deque(maxlen=self.MAX_ROWS)
-        self.last_checked = 0.0
 
         self.t = t
-        self.interval_seconds = interval_minutes * 60.0
+        self.scheduler = scheduler
+        self.updating = False
+        self.state = _DashboardState(
+            tasks=t.tasks,
+            events=(),
+            last_checked=0.0,
+            interval_seconds=interval_minutes * 60.0,
+        )
+        self._task_rows = TaskRows(show_project=len(t.profiles) > 1)
+        self._event_rows = _EventRows(t.watch_for)
+        self._stopped = threading.Event()
+        self._error: BaseException | None = None
+        # The first visible row and the number of visible rows in the task pane
+        self.task_offset = 0
+        self._task_page_size = self.MAX_ROWS
 
         self.layout = self._create_layout()
         self.window = Panel(
@@ -48,42 +108,97 @@ class _Dashboard:
         # Initialize dashboard before starting Live so we don't render a preview layout
         self._update_display()
 
-    @property
-    def _elapsed(self) -> float:
-        """Return the time elapsed since the last event update"""
-        return time.time() - self.last_checked
-
     @property
     def _time_remaining(self) -> float:
         """Return the time remaining until the next event update"""
-        return self.interval_seconds - self._elapsed
+        return _get_time_remaining(self.state)
 
     def _run(self) -> None:
-        """Run the dashboard indefinitely."""
-        with Live(self.window):
-            while True:
-                if self._elapsed > self.interval_seconds:
-                    self._update_events()
-
-                self._update_display()
-                time.sleep(self.REFRESH_SECONDS)
+        """Run the dashboard indefinitely.
+
+        Updates run on a background thread, so slow Earth Engine requests or
+        notifiers never stall the display. Errors from the background thread are
+        raised here.
+        """
+        poller = threading.Thread(target=self._poll, name="taskee-poller", daemon=True)
+        poller.start()
+        try:
+            with Live(self.window), KeyReader() as keys:
+                while True:
+                    if self._error is not None:
+                        raise self._error
+
+                    self._update_display()
+                    # Redraw immediately after key presses to keep scrolling responsive
+                    if keys.active:
+                        for key in keys.get_keys(self.REFRESH_SECONDS):
+                            self._handle_key(key)
+                    else:
+                        time.sleep(self.REFRESH_SECONDS)
+        finally:
+            self._stopped.set()
+
+    def scroll(self, rows: int) -> None:
+        """Scroll the task pane by a number of rows, clamped to the task list."""
+        max_offset = max(len(self.state.tasks) - self._task_page_size, 0)
+        self.task_offset = min(max(self.task_offset + rows, 0), max_offset)
+
+    def _handle_key(self, key: str) -> None:
+        """Scroll or page the task pane in response to a key press."""
+        page = self._task_page_size
+        n_tasks = len(self.state.tasks)
+        rows = {
+            "up": -1,
+            "down": 1,
+            "page_up": -page,
+            "page_down": page,
+            "home": -n_tasks,
+            "end": n_tasks,
+        }
+        if key in rows:
+            self.scroll(rows[key])
+
+    def _poll(self) -> None:
+        """Update events whenever the interval elapses until the dashboard stops."""
+        while not self._stopped.wait(max(self._time_remaining, 0.0)):
+            try:
+                self._update_events()
+            except BaseException as e:
+                self._error = e
+                return
 
     def _update_events(self) -> None:
-        """Update Earth Engine tasks and store new events."""
-        new_events = self.t.update()
-        self.t.dispatch()
+        """Update Earth Engine tasks, store new events, and publish a new state."""
+        self.updating = True
+        try:
+            new_events = self.t.update()
+            self.t.dispatch()
+        finally:
+            self.updating = False
 
         for event in new_events:
             self.event_log.appendleft(event)
 
-        self.last_checked = time.time()
+        interval_seconds = self.state.interval_seconds
+        if self.scheduler is not None:
+            interval_seconds = self.scheduler.next_interval(
+                self.t.active_tasks, new_events
+            )
+
+        self.state = _DashboardState(
+            tasks=self.t.tasks,
+            events=tuple(self.event_log),
+            last_checked=time.time(),
+            interval_seconds=interval_seconds,
+        )
 
     def _update_display(self) -> None:
-        """Update the dasboard display."""
-        self.layout["header"].update(self._create_header())
-        self.layout["progress"].update(self._create_progress())
+        """Update the dasboard display from the latest published state."""
+        state = self.state
+        self.layout["header"].update(self._create_header(state))
+        self.layout["progress"].update(self._create_progress(state))
 
-        task_table, event_table = self._create_tables()
+        task_table, event_table = self._create_tables(state)
         self.layout["tasks"].update(task_table)
         self.layout["events"].update(event_table)
         self.layout["tasks"].size = task_table.row_count + self.TABLE_HEADER_HEIGHT
@@ -100,41 +215,81 @@ class _Dashboard:
             Layout(name="tasks", minimum_size=4),
         )
 
-        layout["progress"].update(self._create_progress())
-        layout["header"].update(self._create_header())
+        layout["progress"].update(self._create_progress(self.state))
+        layout["header"].update(self._create_header(self.state))
 
         return layout
 
-    def _create_header(self) -> Table:
+    def _create_header(self, state: _DashboardState) -> Table:
         """Create the dashboard Header showing the update time and controls."""
         grid = Table.grid(expand=True)
         grid.add_column(justify="left")
+        grid.add_column(justify="center")
         grid.add_column(justify="right")
+        if self.updating:
+            status = "[italic]Updating…[/]"
+        else:
+            remaining = humanize.naturaldelta(max(_get_time_remaining(state), 0.0))
+            status = f"[italic]Next update in {remaining}...[/]"
+
         grid.add_row(
-            "[italic]Next update in"
-            f" {humanize.naturaldelta(self._time_remaining)}...[/]",
+            status,
+            self._get_rate_limits(),
             Text("Press CTRL + C to exit...", style="dim"),
         )
 
         return grid
 
-    def _create_progress(self) -> ProgressBar:
+    def _get_rate_limits(self) -> str:
+        """Return the state of each rate limited notifier."""
+        limits = []
+        for notifier in self.t.all_notifiers:
+            if not isinstance(notifier, RateLimited):
+                continue
+            if notifier.pending:
+                limits.append(
+                    f"[yellow]{notifier.name} backing off "
+                    f"({notifier.pending} deferred)[/]"
+                )
+            else:
+                tokens = f"{int(notifier.bucket.tokens)}/{notifier.bucket.burst}"
+                limits.append(f"[dim]{notifier.name} {tokens}[/]")
+
+        return " · ".join(limits)
+
+    def _create_progress(self, state: _DashboardState) -> ProgressBar:
         return ProgressBar(
-            total=self.interval_seconds,
-            completed=self.interval_seconds - self._time_remaining,
+            total=state.interval_seconds,
+            completed=state.interval_seconds - _get_time_remaining(state),
+            pulse=self.updating,
             complete_style="bright_yellow",
         )
 
-    def _create_tables(self) -> tuple[Table, Table]:
-        n_tasks = self.MAX_ROWS - min(max(len(self.event_log), 1), self.MAX_ROWS // 2)
+    def _create_tables(self, state: _DashboardState) -> tuple[Table, Table]:
+        n_tasks = self.MAX_ROWS - min(max(len(state.events), 1), self.MAX_ROWS // 2)
         n_events = self.MAX_ROWS - n_tasks
 
-        task_table = create_task_table(self.t.tasks, n_tasks)
-        event_table = self._create_event_table(n_events)
+        # Only the visible slice of tasks is formatted, however many there are
+        self._task_page_size = n_tasks
+        max_offset = max(len(state.tasks) - n_tasks, 0)
+        self.task_offset = min(self.task_offset, max_offset)
+        visible = state.tasks[self.task_offset : self.task_offset + n_tasks]
+        task_table = create_task_table(
+            visible,
+            n_tasks,
+            show_project=self._task_rows.show_project,
+            rows=self._task_rows,
+        )
+        if len(state.tasks) > n_tasks:
+            task_table.caption = (
+                f"{self.task_offset + 1:,}-{self.task_offset + len(visible):,} of "
+                f"{len(state.tasks):,} tasks (↑/↓ to scroll, PgUp/PgDn to page)"
+            )
+        event_table = self._create_event_table(state.events[:n_events])
 
         return task_table, event_table
 
-    def _create_event_table(self, max_events: int | None = None) -> Table:
+    def _create_event_table(self, events: tuple[_Event, ...]) -> Table:
         """Create a table of events."""
         t = Table(
             title="[bold bright_blue]Events",
@@ -147,28 +302,27 @@ class _Dashboard:
         t.add_column("Message", justify="left")
         t.add_column("Time", justify="right")
 
-        for event in tuple(self.event_log)[:max_events]:
-            event_time = humanize.naturaltime(event.time)
-            event_style = get_style(event.__class__)
-            event_name = event.__class__.__name__.replace("Event", "")
-            muted_style = "[dim]" if event.__class__ not in self.t.watch_for else ""
-            t.add_row(
-                f"[{event_style.color}]{event_name}[/] {event_style.emoji}",
-                f"{muted_style}{event.message}",
-                event_time,
-            )
-        if len(self.event_log) == 0:
+        for row in self._event_rows.get_rows(events):
+            t.add_row(*row)
+        if not events:
             t.add_row("", Text("No events yet..."), "", style="dim italic bright_black")
 
         return t
 
 
+def _get_time_remaining(state: _DashboardState) -> float:
+    """Return the time remaining until the next event update in a given state."""
+    return state.interval_seconds - (time.time() - state.last_checked)
+
+
 def start(
     t: Taskee,
     interval_minutes: float = 5.0,
+    scheduler: AdaptiveScheduler | None = None,
 ) -> None:
     """Run an indefinite dashboard. This handles scheduling of Earth Engine updates and
-    runs a live-updating dashboard of tasks and events as they occur.
+    runs a live-updating dashboard of tasks and events as they occur. If a scheduler is
+    provided, it chooses the interval after each update.
     """
-    dashboard = _Dashboard(t, interval_minutes)
+    dashboard = _Dashboard(t, interval_minutes, scheduler)
     dashboard._run()
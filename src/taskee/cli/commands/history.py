@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import humanize  # type: ignore
+import rich
+from rich import box
+from rich.table import Table
+
+from taskee.cli.styles import get_style
+from taskee.events import EventEnum
+from taskee.history import HistoryRecord
+
+
+def history(records: Sequence[HistoryRecord]) -> None:
+    table = create_history_table(records)
+    rich.print(table)
+
+
+def create_history_table(records: Sequence[HistoryRecord]) -> Table:
+    """Create a table of events from the event history."""
+    t = Table(
+        title="[bold bright_blue]Event History",
+        box=box.SIMPLE_HEAD,
+        header_style="bright_blue",
+        expand=True,
+    )
+
+    t.add_column("Event", justify="right")
+    t.add_column("Message", justify="left")
+    t.add_column("Type", justify="left")
+    t.add_column("Time", justify="right")
+
+    for record in records:
+        event_style = get_style(EventEnum[record.event].value)
+        t.add_row(
+            f"[{event_style.color}]{record.event.title()}[/] {event_style.emoji}",
+            record.message,
+            record.task_type or "-",
+            humanize.naturaltime(record.time),
+        )
+
+    if not records:
+        t.add_row("", "No events found...", "", "", style="dim italic bright_black")
+
+    return t
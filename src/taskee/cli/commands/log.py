@@ -1,31 +1,30 @@
 from __future__ import annotations
 
 import datetime
-import logging
 import time
+from typing import TYPE_CHECKING
 
-from rich.logging import RichHandler
 from rich.status import Status
 
+from taskee.cli.logger import logger
 from taskee.cli.styles import get_style
 from taskee.operation import FINISHED_OPERATION_STATES
-from taskee.taskee import Taskee
 
-logging.basicConfig(
-    format="%(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[RichHandler(show_level=True, show_path=False, markup=True)],
-)
-
-logger = logging.getLogger("taskee")
+if TYPE_CHECKING:
+    from taskee.scheduler import AdaptiveScheduler
+    from taskee.taskee import Taskee
 
 
 def start(
     t: Taskee,
     interval_minutes: float = 5.0,
+    scheduler: AdaptiveScheduler | None = None,
+    timings: bool = False,
 ) -> None:
     """Run an indefinite logger. This handles scheduling of Earth Engine updates and
-    logs events as they occur.
+    logs events as they occur. If a scheduler is provided, it chooses the interval
+    after each update. If `timings` is True, a breakdown of the time spent in each
+    phase of the update is logged after each update.
     """
     logger.setLevel("INFO")
 
@@ -42,6 +41,10 @@ def start(
                 t.dispatch()
 
                 last_checked = now
+                if scheduler is not None:
+                    interval_seconds = scheduler.next_interval(
+                        t.active_tasks, new_events
+                    )
 
             for event in new_events:
                 message = event.message
@@ -56,6 +59,9 @@ def start(
                     f" {muted_style}{message}"
                 )
 
+            if timings:
+                logger.info(f"[dim]{t.stats[-1]}[/]")
+
         else:
             delta = datetime.timedelta(seconds=interval_seconds - elapsed)
             next_update = datetime.datetime.now() + delta
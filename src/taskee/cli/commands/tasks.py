@@ -1,21 +1,157 @@
 from __future__ import annotations
 
+import csv
+import json
+import sys
+from collections.abc import Hashable, Iterable
+from typing import IO, Any
+
 import humanize  # type: ignore
 import rich
 from rich import box
 from rich.table import Table
 
+from taskee.cli.rows import RowCache
 from taskee.cli.styles import get_style
 from taskee.operation import ACTIVE_OPERATION_STATES, Operation
 
 
-def tasks(tasks: tuple[Operation, ...], max_tasks: int) -> None:
-    table = create_task_table(tasks, max_tasks)
+class TaskRows(RowCache[Operation]):
+    """Formatted task table rows, reused until a task's state or update time changes."""
+
+    def __init__(self, show_project: bool = False):
+        super().__init__()
+        self.show_project = show_project
+
+    def _get_key(self, task: Operation) -> Hashable:
+        return (task.name, task.metadata.updateTime, task.metadata.state)
+
+    def _format(self, task: Operation) -> tuple[str, ...]:
+        state = task.metadata.state.value
+        eecus = task.metadata.batchEecuUsageSeconds
+
+        state_style = get_style(state)
+        dim_style = _get_dim_style(task)
+        runtime = humanize.naturaldelta(task.runtime) if task.runtime else "-"
+        eecus_str = "-" if not eecus else f"{eecus:,.0f}"
+
+        return (
+            f"[{state_style.color}]{state}[/] {state_style.emoji}",
+            f"{dim_style}{task.metadata.description}",
+            *([f"{dim_style}{task.project}"] if self.show_project else []),
+            f"{dim_style}{runtime}",
+            f"{dim_style}{eecus_str}",
+        )
+
+    def _format_time(self, task: Operation, now: float) -> str:
+        time_since_creation = now - task.metadata.createTime.timestamp()
+        return f"{_get_dim_style(task)}{humanize.naturaltime(time_since_creation)}"
+
+    def _join(self, cells: tuple[str, ...], relative: str) -> tuple[str, ...]:
+        # The creation time goes before the runtime and EECU columns
+        return (*cells[:-2], relative, *cells[-2:])
+
+
+def tasks(
+    tasks: tuple[Operation, ...], max_tasks: int, show_project: bool = False
+) -> None:
+    table = create_task_table(tasks, max_tasks, show_project=show_project)
     rich.print(table)
 
 
-def create_task_table(tasks: tuple[Operation, ...], max_tasks: int) -> Table:
-    """Create and print a table of tasks."""
+RECORD_FIELDS = (
+    "name",
+    "project",
+    "state",
+    "type",
+    "description",
+    "created",
+    "started",
+    "updated",
+    "ended",
+    "runtime_seconds",
+    "attempt",
+    "progress",
+    "eecu_seconds",
+    "error",
+)
+
+
+def stream_tasks(
+    tasks: Iterable[Operation], output_format: str, file: IO[str] | None = None
+) -> None:
+    """Write one record per task as tasks arrive, without building a table.
+
+    Parameters
+    ----------
+    tasks : Iterable[Operation]
+        The tasks to write. Each task is written and discarded before the next one is
+        requested, so lazy iterables are streamed with constant memory.
+    output_format : str
+        One of "json" (a JSON array), "ndjson" (one JSON object per line), or "csv".
+    file : IO[str], optional
+        The stream to write to. Defaults to stdout.
+    """
+    file = file if file is not None else sys.stdout
+
+    if output_format == "csv":
+        writer = csv.DictWriter(file, fieldnames=RECORD_FIELDS)
+        writer.writeheader()
+        for task in tasks:
+            writer.writerow(get_task_record(task))
+        return
+
+    if output_format == "ndjson":
+        for task in tasks:
+            file.write(json.dumps(get_task_record(task)) + "\n")
+        return
+
+    if output_format == "json":
+        separator = "\n"
+        file.write("[")
+        for task in tasks:
+            file.write(separator + json.dumps(get_task_record(task)))
+            separator = ",\n"
+        file.write("\n]\n")
+        return
+
+    raise ValueError(f"Unknown output format `{output_format}`.")
+
+
+def get_task_record(task: Operation) -> dict[str, Any]:
+    """Return a flat, JSON-serializable record of a task."""
+    metadata = task.metadata
+    started = metadata.startTime if task.runtime else None
+
+    return {
+        "name": task.name,
+        "project": task.project,
+        "state": metadata.state.value,
+        "type": metadata.type.value,
+        "description": metadata.description,
+        "created": metadata.createTime.isoformat(),
+        "started": started.isoformat() if started else None,
+        "updated": metadata.updateTime.isoformat(),
+        "ended": metadata.endTime.isoformat() if metadata.endTime else None,
+        "runtime_seconds": task.runtime,
+        "attempt": metadata.attempt,
+        "progress": metadata.progress,
+        "eecu_seconds": metadata.batchEecuUsageSeconds,
+        "error": task.error.message if task.error else None,
+    }
+
+
+def create_task_table(
+    tasks: tuple[Operation, ...],
+    max_tasks: int,
+    show_project: bool = False,
+    rows: TaskRows | None = None,
+) -> Table:
+    """Create and print a table of tasks.
+
+    Pass the same `rows` cache between calls to reuse the formatting of unchanged
+    tasks when the table is redrawn.
+    """
     t = Table(
         title="[bold bright_green]Earth Engine Tasks",
         box=box.SIMPLE_HEAD,
@@ -25,29 +161,22 @@ def create_task_table(tasks: tuple[Operation, ...], max_tasks: int) -> Table:
 
     t.add_column("State", justify="right")
     t.add_column("Description", justify="left")
+    if show_project:
+        t.add_column("Project", justify="left")
     t.add_column("Created", justify="right")
     t.add_column("Runtime", justify="right")
     t.add_column("EECUs", justify="right")
 
-    for task in tasks[:max_tasks]:
-        state = task.metadata.state.value
-        eecus = task.metadata.batchEecuUsageSeconds
-
-        state_style = get_style(state)
-        dim_style = "[dim]" if state not in ACTIVE_OPERATION_STATES else ""
-        time_since_creation = humanize.naturaltime(task.time_since_creation)
-        runtime = humanize.naturaldelta(task.runtime) if task.runtime else "-"
-        eecus_str = "-" if not eecus else f"{eecus:,.0f}"
-
-        t.add_row(
-            f"[{state_style.color}]{state}[/] {state_style.emoji}",
-            f"{dim_style}{task.metadata.description}",
-            f"{dim_style}{time_since_creation}",
-            f"{dim_style}{runtime}",
-            f"{dim_style}{eecus_str}",
-        )
+    rows = rows if rows is not None else TaskRows(show_project=show_project)
+    for row in rows.get_rows(tasks[:max_tasks]):
+        t.add_row(*row)
 
     if len(tasks) > max_tasks:
         t.caption = "..."
 
     return t
+
+
+def _get_dim_style(task: Operation) -> str:
+    """Return the markup used to dim inactive tasks."""
+    return "[dim]" if task.metadata.state not in ACTIVE_OPERATION_STATES else ""
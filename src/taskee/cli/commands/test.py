@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from taskee.cli.commands import log
+from taskee.cli.logger import logger
 from taskee.notifiers.notifier import Notifier
 
 
 def test(notifiers: tuple[Notifier, ...]) -> None:
-    log.logger.setLevel("INFO")
+    logger.setLevel("INFO")
 
     for notifier in notifiers:
         notifier.send(
@@ -13,4 +13,4 @@ def test(notifiers: tuple[Notifier, ...]) -> None:
             message="If you receive this notification, taskee is working!",
         )
 
-        log.logger.info(f"Notification sent to {notifier.__class__.__name__}!")
+        logger.info(f"Notification sent to {notifier.__class__.__name__}!")
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+import queue
+import sys
+import threading
+from typing import IO, Any
+
+try:
+    import termios
+    import tty
+except ImportError:  # pragma: no cover
+    # Keyboard input is only supported on POSIX terminals
+    termios = None  # type: ignore
+    tty = None  # type: ignore
+
+# Escape sequences and characters mapped to key names
+KEYS = {
+    "\x1b[A": "up",
+    "\x1b[B": "down",
+    "\x1b[5~": "page_up",
+    "\x1b[6~": "page_down",
+    "\x1b[H": "home",
+    "\x1b[1~": "home",
+    "\x1b[F": "end",
+    "\x1b[4~": "end",
+    "k": "up",
+    "j": "down",
+    "b": "page_up",
+    " ": "page_down",
+    "g": "home",
+    "G": "end",
+}
+
+
+class KeyReader:
+    """Read key presses from an interactive terminal on a background thread.
+
+    The terminal is put into cbreak mode while the reader is open, so keys are read
+    as they're pressed without being echoed. If the stream isn't an interactive
+    terminal, the reader is inactive and never returns any keys.
+    """
+
+    def __init__(self, stream: IO[Any] | None = None):
+        """
+        Parameters
+        ----------
+        stream : IO, optional
+            The terminal stream to read from. Defaults to stdin.
+        """
+        self.stream = stream if stream is not None else sys.stdin
+        self.active = False
+        self._keys: queue.Queue[str] = queue.Queue()
+        self._attrs: list[Any] | None = None
+
+    def __enter__(self) -> KeyReader:
+        if termios is None or not self.stream.isatty():
+            return self
+
+        fd = self.stream.fileno()
+        self._attrs = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        threading.Thread(
+            target=self._read, args=(fd,), name="taskee-keys", daemon=True
+        ).start()
+        self.active = True
+
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        if self._attrs is not None:
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._attrs)
+        self.active = False
+
+    def get_keys(self, timeout: float) -> list[str]:
+        """Wait up to `timeout` seconds for a key press and return all pending keys."""
+        try:
+            keys = [self._keys.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+
+        while True:
+            try:
+                keys.append(self._keys.get_nowait())
+            except queue.Empty:
+                return keys
+
+    def _read(self, fd: int) -> None:
+        """Read and decode key presses until the process exits."""
+        while True:
+            try:
+                data = os.read(fd, 32).decode(errors="ignore")
+            except OSError:
+                return
+            for key in parse_keys(data):
+                self._keys.put(key)
+
+
+def parse_keys(data: str) -> list[str]:
+    """Decode raw terminal input into key names, ignoring unrecognized input."""
+    keys = []
+    i = 0
+    while i < len(data):
+        for length in (4, 3, 1):
+            if (key := KEYS.get(data[i : i + length])) is not None:
+                keys.append(key)
+                i += length
+                break
+        else:
+            i += 1
+
+    return keys
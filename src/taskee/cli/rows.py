@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class RowCache(ABC, Generic[T]):
+    """Formatted table rows that are reused until the item they show changes.
+
+    Static cells are cached by item key. Relative-time cells are recomputed at most
+    once per second, from a single clock reading shared by every row. Only rows from
+    the most recent call are kept, so the cache never grows beyond one table.
+    """
+
+    def __init__(self) -> None:
+        self._cells: dict[Hashable, tuple[str, ...]] = {}
+        self._times: dict[Hashable, str] = {}
+        self._second: int | None = None
+
+    def get_rows(self, items: Iterable[T]) -> list[tuple[str, ...]]:
+        """Return the formatted rows for a sequence of items."""
+        now = time.time()
+        if int(now) != self._second:
+            self._second = int(now)
+            self._times = {}
+
+        cells = {}
+        times = {}
+        rows = []
+        for item in items:
+            key = self._get_key(item)
+            if (static := self._cells.get(key)) is None:
+                static = self._format(item)
+            if (relative := self._times.get(key)) is None:
+                relative = self._format_time(item, now)
+
+            cells[key] = static
+            times[key] = relative
+            rows.append(self._join(static, relative))
+
+        self._cells = cells
+        self._times = times
+
+        return rows
+
+    @abstractmethod
+    def _get_key(self, item: T) -> Hashable:
+        """Return a key that changes whenever the static cells of an item change."""
+
+    @abstractmethod
+    def _format(self, item: T) -> tuple[str, ...]:
+        """Format the static cells of an item."""
+
+    @abstractmethod
+    def _format_time(self, item: T, now: float) -> str:
+        """Format the relative-time cell of an item at a given epoch time."""
+
+    @abstractmethod
+    def _join(self, cells: tuple[str, ...], relative: str) -> tuple[str, ...]:
+        """Combine the static and relative-time cells into a row."""
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -113,6 +114,42 @@ class StartedEvent(_TaskEvent):
         return f"Task '{self.task.metadata.description}' has started processing."
 
 
+@dataclass(repr=False)
+class DigestEvent(_Event):
+    """A Digest event summarizes a burst of task events in a single notification."""
+
+    title = "Task Digest"
+    max_top_tasks = 3
+
+    events: tuple[_TaskEvent, ...]
+    active_tasks: int
+
+    @property
+    def message(self) -> str:
+        counts = Counter(
+            event.__class__.__name__.replace("Event", "").lower()
+            for event in self.events
+        )
+        summary = ", ".join(f"{n} {name}" for name, n in counts.most_common())
+        message = f"{len(self.events)} task events ({summary})."
+
+        tasks = {event.task.name: event.task for event in self.events}.values()
+        top_tasks = sorted(
+            (task for task in tasks if task.metadata.batchEecuUsageSeconds),
+            key=lambda task: task.metadata.batchEecuUsageSeconds or 0.0,
+            reverse=True,
+        )[: self.max_top_tasks]
+        if top_tasks:
+            top = ", ".join(
+                f"'{task.metadata.description}' "
+                f"({task.metadata.batchEecuUsageSeconds:,.0f})"
+                for task in top_tasks
+            )
+            message += f" Top EECU-seconds: {top}."
+
+        return message + f" {self.active_tasks} tasks remaining."
+
+
 class EventEnum(Enum, metaclass=SuggestionEnumMeta):
     ERROR = ErrorEvent
     FAILED = FailedEvent
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import functools
+from collections.abc import Iterator, Mapping
+from datetime import datetime
+from typing import Any
+
+import ee
+from pydantic import TypeAdapter
+
+PAGE_SIZE = 500
+
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+
+def iter_operations(
+    project: str | None = None,
+    *,
+    since: datetime | None = None,
+    credentials: Any = None,
+) -> Iterator[dict[str, Any]]:
+    """Lazily yield raw operation payloads from Earth Engine, one page at a time.
+
+    This mirrors ee.data.listOperations(), but pages are only requested as they are
+    consumed. Operations are listed newest first, so once a page ends with an operation
+    created before the `since` watermark, no further pages are requested.
+
+    Parameters
+    ----------
+    project : str, optional
+        The project path to list operations for, e.g. "projects/my-project". If not
+        provided, the project that Earth Engine was initialized with will be used.
+    since : datetime, optional
+        A timezone-aware watermark. Paging stops after the first page that reaches
+        operations created before this time. Operations on that final page are still
+        yielded, so callers that need a strict bound must filter them.
+    credentials : Any, optional
+        Credentials to list operations with. If not provided, the credentials that Earth
+        Engine was initialized with will be used.
+    """
+    if project is None:
+        project = ee.data._get_projects_path()
+
+    # ee.data.listOperations materializes every page, so we drive the paged Cloud API
+    # request ourselves to be able to stop early.
+    if credentials is None:
+        projects = ee.data._get_cloud_projects()
+    else:
+        projects = _get_cloud_projects(credentials)
+
+    operations = projects.operations()
+    request = operations.list(pageSize=PAGE_SIZE, name=project)
+
+    while request is not None:
+        response = ee.data._execute_cloud_call(request)
+        page = response.get("operations", [])
+        yield from page
+
+        if since is not None and page and get_create_time(page[-1]) < since:
+            return
+
+        request = operations.list_next(request, response)
+
+
+def get_create_time(payload: Mapping[str, Any]) -> datetime:
+    """Parse the creation time of a raw operation payload without validating it."""
+    return _DATETIME_ADAPTER.validate_python(payload["metadata"]["createTime"])
+
+
+@functools.cache
+def _get_cloud_projects(credentials: Any) -> Any:
+    """Build and cache a Cloud API projects resource authorized with credentials.
+
+    Earth Engine only holds one set of credentials globally, so monitoring several
+    accounts at once requires a separate resource for each.
+    """
+    if credentials == "persistent":
+        credentials = ee.data.get_persistent_credentials()
+
+    state = ee.data._get_state()
+    if state.cloud_api_base_url is None or state.requests_session is None:
+        raise ee.EEException(
+            "Earth Engine must be initialized before listing operations with other "
+            "credentials."
+        )
+
+    resource = ee._cloud_api_utils.build_cloud_resource(
+        state.cloud_api_base_url,
+        state.requests_session,
+        credentials=credentials,
+        num_retries=state.max_retries,
+    )
+    return resource.projects()
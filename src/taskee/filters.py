@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import fnmatch
+import re
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+
+class TaskFilter:
+    """Select operations by their raw listOperations payloads.
+
+    Filters are checked against the raw payload dictionaries, so operations that don't
+    match are skipped before they are parsed, compared, or stored. An operation must
+    match every criterion that is set.
+    """
+
+    def __init__(
+        self,
+        types: Sequence[str] = (),
+        states: Sequence[str] = (),
+        description: str | None = None,
+        script_uri: str | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        types : Sequence[str]
+            Operation types to include, e.g. "EXPORT_IMAGE". All types are included
+            if empty.
+        states : Sequence[str]
+            Current operation states to include, e.g. "RUNNING". All states are
+            included if empty. States change while tasks are monitored, so registries
+            only apply them to one-off listings, not updates.
+        description : str, optional
+            A case-sensitive glob pattern that task descriptions must match, e.g.
+            "nightly_*".
+        script_uri : str, optional
+            A case-sensitive glob pattern that the URI of the script that started the
+            task must match.
+        """
+        self.types = frozenset(t.upper() for t in types)
+        self.states = frozenset(s.upper() for s in states)
+        self.description = description
+        self.script_uri = script_uri
+        self._description = _compile_glob(description)
+        self._script_uri = _compile_glob(script_uri)
+
+    def __repr__(self) -> str:
+        return (
+            f"TaskFilter(types={sorted(self.types)}, states={sorted(self.states)}, "
+            f"description={self.description!r}, script_uri={self.script_uri!r})"
+        )
+
+    def without_states(self) -> TaskFilter:
+        """Return a copy of the filter that includes operations in any state."""
+        return TaskFilter(
+            types=tuple(self.types),
+            description=self.description,
+            script_uri=self.script_uri,
+        )
+
+    def matches_state(self, state: str) -> bool:
+        """Return whether an operation state matches the filter."""
+        return not self.states or state in self.states
+
+    def matches(self, payload: Mapping[str, Any]) -> bool:
+        """Return whether a raw operation payload matches the filter."""
+        metadata = payload.get("metadata", {})
+
+        if self.types and metadata.get("type") not in self.types:
+            return False
+        if not self.matches_state(metadata.get("state")):
+            return False
+        if self._description is not None and not self._description.match(
+            metadata.get("description", "")
+        ):
+            return False
+
+        return self._script_uri is None or bool(
+            self._script_uri.match(metadata.get("scriptUri") or "")
+        )
+
+
+def _compile_glob(pattern: str | None) -> re.Pattern[str] | None:
+    """Compile a glob pattern into a regular expression."""
+    return re.compile(fnmatch.translate(pattern)) if pattern is not None else None
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from taskee import events
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    time REAL NOT NULL,
+    event TEXT NOT NULL,
+    task_name TEXT,
+    project TEXT,
+    description TEXT,
+    task_type TEXT,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_time ON events (time);
+CREATE INDEX IF NOT EXISTS events_task_name ON events (task_name, time);
+CREATE INDEX IF NOT EXISTS events_event ON events (event, time);
+CREATE INDEX IF NOT EXISTS events_task_type ON events (task_type, time);
+"""
+
+
+@dataclass
+class HistoryRecord:
+    """An event stored in the event history."""
+
+    time: datetime
+    event: str
+    task_name: str | None
+    project: str | None
+    description: str | None
+    task_type: str | None
+    message: str
+
+
+class EventHistory:
+    """An append-only SQLite store of events, indexed by time, task, and event type."""
+
+    def __init__(self, path: str, read_only: bool = False):
+        """
+        Parameters
+        ----------
+        path : str
+            The path to the SQLite database. Unless read-only, it will be created
+            along with its directory if it doesn't exist.
+        read_only : bool
+            If True, open an existing database for queries without modifying it.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        if read_only:
+            uri = f"{Path(path).absolute().as_uri()}?mode=ro"
+            self._connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            return
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def add(self, new_events: Iterable[events._Event]) -> None:
+        """Append events to the history in a single transaction."""
+        rows = [_to_row(event) for event in new_events]
+        if not rows:
+            return
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO events (time, event, task_name, project, description, "
+                "task_type, message) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def query(
+        self,
+        *,
+        event_types: Sequence[str] = (),
+        task_types: Sequence[str] = (),
+        task_name: str | None = None,
+        description: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[HistoryRecord]:
+        """Return matching events, newest first.
+
+        Parameters
+        ----------
+        event_types : Sequence[str]
+            Event names to match, e.g. "FAILED". All events match if empty.
+        task_types : Sequence[str]
+            Operation types to match, e.g. "EXPORT_IMAGE". All types match if empty.
+        task_name : str, optional
+            The operation name to match.
+        description : str, optional
+            A glob pattern to match task descriptions against, e.g. "nightly_*".
+        since : datetime, optional
+            Only match events at or after this time.
+        until : datetime, optional
+            Only match events before this time.
+        limit : int, optional
+            The maximum number of events to return.
+        """
+        clauses = []
+        params: list[str | float | int] = []
+
+        if event_types:
+            clauses.append(f"event IN ({', '.join('?' * len(event_types))})")
+            params.extend(name.upper() for name in event_types)
+        if task_types:
+            clauses.append(f"task_type IN ({', '.join('?' * len(task_types))})")
+            params.extend(name.upper() for name in task_types)
+        if task_name is not None:
+            clauses.append("task_name = ?")
+            params.append(task_name)
+        if description is not None:
+            clauses.append("description GLOB ?")
+            params.append(description)
+        if since is not None:
+            clauses.append("time >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            clauses.append("time < ?")
+            params.append(until.timestamp())
+
+        sql = (
+            "SELECT time, event, task_name, project, description, task_type, message "
+            "FROM events"
+        )
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY time DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+
+        return [HistoryRecord(datetime.fromtimestamp(row[0]), *row[1:]) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+
+def _to_row(event: events._Event) -> tuple:
+    """Convert an event to a database row."""
+    name = events.EventEnum(event.__class__).name
+    task = getattr(event, "task", None)
+    if task is None:
+        return (event.time.timestamp(), name, None, None, None, None, event.message)
+
+    return (
+        event.time.timestamp(),
+        name,
+        task.name,
+        task.project,
+        task.metadata.description,
+        task.metadata.type.value,
+        event.message,
+    )
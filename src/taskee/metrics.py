@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from taskee import events
+from taskee.operation import Operation, OperationState
+
+# The upper bounds in seconds of the poll duration histogram buckets
+POLL_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Metrics:
+    """Prometheus metrics for a running task monitor.
+
+    Metrics are updated incrementally from the tasks that changed in each update and
+    the notifications sent, so rendering them for a scrape only costs as much as the
+    number of distinct label values, regardless of the number of tasks.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tasks: Counter[tuple[str, str]] = Counter()
+        self._running_eecu_seconds = 0.0
+        self._events: Counter[str] = Counter()
+        self._send_seconds: defaultdict[str, float] = defaultdict(float)
+        self._sends: Counter[str] = Counter()
+        self._notifications: Counter[str] = Counter()
+        self._send_failures: Counter[str] = Counter()
+        self._poll_buckets = [0] * (len(POLL_BUCKETS) + 1)
+        self._poll_seconds = 0.0
+
+    def observe_update(
+        self,
+        removed: Iterable[Operation],
+        added: Iterable[Operation],
+        new_events: Iterable[events._Event],
+        seconds: float,
+    ) -> None:
+        """Record the changes from one update.
+
+        Parameters
+        ----------
+        removed : Iterable[Operation]
+            Operations that are no longer tracked, including the previous versions of
+            changed operations.
+        added : Iterable[Operation]
+            Operations that are newly tracked, including the new versions of changed
+            operations.
+        new_events : Iterable[_Event]
+            Events found in the update.
+        seconds : float
+            The duration of the update.
+        """
+        with self._lock:
+            for op in removed:
+                self._count_task(op, -1)
+            for op in added:
+                self._count_task(op, 1)
+            self._events.update(_get_event_name(event) for event in new_events)
+            self._poll_buckets[bisect.bisect_left(POLL_BUCKETS, seconds)] += 1
+            self._poll_seconds += seconds
+
+    def observe_send(
+        self, notifier: str, seconds: float, failed: bool, notifications: int = 1
+    ) -> None:
+        """Record the latency and outcome of one batch sent by a notifier.
+
+        Parameters
+        ----------
+        notifier : str
+            The name of the notifier.
+        seconds : float
+            The duration of the send.
+        failed : bool
+            Whether the send raised an error.
+        notifications : int
+            The number of notifications in the batch.
+        """
+        with self._lock:
+            self._sends[notifier] += 1
+            self._notifications[notifier] += notifications
+            self._send_seconds[notifier] += seconds
+            if failed:
+                self._send_failures[notifier] += 1
+
+    def render(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            lines = [
+                *_header("taskee_tasks", "gauge", "Tracked tasks by state and type."),
+                *(
+                    f'taskee_tasks{{state="{state}",type="{type_}"}} {count}'
+                    for (state, type_), count in sorted(self._tasks.items())
+                ),
+                *_header(
+                    "taskee_running_eecu_seconds",
+                    "gauge",
+                    "EECU-seconds used so far by running tasks.",
+                ),
+                f"taskee_running_eecu_seconds {self._running_eecu_seconds}",
+                *_header("taskee_events_total", "counter", "Events found by type."),
+                *(
+                    f'taskee_events_total{{event="{event}"}} {count}'
+                    for event, count in sorted(self._events.items())
+                ),
+                *_header(
+                    "taskee_notifier_send_seconds",
+                    "summary",
+                    "Time spent sending batches of notifications by notifier.",
+                ),
+                *(
+                    line
+                    for notifier, sends in sorted(self._sends.items())
+                    for line in (
+                        f'taskee_notifier_send_seconds_sum{{notifier="{notifier}"}} '
+                        f"{self._send_seconds[notifier]}",
+                        f'taskee_notifier_send_seconds_count{{notifier="{notifier}"}} '
+                        f"{sends}",
+                    )
+                ),
+                *_header(
+                    "taskee_notifier_notifications_total",
+                    "counter",
+                    "Notifications sent by notifier, including failed sends.",
+                ),
+                *(
+                    f'taskee_notifier_notifications_total{{notifier="{notifier}"}} '
+                    f"{count}"
+                    for notifier, count in sorted(self._notifications.items())
+                ),
+                *_header(
+                    "taskee_notifier_failures_total",
+                    "counter",
+                    "Failed batch sends by notifier.",
+                ),
+                *(
+                    f'taskee_notifier_failures_total{{notifier="{notifier}"}} {count}'
+                    for notifier, count in sorted(self._send_failures.items())
+                ),
+                *_header(
+                    "taskee_poll_duration_seconds",
+                    "histogram",
+                    "Time spent updating tasks.",
+                ),
+                *self._render_poll_histogram(),
+            ]
+
+        return "\n".join(lines) + "\n"
+
+    def _count_task(self, op: Operation, sign: int) -> None:
+        """Add or remove an operation from the task counts."""
+        key = (op.metadata.state.value, op.metadata.type.value)
+        self._tasks[key] += sign
+        if op.metadata.state == OperationState.RUNNING:
+            eecu_seconds = op.metadata.batchEecuUsageSeconds or 0.0
+            self._running_eecu_seconds += sign * eecu_seconds
+
+    def _render_poll_histogram(self) -> list[str]:
+        """Return the cumulative buckets, sum, and count of the poll histogram."""
+        lines = []
+        count = 0
+        for bound, n in zip((*POLL_BUCKETS, "+Inf"), self._poll_buckets):
+            count += n
+            lines.append(f'taskee_poll_duration_seconds_bucket{{le="{bound}"}} {count}')
+
+        return [
+            *lines,
+            f"taskee_poll_duration_seconds_sum {self._poll_seconds}",
+            f"taskee_poll_duration_seconds_count {count}",
+        ]
+
+
+def start_metrics_server(
+    metrics: Metrics, port: int, host: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """Serve metrics at /metrics on a background thread and return the server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_: Any) -> None:
+            """Don't log every scrape."""
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="taskee-metrics", daemon=True
+    ).start()
+
+    return server
+
+
+def _header(name: str, metric_type: str, description: str) -> tuple[str, str]:
+    """Return the HELP and TYPE lines that describe a metric."""
+    return f"# HELP {name} {description}", f"# TYPE {name} {metric_type}"
+
+
+def _get_event_name(event: events._Event) -> str:
+    """Return the name of an event type, e.g. "completed"."""
+    return event.__class__.__name__.removesuffix("Event").lower()
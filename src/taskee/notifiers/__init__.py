@@ -4,8 +4,11 @@ from enum import Enum
 
 from taskee.utils import SuggestionEnumMeta
 
+from .limited import RateLimited
+from .measured import Measured
 from .native import Native
 from .pushbullet import Pushbullet
+from .queued import Queued
 
 
 class NotifierEnum(Enum, metaclass=SuggestionEnumMeta):
@@ -13,4 +16,11 @@ class NotifierEnum(Enum, metaclass=SuggestionEnumMeta):
     PUSHBULLET = Pushbullet
 
 
-__all__ = ["Native", "Pushbullet", "NotifierEnum"]
+__all__ = [
+    "Measured",
+    "Native",
+    "Pushbullet",
+    "Queued",
+    "RateLimited",
+    "NotifierEnum",
+]
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Sequence
+from typing import Callable
+
+from taskee.notifiers.notifier import Notifier
+
+
+class TokenBucket:
+    """A token bucket that allows bursts of up to `burst` and refills continuously."""
+
+    def __init__(
+        self,
+        burst: int,
+        refill_per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Parameters
+        ----------
+        burst : int
+            The maximum number of tokens, which is the largest burst allowed.
+        refill_per_second : float
+            The number of tokens added per second.
+        clock : Callable[[], float]
+            A monotonic clock returning seconds.
+        """
+        if burst < 1 or refill_per_second <= 0:
+            raise ValueError("Burst must be at least 1 and refill rate must be > 0.")
+
+        self.burst = burst
+        self.refill_per_second = refill_per_second
+        self._clock = clock
+        self._tokens = float(burst)
+        self._last_refill = clock()
+
+    @property
+    def tokens(self) -> float:
+        """Return the number of tokens currently available."""
+        return self._get_tokens(self._clock())
+
+    def take(self, n: int = 1) -> bool:
+        """Remove `n` tokens and return True if they're available, else return False."""
+        now = self._clock()
+        if (tokens := self._get_tokens(now)) < n:
+            return False
+
+        self._tokens = tokens - n
+        self._last_refill = now
+        return True
+
+    def get_wait(self, n: int = 1) -> float:
+        """Return the seconds until `n` tokens are available."""
+        return max(n - self.tokens, 0.0) / self.refill_per_second
+
+    def _get_tokens(self, now: float) -> float:
+        """Return the number of tokens available at a given time."""
+        elapsed = now - self._last_refill
+        return min(self.burst, self._tokens + elapsed * self.refill_per_second)
+
+
+class RateLimited(Notifier):
+    """A notifier that limits the rate of another notifier's sends with a token bucket.
+
+    Each notification sent takes one token. When there aren't enough tokens for a
+    burst, notifications are deferred until tokens refill rather than dropped. If more
+    notifications are pending than there are tokens, the excess are summarized into a
+    single notification, so the backlog clears as soon as a token is available.
+    """
+
+    # The maximum number of messages listed in a summary notification
+    MAX_SUMMARY_MESSAGES = 10
+
+    def __init__(self, notifier: Notifier, burst: int, refill_per_second: float):
+        """
+        Parameters
+        ----------
+        notifier : Notifier
+            The notifier used to send notifications.
+        burst : int
+            The maximum number of notifications sent at once.
+        refill_per_second : float
+            The sustained number of notifications allowed per second.
+        """
+        self.notifier = notifier
+        self.bucket = TokenBucket(burst, refill_per_second)
+        self.name = _get_name(notifier)
+        self._pending: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def __repr__(self) -> str:
+        return f"<RateLimited {self.name}>"
+
+    @property
+    def pending(self) -> int:
+        """Return the number of notifications deferred until tokens refill."""
+        return len(self._pending)
+
+    def send(self, title: str, message: str) -> None:
+        self.send_batch(((title, message),))
+
+    def send_batch(self, notifications: Sequence[tuple[str, str]]) -> None:
+        with self._lock:
+            self._pending.extend(notifications)
+            batch = self._release()
+
+        # Send outside the lock so a slow notifier doesn't block other senders
+        if batch:
+            self.notifier.send_batch(batch)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Send any deferred notifications as one summary and wait for the notifier.
+
+        Deferred notifications are sent regardless of the rate limit, since they'd
+        otherwise be lost when the process exits.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._pending = self._pending, []
+
+        if pending:
+            self.notifier.send(*self._summarize(pending))
+        return self.notifier.flush(timeout)
+
+    def _release(self) -> list[tuple[str, str]]:
+        """Return as many pending notifications as tokens allow, and defer the rest.
+
+        Tokens for the returned batch are taken immediately, so the caller must send
+        it. This must be called while holding the lock.
+        """
+        batch: list[tuple[str, str]] = []
+        available = int(self.bucket.tokens)
+        if available and self._pending:
+            if len(self._pending) <= available:
+                batch = self._pending
+            else:
+                # Keep the last token for a summary of notifications that don't fit
+                batch = [
+                    *self._pending[: available - 1],
+                    self._summarize(self._pending[available - 1 :]),
+                ]
+            self._pending = []
+            self.bucket.take(len(batch))
+
+        if self._pending and self._timer is None:
+            self._timer = threading.Timer(self.bucket.get_wait(), self._on_refill)
+            self._timer.daemon = True
+            self._timer.start()
+
+        return batch
+
+    def _on_refill(self) -> None:
+        """Send deferred notifications once tokens have refilled."""
+        with self._lock:
+            self._timer = None
+            batch = self._release()
+
+        if batch:
+            self.notifier.send_batch(batch)
+
+    def _summarize(self, notifications: Sequence[tuple[str, str]]) -> tuple[str, str]:
+        """Return a single notification summarizing several notifications."""
+        if len(notifications) == 1:
+            return notifications[0]
+
+        listed = notifications[: self.MAX_SUMMARY_MESSAGES]
+        message = "\n".join(message for _, message in listed)
+        if remaining := len(notifications) - len(listed):
+            message += f"\n...and {remaining} more."
+
+        return f"{len(notifications)} notifications (rate limited)", message
+
+
+def _get_name(notifier: Notifier) -> str:
+    """Return the name of the innermost notifier, e.g. "pushbullet"."""
+    while (inner := getattr(notifier, "notifier", None)) is not None:
+        notifier = inner
+    return notifier.__class__.__name__.lower()
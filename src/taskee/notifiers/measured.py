@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from taskee.notifiers.notifier import Notifier
+
+if TYPE_CHECKING:
+    from taskee.metrics import Metrics
+
+
+class Measured(Notifier):
+    """A notifier that records the latency and failures of another notifier's sends.
+
+    Latency and failures are recorded once per batch, since queued notifiers merge
+    bursts of notifications into a single send. The number of notifications is
+    counted separately.
+
+    Wrap a notifier before queueing it so that the time spent actually sending is
+    measured, rather than the time spent queueing.
+    """
+
+    def __init__(self, notifier: Notifier, metrics: Metrics):
+        """
+        Parameters
+        ----------
+        notifier : Notifier
+            The notifier used to send notifications.
+        metrics : Metrics
+            The metrics to record sends to.
+        """
+        self.notifier = notifier
+        self.metrics = metrics
+        self.name = notifier.__class__.__name__.lower()
+
+    def __repr__(self) -> str:
+        return f"<Measured {self.notifier.__class__.__name__}>"
+
+    def send(self, title: str, message: str) -> None:
+        self.send_batch(((title, message),))
+
+    def send_batch(self, notifications: Sequence[tuple[str, str]]) -> None:
+        start = time.perf_counter()
+        failed = True
+        try:
+            self.notifier.send_batch(notifications)
+            failed = False
+        finally:
+            self.metrics.observe_send(
+                self.name, time.perf_counter() - start, failed, len(notifications)
+            )
+
+    def flush(self, timeout: float | None = None) -> bool:
+        return self.notifier.flush(timeout)
@@ -1,17 +1,97 @@
-import os
+from __future__ import annotations
 
-import notifypy  # type: ignore
+import os
+import sys
+import threading
+from collections.abc import Sequence
+from typing import Any
 
 from taskee.notifiers.notifier import Notifier
 
+ICON_PATH = os.path.join(os.path.dirname(__file__), "icons", "taskee.png")
+
 
 class Native(Notifier):
+    def __init__(self) -> None:
+        import notifypy  # type: ignore
+
+        # The notification and D-Bus connection are reused, so concurrent sends, e.g.
+        # from `send_async`, are serialized
+        self._lock = threading.Lock()
+        self._dbus = _DBusNotifications.connect()
+
+        self._notification = notifypy.Notify()
+        self._notification.application_name = "taskee"
+        self._notification.icon = ICON_PATH
+
     def send(self, title: str, message: str) -> None:
-        notification = notifypy.Notify()
-        notification.application_name = "taskee"
-        notification.icon = os.path.join(
-            os.path.dirname(__file__), "icons", "taskee.png"
+        with self._lock:
+            if self._dbus is not None:
+                try:
+                    self._dbus.notify(title, message)
+                    return
+                # Fall back to notifypy for good if the session bus goes away
+                except Exception:
+                    self._dbus = None
+
+            self._notification.title = title
+            self._notification.message = message
+            self._notification.send()
+
+    def send_batch(self, notifications: Sequence[tuple[str, str]]) -> None:
+        """Send notifications, collapsing those with identical titles into one."""
+        messages: dict[str, list[str]] = {}
+        for title, message in notifications:
+            messages.setdefault(title, []).append(message)
+
+        collapsed = []
+        for title, grouped in messages.items():
+            if len(grouped) > 1:
+                title = f"{title} ({len(grouped)})"
+            collapsed.append((title, "\n".join(grouped)))
+
+        super().send_batch(collapsed)
+
+
+class _DBusNotifications:
+    """A persistent connection to the freedesktop notification service on Linux.
+
+    notifypy runs `notify-send` in a new process for each notification, so sending
+    over one long-lived D-Bus connection is much cheaper when it's available.
+    """
+
+    def __init__(self, connection: Any):
+        from jeepney import DBusAddress  # type: ignore
+
+        self._connection = connection
+        self._address = DBusAddress(
+            "/org/freedesktop/Notifications",
+            bus_name="org.freedesktop.Notifications",
+            interface="org.freedesktop.Notifications",
+        )
+
+    @classmethod
+    def connect(cls) -> _DBusNotifications | None:
+        """Connect to the session bus, or return None if it isn't available."""
+        if not sys.platform.startswith("linux"):
+            return None
+        if not os.environ.get("DBUS_SESSION_BUS_ADDRESS"):
+            return None
+
+        try:
+            from jeepney.io.blocking import open_dbus_connection  # type: ignore
+
+            return cls(open_dbus_connection(bus="SESSION"))
+        except Exception:
+            return None
+
+    def notify(self, title: str, message: str) -> None:
+        from jeepney import new_method_call
+
+        request = new_method_call(
+            self._address,
+            "Notify",
+            "susssasa{sv}i",
+            ("taskee", 0, ICON_PATH, title, message, [], {}, -1),
         )
-        notification.title = title
-        notification.message = message
-        notification.send()
+        self._connection.send_and_get_reply(request, timeout=5)
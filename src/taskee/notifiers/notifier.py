@@ -1,7 +1,43 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 
 class Notifier(ABC):
     @abstractmethod
     def send(self, title: str, message: str) -> None:
         raise NotImplementedError  # pragma: no cover
+
+    def send_batch(self, notifications: Sequence[tuple[str, str]]) -> None:
+        """Send a burst of (title, message) notifications.
+
+        By default, each notification is sent individually. A failed send doesn't stop
+        the rest of the burst from sending, and the first error is raised once every
+        notification was attempted. Notifiers that can combine notifications can
+        override this.
+        """
+        error: Exception | None = None
+        for title, message in notifications:
+            try:
+                self.send(title, message)
+            except Exception as e:
+                error = error or e
+
+        if error is not None:
+            raise error
+
+    async def send_async(self, title: str, message: str) -> None:
+        """Send a notification without blocking the event loop.
+
+        By default, the blocking `send` runs in a worker thread. Notifiers with a
+        native asynchronous client can override this.
+        """
+        # asyncio is already loaded if there's an event loop, so don't import it early
+        import asyncio
+
+        await asyncio.to_thread(self.send, title, message)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for any pending notifications and return whether they all finished."""
+        return True
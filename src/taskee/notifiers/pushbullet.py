@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import configparser
-from typing import TYPE_CHECKING
+import random
+import threading
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
 
-from requests.exceptions import ConnectionError
 from rich.prompt import Prompt
 
 from taskee.notifiers.notifier import Notifier
@@ -11,14 +15,79 @@ from taskee.utils import CONFIG_PATH
 
 if TYPE_CHECKING:
     import pushbullet  # type: ignore
+    from requests import PreparedRequest, Response, Session
 
 
 class Pushbullet(Notifier):
+    POOL_SIZE = 4
+    MAX_RETRIES = 4
+    BACKOFF_SECONDS = 1.0
+    MAX_BACKOFF_SECONDS = 60.0
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    # Connect and read timeouts in seconds, so a stalled connection is retried
+    TIMEOUT = (5.0, 30.0)
+
     def __init__(self) -> None:
         self.pb = initialize_pushbullet()
+        # Responses are recorded by the thread that sent the request, so concurrent
+        # sends each check their own status before retrying
+        self._local = threading.local()
+        self._ratelimit_reset: float | None = None
+        _configure_session(self.pb._session, self.POOL_SIZE, self.TIMEOUT)
+        self.pb._session.hooks["response"].append(self._record_response)
 
     def send(self, title: str, message: str) -> None:
-        self.pb.push_note(title, message)
+        """Push a note, retrying transient failures with jittered exponential backoff.
+
+        If Pushbullet reports that the rate limit is exhausted, sending waits for the
+        limit to reset (up to MAX_BACKOFF_SECONDS) before pushing.
+        """
+        from pushbullet.errors import PushError  # type: ignore
+        from requests.exceptions import ConnectionError, Timeout
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            self._wait_for_ratelimit()
+            self._local.status = None
+            try:
+                self.pb.push_note(title, message)
+                return
+            except (ConnectionError, Timeout):
+                if attempt == self.MAX_RETRIES:
+                    raise
+            except PushError:
+                if (
+                    attempt == self.MAX_RETRIES
+                    or self._local.status not in self.RETRY_STATUSES
+                ):
+                    raise
+
+            time.sleep(self._get_backoff(attempt))
+
+    def _get_backoff(self, attempt: int) -> float:
+        """Return a randomized delay in seconds before retrying a failed attempt."""
+        cap = min(self.MAX_BACKOFF_SECONDS, self.BACKOFF_SECONDS * 2**attempt)
+        return random.uniform(0, cap)
+
+    def _wait_for_ratelimit(self) -> None:
+        """Sleep until the rate limit resets, if it has been exhausted."""
+        if self._ratelimit_reset is None:
+            return
+
+        # The reset is left in place for concurrent sends, since it's in the past once
+        # it has been waited for
+        delay = self._ratelimit_reset - time.time()
+        if delay > 0:
+            time.sleep(min(delay, self.MAX_BACKOFF_SECONDS))
+
+    def _record_response(self, response: Response, *args: Any, **kwargs: Any) -> None:
+        """Record the status and rate limit headers from a Pushbullet response."""
+        self._local.status = response.status_code
+        headers = response.headers
+
+        if retry_after := headers.get("Retry-After"):
+            self._ratelimit_reset = _parse_retry_after(retry_after)
+        elif headers.get("X-Ratelimit-Remaining") == "0":
+            self._ratelimit_reset = _parse_float(headers.get("X-Ratelimit-Reset"))
 
 
 def initialize_pushbullet() -> pushbullet.Pushbullet:
@@ -30,6 +99,7 @@ def initialize_pushbullet() -> pushbullet.Pushbullet:
             "The `pushbullet` package must be installed to use the Pushbullet notifier."
             " Run `pip install pushbullet.py` to install."
         ) from None
+    from requests.exceptions import ConnectionError
 
     api_key = _get_stored_pushbullet_key(CONFIG_PATH)
 
@@ -53,6 +123,70 @@ def initialize_pushbullet() -> pushbullet.Pushbullet:
     return pb
 
 
+def _parse_retry_after(value: str) -> float | None:
+    """Return the timestamp from a Retry-After header in seconds or as an HTTP-date.
+
+    Unparseable values return None, so a malformed header never fails a send.
+    """
+    if (seconds := _parse_float(value)) is not None:
+        return time.time() + seconds
+
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_float(value: str | None) -> float | None:
+    """Return a header value as a float, or None if it's missing or invalid."""
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _configure_session(
+    session: Session, pool_size: int, default_timeout: tuple[float, float]
+) -> None:
+    """Configure a keep-alive session with a bounded pool that retries connections.
+
+    Only connection errors are retried at the transport level, since retrying a POST
+    that reached the server could send a duplicate push. Requests without their own
+    timeout use the default `(connect, read)` timeout.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class TimeoutAdapter(HTTPAdapter):
+        def send(
+            self,
+            request: PreparedRequest,
+            stream: bool = False,
+            timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+            verify: bool | str = True,
+            cert: Any = None,
+            proxies: Mapping[str, str] | None = None,
+        ) -> Response:
+            return super().send(
+                request,
+                stream=stream,
+                timeout=timeout if timeout is not None else default_timeout,
+                verify=verify,
+                cert=cert,
+                proxies=proxies,
+            )
+
+    retry = Retry(
+        total=None,
+        connect=3,
+        read=0,
+        status=0,
+        backoff_factor=0.5,
+    )
+    adapter = TimeoutAdapter(pool_maxsize=pool_size, pool_block=True, max_retries=retry)
+    session.mount("https://", adapter)
+
+
 def _get_stored_pushbullet_key(path: str) -> str:
     """Get the stored Pushbullet API key from a config file, if it exists. If the file,
     section, or key don't exist, return None.
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Sequence
+
+from taskee.notifiers.notifier import Notifier
+
+logger = logging.getLogger(__name__)
+
+
+class Queued(Notifier):
+    """A notifier that sends through another notifier on background worker threads.
+
+    Each queued notifier has its own queue and workers, so sending returns immediately
+    and a stalled notifier can't hold up other notifiers or the next update.
+    """
+
+    def __init__(self, notifier: Notifier, workers: int = 1, timeout: float = 30.0):
+        """
+        Parameters
+        ----------
+        notifier : Notifier
+            The notifier used to send queued notifications.
+        workers : int
+            The number of worker threads sending notifications.
+        timeout : float
+            The default number of seconds to wait for pending notifications when
+            flushing.
+        """
+        self.notifier = notifier
+        self.timeout = timeout
+        self._queue: queue.Queue[Sequence[tuple[str, str]]] = queue.Queue()
+
+        for i in range(workers):
+            threading.Thread(
+                target=self._work,
+                name=f"taskee-{notifier.__class__.__name__}-{i}",
+                daemon=True,
+            ).start()
+
+    def __repr__(self) -> str:
+        return f"<Queued {self.notifier.__class__.__name__}>"
+
+    def send(self, title: str, message: str) -> None:
+        self._queue.put(((title, message),))
+
+    def send_batch(self, notifications: Sequence[tuple[str, str]]) -> None:
+        self._queue.put(tuple(notifications))
+
+    async def send_async(self, title: str, message: str) -> None:
+        self.send(title, message)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for queued notifications to send and return whether they all finished.
+
+        Notifications still sending after the timeout are abandoned when the process
+        exits.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+
+        return True
+
+    def _work(self) -> None:
+        """Send queued notifications until the process exits.
+
+        Any notifications that queue up while a worker is busy are sent together as
+        one batch.
+        """
+        while True:
+            batches = [self._queue.get()]
+            while True:
+                try:
+                    batches.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            notifications = [n for batch in batches for n in batch]
+            try:
+                self.notifier.send_batch(notifications)
+            except Exception:
+                logger.exception(
+                    f"{self.notifier.__class__.__name__} failed to send "
+                    f"{len(notifications)} notification(s)."
+                )
+            finally:
+                for _ in batches:
+                    self._queue.task_done()
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Hashable, Iterator, Sequence
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Union
+
+import ee
+from google.oauth2.credentials import Credentials as OAuthCredentials
+from google.oauth2.service_account import Credentials as ServiceAccountCredentials
+
+from taskee import events, fetch
+from taskee.filters import TaskFilter
+from taskee.operation import Operation, OperationState, get_fingerprint
+from taskee.stats import CycleStats
+
+Credentials = Union[OAuthCredentials, ServiceAccountCredentials, str]
+
+
+@dataclass
+class Profile:
+    """Credentials and a Cloud project to monitor Earth Engine tasks for.
+
+    If the project is not provided, the default Earth Engine project will be used.
+    """
+
+    credentials: Credentials = "persistent"
+    project: str | None = None
+
+    @property
+    def project_path(self) -> str | None:
+        """Return the project path used to list operations, e.g. projects/my-project."""
+        return f"projects/{self.project}" if self.project else None
+
+
+class TaskRegistry:
+    """A name-keyed registry of the tasks in one Earth Engine project."""
+
+    def __init__(
+        self,
+        profile: Profile,
+        credentials: Any = None,
+        task_filter: TaskFilter | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        profile : Profile
+            The profile to retrieve tasks for.
+        credentials : Any, optional
+            Credentials used to list operations. If not provided, the credentials that
+            Earth Engine was initialized with will be used.
+        task_filter : TaskFilter, optional
+            If provided, only operations matching the filter are tracked. Others are
+            skipped before they are parsed. Filters with states can only be used to
+            list tasks with `iter_tasks`.
+        """
+        self.profile = profile
+        self.credentials = credentials
+        self.task_filter = task_filter
+        self.operations: dict[str, Operation] = {}
+        self.tasks: tuple[Operation, ...] = tuple()
+        self.changed = False
+        self.stats = CycleStats()
+        # Operations that were added and removed by the last update. Changed operations
+        # are in both, with their previous versions removed.
+        self.added: tuple[Operation, ...] = tuple()
+        self.removed: tuple[Operation, ...] = tuple()
+        self._fingerprints: dict[str, Hashable] = {}
+        self._last_fetch: datetime | None = None
+        self._snapshot: dict[str, Any] | None = None
+
+    @property
+    def project_path(self) -> str | None:
+        """Return the project path to list operations for.
+
+        Registries with their own credentials fall back to the project associated with
+        the credentials, e.g. from a service account key.
+        """
+        if self.profile.project_path or self.credentials is None:
+            return self.profile.project_path
+
+        project = getattr(self.credentials, "project_id", None)
+        return f"projects/{project}" if project else None
+
+    def update(self, max_age: timedelta | None = None) -> tuple[events._Event, ...]:
+        """Update all tasks and return any events that occured since the last update.
+
+        Operations whose payload fingerprint is unchanged since the last update are
+        reused as-is rather than being parsed and validated again. The first update
+        only returns events if a snapshot was restored, in which case events are
+        compared against the last known state from the snapshot.
+
+        Durations and counts of each phase of the update are stored in `stats`.
+        """
+        if self.task_filter is not None and self.task_filter.states:
+            # Tasks would stop being tracked, and their events lost, when they change
+            # state, and untracked active tasks would be missed by the watermark
+            raise ValueError(
+                "Tasks can't be tracked by state, since their states change between "
+                "updates. Filter the tracked tasks by state instead."
+            )
+
+        stats = CycleStats()
+        fetch_time = datetime.now(tz=timezone.utc)
+        cutoff = fetch_time - max_age if max_age is not None else None
+        watermark = self._get_watermark(cutoff)
+
+        new_events = []
+        operations = {}
+        fingerprints = {}
+        changed_ops = []
+        has_history = self._last_fetch is not None or self._snapshot is not None
+
+        payloads = stats.timed_iter(
+            fetch.iter_operations(
+                self.project_path, since=watermark, credentials=self.credentials
+            ),
+            "request",
+        )
+        loop_start = time.perf_counter()
+        for payload in payloads:
+            stats.fetched += 1
+            if cutoff is not None and fetch.get_create_time(payload) < cutoff:
+                continue
+            if self.task_filter is not None and not self.task_filter.matches(payload):
+                continue
+
+            name = payload["name"]
+            fingerprint = get_fingerprint(payload)
+            if name in self.operations and self._fingerprints.get(name) == fingerprint:
+                operations[name] = self.operations[name]
+            else:
+                with stats.timed("parse"):
+                    changed_ops.append(Operation(**payload))
+            fingerprints[name] = fingerprint
+        # Waiting for Earth Engine pages and parsing are timed separately from
+        # comparing payloads
+        stats.add(
+            "diff",
+            time.perf_counter()
+            - loop_start
+            - stats.durations["request"]
+            - stats.durations["parse"],
+        )
+
+        removed = []
+        with stats.timed("diff"):
+            for op in changed_ops:
+                prev_op = self.operations.get(op.name)
+                if prev_op is not None:
+                    removed.append(prev_op)
+                if prev_op is None and self._snapshot is not None:
+                    prev_op = self._restore(op, self._snapshot)
+                if has_history and (event := op.get_event(prev=prev_op)):
+                    new_events.append(event)
+                operations[op.name] = op
+
+            # Finished tasks beyond the watermark can't change, so carry them over
+            # until they age past the cutoff
+            if watermark is not None:
+                for name, op in self.operations.items():
+                    if (
+                        name not in operations
+                        and op.metadata.createTime < watermark
+                        and (cutoff is None or op.metadata.createTime >= cutoff)
+                    ):
+                        operations[name] = op
+                        fingerprints[name] = self._fingerprints[name]
+
+        changed = bool(changed_ops)
+        if changed or operations.keys() != self.operations.keys():
+            removed.extend(
+                op for name, op in self.operations.items() if name not in operations
+            )
+            with stats.timed("sort"):
+                self.tasks = tuple(sorted(operations.values()))
+
+        self.operations = operations
+        self.changed = changed
+        stats.changed = len(changed_ops)
+        stats.events = len(new_events)
+        self.stats = stats
+        self.added = tuple(changed_ops)
+        self.removed = tuple(removed)
+        self._fingerprints = fingerprints
+        self._last_fetch = fetch_time
+        self._snapshot = None
+
+        return tuple(new_events)
+
+    def iter_tasks(self, max_age: timedelta | None = None) -> Iterator[Operation]:
+        """Yield tasks as they are fetched, newest first, without storing them.
+
+        Unlike `update`, this doesn't sort tasks, compare them to previous states, or
+        keep them in the registry, so memory use doesn't grow with the task count.
+        """
+        cutoff = datetime.now(tz=timezone.utc) - max_age if max_age else None
+
+        for payload in fetch.iter_operations(
+            self.project_path, since=cutoff, credentials=self.credentials
+        ):
+            if cutoff is not None and fetch.get_create_time(payload) < cutoff:
+                continue
+            if self.task_filter is None or self.task_filter.matches(payload):
+                yield Operation(**payload)
+
+    def get_snapshot(self) -> dict[str, Any]:
+        """Return a compact, JSON-serializable snapshot of the last task states."""
+        return {
+            "last_fetch": self._last_fetch.timestamp() if self._last_fetch else 0.0,
+            "tasks": {
+                name: [op.metadata.state.value, op.metadata.attempt]
+                for name, op in self.operations.items()
+            },
+        }
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        """Restore the last known task states from a snapshot before the first update.
+
+        The next update will return events for any tasks that changed since the
+        snapshot was taken.
+        """
+        self._snapshot = snapshot
+
+    @staticmethod
+    def _restore(op: Operation, snapshot: dict[str, Any]) -> Operation | None:
+        """Return the last known state of an operation from the restored snapshot.
+
+        Operations missing from the snapshot that were created before it was taken
+        are treated as unchanged, since nothing is known about their history.
+        """
+        if (known := snapshot["tasks"].get(op.name)) is None:
+            if op.metadata.createTime.timestamp() < snapshot["last_fetch"]:
+                return op
+            return None
+
+        # Only the state and attempt can trigger events. Older snapshots also stored
+        # the update time, which is ignored.
+        state, attempt = known[:2]
+        metadata = replace(op.metadata, state=OperationState(state), attempt=attempt)
+        return op.model_copy(update={"metadata": metadata})
+
+    def _get_watermark(self, cutoff: datetime | None = None) -> datetime | None:
+        """Return the creation time before which no operation can produce an event.
+
+        Any operation created before the last fetch that is not currently active was
+        already finished, so older pages of task history don't need to be fetched.
+        """
+        if self._last_fetch is None:
+            return cutoff
+
+        watermark = min(
+            (task.metadata.createTime for task in self.tasks if not task.done),
+            default=self._last_fetch,
+        )
+        watermark = min(watermark, self._last_fetch)
+
+        return max(watermark, cutoff) if cutoff is not None else watermark
+
+
+def initialize_registries(
+    profiles: Sequence[Profile], task_filter: TaskFilter | None = None
+) -> list[TaskRegistry]:
+    """Initialize Earth Engine with the first profile and return a registry per profile.
+
+    The first registry uses the global Earth Engine credentials, while the others use
+    their own.
+    """
+    ee.Initialize(credentials=profiles[0].credentials, project=profiles[0].project)
+
+    return [TaskRegistry(profiles[0], task_filter=task_filter)] + [
+        TaskRegistry(profile, credentials=profile.credentials, task_filter=task_filter)
+        for profile in profiles[1:]
+    ]
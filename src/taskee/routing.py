@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import fnmatch
+import json
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from taskee import events
+from taskee.notifiers import NotifierEnum
+
+# The maximum number of distinct descriptions to cache routes for per event type
+_MAX_CACHED = 4096
+
+
+@dataclass(frozen=True)
+class Subscription:
+    """A rule that routes events to specific notifiers.
+
+    Parameters
+    ----------
+    events : Sequence[str]
+        Names of event types to route, e.g. "failed". All event types are routed if
+        empty.
+    notifiers : Sequence[str]
+        Names of the notifiers to send matching events to, e.g. "pushbullet".
+    description : str, optional
+        A case-sensitive glob pattern that task descriptions must match, e.g.
+        "landcover_*". Events without a task, like errors, never match a pattern.
+    """
+
+    events: Sequence[str]
+    notifiers: Sequence[str]
+    description: str | None = None
+
+    def __post_init__(self) -> None:
+        if not self.notifiers:
+            raise ValueError("Subscriptions must route to at least one notifier.")
+        # Validate names early to catch typos before anything is routed
+        try:
+            for name in self.events:
+                events.EventEnum[name.upper()]
+            for name in self.notifiers:
+                NotifierEnum[name.upper()]
+        except KeyError as e:
+            raise ValueError(e.args[0]) from None
+
+
+class Router:
+    """Route events to notifiers using many subscriptions at once.
+
+    Subscriptions are compiled into one route per event type. Each route stores the
+    notifiers that receive every event of that type, and combines all description
+    patterns into a single regular expression. Events whose descriptions don't match
+    the combined pattern are routed with one lookup and one regex match, however many
+    subscriptions there are.
+    """
+
+    def __init__(self, subscriptions: Iterable[Subscription]):
+        """
+        Parameters
+        ----------
+        subscriptions : Iterable[Subscription]
+            The subscriptions to route events with.
+        """
+        self.subscriptions = tuple(subscriptions)
+        self.notifiers = frozenset(
+            name.lower() for sub in self.subscriptions for name in sub.notifiers
+        )
+        self._routes = {
+            member.value: self._compile(member.value) for member in events.EventEnum
+        }
+
+    def route(self, event: events._Event) -> frozenset[str]:
+        """Return the names of the notifiers that should receive an event."""
+        event_type = event.__class__
+        if (route := self._routes.get(event_type)) is None:
+            route = self._routes[event_type] = self._compile(event_type)
+
+        task = getattr(event, "task", None)
+        return route.match(task.metadata.description if task is not None else None)
+
+    def _compile(self, event_type: type[events._Event]) -> _Route:
+        """Compile the subscriptions that apply to an event type into one route."""
+        always: set[str] = set()
+        patterns: dict[str, set[str]] = {}
+
+        for sub in self.subscriptions:
+            if sub.events and not any(
+                issubclass(event_type, events.EventEnum[name.upper()].value)
+                for name in sub.events
+            ):
+                continue
+
+            notifiers = {name.lower() for name in sub.notifiers}
+            if sub.description is None:
+                always.update(notifiers)
+            else:
+                patterns.setdefault(sub.description, set()).update(notifiers)
+
+        return _Route(frozenset(always), patterns)
+
+
+class _Route:
+    """The compiled subscriptions for a single event type."""
+
+    def __init__(self, always: frozenset[str], patterns: dict[str, set[str]]):
+        self.always = always
+        self._patterns = [
+            (re.compile(fnmatch.translate(pattern)), frozenset(notifiers))
+            for pattern, notifiers in patterns.items()
+            # Patterns only need to be checked if they can add new notifiers
+            if not notifiers <= always
+        ]
+        self._combined = (
+            re.compile("|".join(p.pattern for p, _ in self._patterns))
+            if self._patterns
+            else None
+        )
+        self._cache: dict[str, frozenset[str]] = {}
+
+    def match(self, description: str | None) -> frozenset[str]:
+        """Return the notifiers for an event with the given task description.
+
+        Routes are cached by description, since many tasks share descriptions.
+        """
+        if self._combined is None or description is None:
+            return self.always
+        if (notifiers := self._cache.get(description)) is not None:
+            return notifiers
+
+        notifiers = self.always
+        # Most descriptions match no pattern, which only takes one regex match
+        if self._combined.match(description):
+            notifiers = notifiers.union(
+                *(n for pattern, n in self._patterns if pattern.match(description))
+            )
+
+        if len(self._cache) >= _MAX_CACHED:
+            self._cache.clear()
+        self._cache[description] = notifiers
+        return notifiers
+
+
+def load_subscriptions(path: str) -> list[Subscription]:
+    """Load subscriptions from a JSON file.
+
+    The file should contain a list of objects with "events", "notifiers", and optional
+    "description" keys matching the Subscription parameters.
+    """
+    with open(path) as src:
+        rules = json.load(src)
+
+    if not isinstance(rules, list):
+        raise ValueError(f"Expected a list of subscriptions in {path}.")
+
+    return [_parse_subscription(rule) for rule in rules]
+
+
+def _parse_subscription(rule: Any) -> Subscription:
+    """Return a subscription from a decoded JSON rule."""
+    if (
+        not isinstance(rule, dict)
+        or not isinstance(rule.get("notifiers"), list)
+        or not isinstance(rule.get("events", []), list)
+    ):
+        raise ValueError(
+            f"Invalid subscription {rule!r}. Subscriptions need a list of notifiers "
+            "and an optional list of events."
+        )
+
+    try:
+        return Subscription(
+            events=tuple(rule.get("events", [])),
+            notifiers=tuple(rule["notifiers"]),
+            description=rule.get("description"),
+        )
+    except ValueError as e:
+        raise ValueError(f"Invalid subscription {rule!r}: {e}") from None
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from taskee import events
+from taskee.operation import Operation, OperationState
+
+
+class AdaptiveScheduler:
+    """Schedule updates based on task activity.
+
+    After each update, the interval until the next update is chosen as follows:
+
+    - The minimum interval if any events occurred or a running task is nearly done.
+    - The base interval while tasks are active, shortened as running tasks progress.
+    - An exponentially increasing interval, up to the maximum, while no tasks are
+      active.
+    """
+
+    NEARLY_FINISHED = 0.9
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        min_seconds: float,
+        max_seconds: float,
+        backoff: float = 2.0,
+    ):
+        """
+        Parameters
+        ----------
+        interval_seconds : float
+            The base interval between updates while tasks are active.
+        min_seconds : float
+            The shortest interval between updates.
+        max_seconds : float
+            The longest interval between updates.
+        backoff : float
+            The factor to multiply the interval by after each idle update.
+        """
+        if not min_seconds <= interval_seconds <= max_seconds:
+            raise ValueError(
+                "The interval must be between the minimum and maximum intervals. "
+                f"Got {interval_seconds} outside of [{min_seconds}, {max_seconds}]."
+            )
+
+        self.interval_seconds = interval_seconds
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self.backoff = backoff
+        self._idle_seconds = interval_seconds
+
+    def next_interval(
+        self,
+        active_tasks: Sequence[Operation],
+        new_events: Sequence[events._Event] = (),
+    ) -> float:
+        """Return the number of seconds until the next update."""
+        if not active_tasks and not new_events:
+            self._idle_seconds = min(
+                self._idle_seconds * self.backoff, self.max_seconds
+            )
+            return self._idle_seconds
+
+        self._idle_seconds = self.interval_seconds
+        if new_events:
+            return self.min_seconds
+
+        progress = max(
+            (
+                task.metadata.progress
+                for task in active_tasks
+                if task.metadata.state == OperationState.RUNNING
+            ),
+            default=0.0,
+        )
+        if progress >= self.NEARLY_FINISHED:
+            return self.min_seconds
+
+        return max(self.interval_seconds * (1.0 - progress), self.min_seconds)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from typing import Any
+
+SNAPSHOT_VERSION = 1
+
+
+def load_snapshot(path: str) -> dict[str, Any]:
+    """Load task registry snapshots keyed by project from a file.
+
+    An empty dictionary is returned if the file doesn't exist or was written by an
+    incompatible version of taskee.
+    """
+    try:
+        with open(path) as src:
+            data = json.load(src)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+    if data.get("version") != SNAPSHOT_VERSION:
+        return {}
+
+    return data["projects"]
+
+
+def save_snapshot(path: str, projects: dict[str, Any]) -> None:
+    """Save task registry snapshots keyed by project to a file.
+
+    The snapshot is written to a temporary file first and then moved into place, so
+    an interrupted write can't corrupt the previous snapshot.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile(
+        "w", dir=directory, suffix=".tmp", delete=False
+    ) as dst:
+        json.dump(
+            {"version": SNAPSHOT_VERSION, "projects": projects},
+            dst,
+            separators=(",", ":"),
+        )
+
+    os.replace(dst.name, path)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Phases of an update and dispatch cycle, in the order they run
+PHASES = ("request", "parse", "diff", "sort", "notify")
+
+
+@dataclass
+class CycleStats:
+    """Timing and counts for one update and dispatch cycle.
+
+    Phase durations are in seconds. When several projects are updated concurrently,
+    their phase durations are summed, so phases can add up to more than `seconds`.
+    """
+
+    time: datetime = field(default_factory=datetime.now)
+    seconds: float = 0.0
+    durations: dict[str, float] = field(
+        default_factory=lambda: dict.fromkeys(PHASES, 0.0)
+    )
+    fetched: int = 0
+    changed: int = 0
+    events: int = 0
+    notifications: int = 0
+
+    def __str__(self) -> str:
+        phases = ", ".join(
+            f"{phase} {seconds:.2f}s" for phase, seconds in self.durations.items()
+        )
+        return (
+            f"Updated in {self.seconds:.2f}s: {phases} ({self.fetched:,} fetched, "
+            f"{self.changed:,} changed, {self.events:,} events, "
+            f"{self.notifications:,} notifications)"
+        )
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time to a phase."""
+        self.durations[phase] += seconds
+
+    def merge(self, other: CycleStats) -> None:
+        """Add the durations and counts of another cycle, e.g. from another project."""
+        for phase, seconds in other.durations.items():
+            self.add(phase, seconds)
+        self.fetched += other.fetched
+        self.changed += other.changed
+        self.events += other.events
+        self.notifications += other.notifications
+
+    @contextmanager
+    def timed(self, phase: str) -> Iterator[None]:
+        """Add the time spent in the context to a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+
+    def timed_iter(self, iterable: Iterable[T], phase: str) -> Iterator[T]:
+        """Yield from an iterable, adding the time spent waiting for items to a phase.
+
+        This separates the time spent producing items lazily, e.g. by paged requests,
+        from the time spent processing them.
+        """
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.add(phase, time.perf_counter() - start)
+            yield item
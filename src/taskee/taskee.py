@@ -1,19 +1,34 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+import time
 from collections import deque
-from datetime import datetime
-from typing import Union
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
-import ee
 import humanize
-from google.oauth2.credentials import Credentials as OAuthCredentials
-from google.oauth2.service_account import Credentials as ServiceAccountCredentials
 
 from taskee import events
-from taskee.notifiers import NotifierEnum
+from taskee.filters import TaskFilter
+from taskee.history import EventHistory
+from taskee.notifiers import Measured, NotifierEnum, Queued, RateLimited
+from taskee.notifiers.notifier import Notifier
 from taskee.operation import FINISHED_OPERATION_STATES, Operation
+from taskee.registry import (
+    Credentials,
+    Profile,
+    TaskRegistry,
+    initialize_registries,
+)
+from taskee.routing import Router, Subscription
+from taskee.snapshot import load_snapshot, save_snapshot
+from taskee.stats import CycleStats
 
-Credentials = Union[OAuthCredentials, ServiceAccountCredentials, str]
+if TYPE_CHECKING:
+    from taskee.metrics import Metrics
 
 
 class Taskee:
@@ -22,11 +37,26 @@ class Taskee:
     The task manager tracks tasks, retrieves events, and dispatches notifications.
     """
 
+    # The number of update and dispatch cycles to keep timing stats for
+    MAX_STATS = 100
+
     def __init__(
         self,
         notifiers: tuple[()] | tuple[str, ...] = ("native",),
         watch_for: tuple[()] | tuple[str, ...] = ("completed", "failed", "error"),
         credentials: Credentials = "persistent",
+        max_age: timedelta | None = None,
+        queued: bool = False,
+        send_timeout: float = 30.0,
+        digest_window: float | None = None,
+        digest_bypass: tuple[()] | tuple[str, ...] = tuple(),
+        profiles: Sequence[Profile] = tuple(),
+        snapshot_path: str | None = None,
+        history_path: str | None = None,
+        task_filter: TaskFilter | None = None,
+        metrics: Metrics | None = None,
+        subscriptions: Sequence[Subscription] = tuple(),
+        rate_limits: Mapping[str, tuple[int, float]] | None = None,
     ):
         """
         Parameters
@@ -39,19 +69,106 @@ class Taskee:
             Credentials for initializing Earth Engine, e.g. from
             ee.ServiceAccountCredentials. If not provided, the default persistent
             credentials will be used.
+        max_age : timedelta, optional
+            If provided, only tasks created within this period will be tracked. Older
+            task history will not be retrieved from Earth Engine.
+        queued : bool
+            If True, each notifier sends from its own queue on a background thread
+            and dispatching returns immediately. Use `flush` to wait for pending
+            notifications before exiting.
+        send_timeout : float
+            The default number of seconds to wait for each queued notifier to finish
+            sending when flushing.
+        digest_window : float, optional
+            If provided, watched task events are buffered and sent as a single digest
+            notification at most once per this many seconds. Error events are always
+            sent immediately.
+        digest_bypass : Tuple[str, ...]
+            Names of event types that are sent immediately instead of being digested.
+        profiles : Sequence[Profile]
+            Credentials and projects to monitor concurrently. Each project keeps its
+            own task registry and events from all projects are merged. If not
+            provided, tasks are monitored with `credentials` in the default project.
+        snapshot_path : str, optional
+            A file to save the task states to after each update. If the file exists at
+            startup, tasks are compared to it and events that occurred since it was
+            saved are added to the event queue.
+        history_path : str, optional
+            A SQLite database to record events to as they occur.
+        task_filter : TaskFilter, optional
+            If provided, only tasks matching the filter are monitored. Filters are
+            applied to the raw Earth Engine responses, so other tasks are never parsed.
+            Filters can't include states, since monitored tasks change state.
+        metrics : Metrics, optional
+            If provided, task counts, events, update durations, and notifier sends are
+            recorded to these metrics as they occur.
+        subscriptions : Sequence[Subscription]
+            Rules that route matching events to specific notifiers, in addition to the
+            events in `watch_for` that are sent to every notifier in `notifiers`.
+            Notifiers named in subscriptions are created if needed, and routed events
+            are always sent immediately rather than digested.
+        rate_limits : Mapping[str, Tuple[int, float]], optional
+            Token bucket rate limits by notifier name, as the maximum burst of
+            notifications and the number of notifications allowed per minute.
+            Notifications beyond the limit are deferred until the bucket refills, and
+            summarized if they don't fit.
         """
-        ee.Initialize(credentials=credentials)
-        self.notifiers = [NotifierEnum[name.upper()].value() for name in notifiers]
+        self.profiles = list(profiles) or [Profile(credentials=credentials)]
+        self.task_filter = task_filter
+        self._registries = initialize_registries(self.profiles, task_filter)
+        self.metrics = metrics
+        self.router = Router(subscriptions) if subscriptions else None
+        self.rate_limits = {
+            name.lower(): limit for name, limit in (rate_limits or {}).items()
+        }
+        # Notifiers are shared by name between `notifiers` and subscriptions
+        names = dict.fromkeys(name.lower() for name in notifiers)
+        routed_names = self.router.notifiers if self.router is not None else set()
+        named = {
+            name: self._create_notifier(name, queued, send_timeout)
+            for name in {**names, **dict.fromkeys(sorted(routed_names))}
+        }
+        self.notifiers = [named[name] for name in names]
+        self._routed_notifiers = {name: named[name] for name in routed_names}
         self.watch_for = [events.EventEnum[name.upper()].value for name in watch_for]
-        self.tasks: tuple[Operation, ...] = tuple()
+        self.max_age = max_age
+        self.digest_window = digest_window
+        self.digest_bypass = [
+            events.EventEnum[name.upper()].value for name in digest_bypass
+        ]
+        self._tasks: tuple[Operation, ...] = tuple()
+        self._active_tasks: tuple[Operation, ...] = tuple()
         self.event_queue: deque[events._Event] = deque()
+        self.stats: deque[CycleStats] = deque(maxlen=self.MAX_STATS)
         self.last_update = datetime.fromtimestamp(0)
-        self._get_events()
+        self._digest: list[events._TaskEvent] = []
+        self._last_digest = float("-inf")
+
+        self.history = EventHistory(history_path) if history_path else None
+        self.snapshot_path = snapshot_path
+        if snapshot_path is not None:
+            snapshot = load_snapshot(snapshot_path)
+            for registry in self._registries:
+                if known := snapshot.get(self._get_snapshot_key(registry)):
+                    registry.restore(known)
+
+        # Only events that occurred since a restored snapshot are returned initially
+        self.update()
+
+    @property
+    def tasks(self) -> tuple[Operation, ...]:
+        """Return all tasks, sorted with active and recent tasks first."""
+        return self._tasks
 
     @property
     def active_tasks(self) -> tuple[Operation, ...]:
         """Return all active tasks."""
-        return tuple(filter(lambda task: not task.done, self.tasks))
+        return self._active_tasks
+
+    @property
+    def all_notifiers(self) -> list[Notifier]:
+        """Return every notifier, including those only used by subscriptions."""
+        return list(dict.fromkeys([*self.notifiers, *self._routed_notifiers.values()]))
 
     def __repr__(self) -> str:
         time_since_update = datetime.now() - self.last_update
@@ -65,38 +182,205 @@ class Taskee:
         )
 
     def update(self) -> tuple[events._Event, ...]:
-        """Update tasks and add any events to the queue."""
+        """Update tasks and add any events to the queue.
+
+        Each update starts a new cycle in `stats`, which records how long each phase
+        took along with the number of tasks fetched and changed and events found.
+        """
+        start = time.perf_counter()
         new_events = self._get_events()
         self.event_queue.extend(new_events)
+        if self.history is not None:
+            self.history.add(new_events)
+        self.stats[-1].seconds += time.perf_counter() - start
+
+        if self.metrics is not None:
+            self.metrics.observe_update(
+                removed=(op for r in self._registries for op in r.removed),
+                added=(op for r in self._registries for op in r.added),
+                new_events=new_events,
+                seconds=self.stats[-1].seconds,
+            )
         return new_events
 
+    async def update_async(self) -> tuple[events._Event, ...]:
+        """Update tasks and add any events to the queue without blocking the loop.
+
+        Earth Engine requests are blocking, so the update runs in a worker thread.
+        """
+        return await asyncio.to_thread(self.update)
+
     def dispatch(self) -> None:
-        """Dispatch all events in the event queue to notifiers."""
+        """Dispatch all events in the event queue to notifiers.
+
+        Sending time is added to the last cycle in `stats`. Queued notifiers return
+        once notifications are queued, so their sending time isn't included.
+        """
+        start = time.perf_counter()
+        cycle = self._get_cycle()
+        if routed := self._get_notifications():
+            with cycle.timed("notify"):
+                for notifier, notifications in routed.items():
+                    notifier.send_batch(notifications)
+            cycle.notifications += sum(map(len, routed.values()))
+        cycle.seconds += time.perf_counter() - start
+
+    async def dispatch_async(self) -> None:
+        """Dispatch all events in the event queue to notifiers concurrently."""
+        start = time.perf_counter()
+        cycle = self._get_cycle()
+        routed = self._get_notifications()
+        with cycle.timed("notify"):
+            await asyncio.gather(
+                *(
+                    notifier.send_async(title, message)
+                    for notifier, notifications in routed.items()
+                    for title, message in notifications
+                )
+            )
+        cycle.notifications += sum(map(len, routed.values()))
+        cycle.seconds += time.perf_counter() - start
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for notifiers to finish sending and return whether they all finished.
+
+        Any events buffered for a digest are sent immediately.
+        """
+        if self._digest:
+            title, message = self._get_digest_notification()
+            for notifier in self.notifiers:
+                notifier.send(title, message)
+
+        return all([notifier.flush(timeout) for notifier in self.all_notifiers])
+
+    def _get_cycle(self) -> CycleStats:
+        """Return the stats of the current cycle, starting one if needed."""
+        if not self.stats:
+            self.stats.append(CycleStats())
+        return self.stats[-1]
+
+    def _get_notifications(self) -> dict[Notifier, list[tuple[str, str]]]:
+        """Empty the event queue and return the notifications to send by notifier.
+
+        Watched events are sent to every notifier, and events that match subscriptions
+        are sent to the notifiers they route to. Each notifier gets an event at most
+        once. In digest mode, watched task events are buffered and summarized in one
+        notification once the digest window has passed since the last digest.
+        """
+        routed: dict[Notifier, list[tuple[str, str]]] = {}
+        watch_for = tuple(self.watch_for)
+        digest_bypass = tuple(self.digest_bypass)
+
         while self.event_queue:
             event = self.event_queue.popleft()
-            if not isinstance(event, tuple(self.watch_for)):
-                continue
+            targets: list[Notifier] = []
 
-            message = event.message
-            state = event.task.metadata.state if hasattr(event, "task") else None
-            if state in FINISHED_OPERATION_STATES:
-                message += f" ({len(self.active_tasks)} tasks remaining)"
+            watched = isinstance(event, watch_for)
+            if watched and (
+                self.digest_window is not None
+                and isinstance(event, events._TaskEvent)
+                and not isinstance(event, digest_bypass)
+            ):
+                self._digest.append(event)
+            elif watched:
+                targets.extend(self.notifiers)
 
+            if self.router is not None:
+                for name in self.router.route(event):
+                    notifier = self._routed_notifiers[name]
+                    if not watched or notifier not in self.notifiers:
+                        targets.append(notifier)
+
+            if targets:
+                notification = self._get_notification(event)
+                for notifier in targets:
+                    routed.setdefault(notifier, []).append(notification)
+
+        if self._digest and time.monotonic() - self._last_digest >= (
+            self.digest_window or 0.0
+        ):
+            notification = self._get_digest_notification()
             for notifier in self.notifiers:
-                notifier.send(event.title, message)
+                routed.setdefault(notifier, []).append(notification)
 
-    def _get_events(self) -> tuple[events._Event, ...]:
-        """Update all tasks and return any events that occured since the last update."""
-        ops = tuple(Operation(**op) for op in ee.data.listOperations())
-        events = []
+        return routed
+
+    def _create_notifier(self, name: str, queued: bool, timeout: float) -> Notifier:
+        """Create a notifier by name, wrapped to record metrics and queue if needed."""
+        notifier: Notifier = NotifierEnum[name.upper()].value()
+        if self.metrics is not None:
+            notifier = Measured(notifier, self.metrics)
+        if queued:
+            notifier = Queued(notifier, timeout=timeout)
+        if (limit := self.rate_limits.get(name)) is not None:
+            burst, per_minute = limit
+            notifier = RateLimited(notifier, burst, per_minute / 60.0)
+        return notifier
+
+    def _get_notification(self, event: events._Event) -> tuple[str, str]:
+        """Return the title and message of an event notification."""
+        message = event.message
+        state = event.task.metadata.state if hasattr(event, "task") else None
+        if state in FINISHED_OPERATION_STATES:
+            message += f" ({len(self.active_tasks)} tasks remaining)"
 
-        for op in ops:
-            prev_op = self.tasks[self.tasks.index(op)] if op in self.tasks else None
+        return event.title, message
 
-            if event := op.get_event(prev=prev_op):
-                events.append(event)
+    def _get_digest_notification(self) -> tuple[str, str]:
+        """Empty the digest buffer and return the title and message summarizing it."""
+        digest, self._digest = self._digest, []
+        self._last_digest = time.monotonic()
 
-        self.tasks = tuple(sorted(ops))
+        # A lone event is clearer on its own than as a summary
+        if len(digest) == 1:
+            return self._get_notification(digest[0])
+
+        event = events.DigestEvent(
+            events=tuple(digest), active_tasks=len(self.active_tasks)
+        )
+        return event.title, event.message
+
+    def _get_events(self) -> tuple[events._Event, ...]:
+        """Update all tasks and return any events that occured since the last update.
+
+        Projects are updated concurrently and their tasks and events are merged.
+        """
+        cycle = CycleStats()
+        if len(self._registries) == 1:
+            new_events = self._registries[0].update(self.max_age)
+            self._tasks = self._registries[0].tasks
+        else:
+            with ThreadPoolExecutor(max_workers=len(self._registries)) as executor:
+                results = executor.map(
+                    lambda registry: registry.update(self.max_age), self._registries
+                )
+                new_events = tuple(event for result in results for event in result)
+
+            with cycle.timed("sort"):
+                self._tasks = tuple(
+                    heapq.merge(*(registry.tasks for registry in self._registries))
+                )
+        for registry in self._registries:
+            cycle.merge(registry.stats)
+        self.stats.append(cycle)
+        # Active tasks are counted for every notification, so find them once per update
+        self._active_tasks = tuple(task for task in self._tasks if not task.done)
         self.last_update = datetime.now()
 
-        return tuple(events)
+        if self.snapshot_path is not None and any(
+            registry.changed for registry in self._registries
+        ):
+            save_snapshot(
+                self.snapshot_path,
+                {
+                    self._get_snapshot_key(registry): registry.get_snapshot()
+                    for registry in self._registries
+                },
+            )
+
+        return new_events
+
+    @staticmethod
+    def _get_snapshot_key(registry: TaskRegistry) -> str:
+        """Return the key that identifies a registry in the snapshot."""
+        return registry.project_path or "default"
@@ -4,6 +4,7 @@ from enum import EnumMeta
 from typing import Any, Callable
 
 CONFIG_PATH = os.path.expanduser("~/.config/taskee.ini")
+HISTORY_PATH = os.path.expanduser("~/.config/taskee-history.db")
 
 
 class SuggestionEnumMeta(EnumMeta):
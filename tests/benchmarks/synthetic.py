@@ -0,0 +1,135 @@
+"""A synthetic Earth Engine account for benchmarking at scale."""
+
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from taskee.fetch import PAGE_SIZE, get_create_time
+
+from ..mock_operation import MockOperation
+
+# The share of finished tasks in each final state
+FINISHED_WEIGHTS = {"SUCCEEDED": 0.9, "FAILED": 0.07, "CANCELLED": 0.03}
+
+
+class SyntheticAccount:
+    """Generate listOperations payloads for an account with many tasks.
+
+    Payloads are built from MockOperation templates, so they have the same shape as
+    real JSON responses. Most tasks are finished, with a small share of recent active
+    tasks that progress between polls.
+    """
+
+    def __init__(self, n: int, active_fraction: float = 0.01, seed: int = 0):
+        self._random = random.Random(seed)
+        self._templates = {
+            state: MockOperation(state=state, description="template").model_dump(
+                mode="json"
+            )
+            for state in ("PENDING", "RUNNING", *FINISHED_WEIGHTS)
+        }
+        self._now = datetime.now(tz=timezone.utc)
+        self._count = 0
+
+        n_active = int(n * active_fraction)
+        finished_states = self._random.choices(
+            list(FINISHED_WEIGHTS), list(FINISHED_WEIGHTS.values()), k=n - n_active
+        )
+        active_states = self._random.choices(["PENDING", "RUNNING"], k=n_active)
+        # Payloads are listed newest first, and active tasks are the newest
+        self.payloads = [
+            self._make_payload(state, age_minutes=i)
+            for i, state in enumerate(active_states + finished_states)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    def churn(self, new_tasks: int = 10) -> None:
+        """Progress active tasks and create new ones, as between two polls."""
+        for i, payload in enumerate(self.payloads):
+            state = payload["metadata"]["state"]
+            if state == "PENDING":
+                self.payloads[i] = self._update(payload, "RUNNING")
+            elif state == "RUNNING" and self._random.random() < 0.5:
+                final = self._random.choices(
+                    list(FINISHED_WEIGHTS), list(FINISHED_WEIGHTS.values())
+                )[0]
+                self.payloads[i] = self._update(payload, final)
+
+        self._now += timedelta(minutes=1)
+        self.payloads[:0] = [
+            self._make_payload("PENDING", age_minutes=0) for _ in range(new_tasks)
+        ]
+
+    def iter_operations(
+        self, project: str | None = None, *, since: datetime | None = None, **_: Any
+    ) -> Iterator[dict[str, Any]]:
+        """A stand-in for taskee.fetch.iter_operations that pages like the real one."""
+        for start in range(0, len(self.payloads), PAGE_SIZE):
+            page = self.payloads[start : start + PAGE_SIZE]
+            yield from page
+            if since is not None and get_create_time(page[-1]) < since:
+                return
+
+    def _make_payload(self, state: str, age_minutes: float) -> dict[str, Any]:
+        template = self._templates[state]
+        created = self._now - timedelta(minutes=age_minutes)
+        self._count += 1
+
+        return {
+            **template,
+            "name": f"projects/synthetic/operations/{self._count:024d}",
+            "metadata": {
+                **template["metadata"],
+                "description": f"export_{self._count % 500}",
+                "createTime": created.isoformat(),
+                "startTime": (created + timedelta(seconds=30)).isoformat(),
+                "updateTime": (created + timedelta(minutes=5)).isoformat(),
+            },
+        }
+
+    def _update(self, payload: dict[str, Any], state: str) -> dict[str, Any]:
+        template = self._templates[state]
+        metadata = {
+            **template["metadata"],
+            **{
+                key: payload["metadata"][key]
+                for key in ("description", "createTime", "startTime")
+            },
+            "updateTime": self._now.isoformat(),
+        }
+        return {**template, "name": payload["name"], "metadata": metadata}
+
+
+def measure(
+    setup: Callable[[], Any], func: Callable[[Any], Any]
+) -> tuple[float, float]:
+    """Return the seconds and peak MiB allocated to run `func` on a fresh `setup()`.
+
+    Time and memory are measured in separate runs, so tracing overhead doesn't
+    inflate the timing.
+    """
+    state = setup()
+    start = time.perf_counter()
+    func(state)
+    seconds = time.perf_counter() - start
+
+    state = setup()
+    tracemalloc.start()
+    func(state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return seconds, peak / 2**20
+
+
+def report(name: str, n: int, seconds: float, peak_mib: float) -> None:
+    """Print a benchmark result."""
+    ms = seconds * 1000
+    print(f"\n{name:<28} {n:>8,} tasks  {ms:>9.1f}ms  {peak_mib:>7.1f} MiB peak")
@@ -0,0 +1,63 @@
+"""Benchmarks for routing events with many subscriptions.
+
+Run with `pytest tests/benchmarks -m benchmark -s` to print the timings.
+"""
+
+import fnmatch
+import time
+
+import pytest
+
+from taskee.events import FailedEvent
+from taskee.routing import Router, Subscription
+
+from ..mock_operation import MockOperation
+
+
+def _route_naively(subscriptions, event) -> set[str]:
+    """Route an event by checking every subscription in turn."""
+    description = event.task.metadata.description
+    return {
+        name
+        for sub in subscriptions
+        if "failed" in sub.events
+        and (
+            sub.description is None or fnmatch.fnmatchcase(description, sub.description)
+        )
+        for name in sub.notifiers
+    }
+
+
+@pytest.mark.benchmark()
+@pytest.mark.parametrize("n_rules", [10, 100, 1_000])
+def test_benchmark_routing(n_rules):
+    """Compiled routing should grow much slower than checking every subscription."""
+    subscriptions = [
+        Subscription(
+            events=["failed"],
+            notifiers=[("native", "pushbullet")[i % 2]],
+            description=f"project_{i}_*",
+        )
+        for i in range(n_rules)
+    ]
+    router = Router(subscriptions)
+    # Most events match no rule, and a few match one
+    events = [
+        FailedEvent(task=MockOperation(state="FAILED", description=description))
+        for description in [f"export_{i}" for i in range(990)]
+        + [f"project_{i}_x" for i in range(10)]
+    ]
+
+    start = time.perf_counter()
+    compiled = [router.route(event) for event in events]
+    routed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    naive = [_route_naively(subscriptions, event) for event in events]
+    looped = time.perf_counter() - start
+
+    print(
+        f"\n{n_rules:>5,} rules, {len(events):,} events: "
+        f"compiled {routed * 1000:.1f}ms, loop {looped * 1000:.1f}ms"
+    )
+    assert compiled == naive
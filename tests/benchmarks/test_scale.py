@@ -0,0 +1,99 @@
+"""Benchmarks for the poll, dispatch and render hot paths with many tasks.
+
+Run with `pytest tests/benchmarks -m benchmark -s` to print the timings and peak
+memory of each phase.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from taskee.cli.commands.dashboard import _Dashboard
+from taskee.cli.commands.tasks import create_task_table
+from taskee.events import EventEnum
+from taskee.notifiers.notifier import Notifier
+from taskee.taskee import Taskee
+
+from .synthetic import SyntheticAccount, measure, report
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+class _StubNotifier(Notifier):
+    """A notifier that counts notifications instead of sending them."""
+
+    def __init__(self):
+        self.sent = 0
+
+    def send(self, title: str, message: str) -> None:
+        self.sent += 1
+
+
+@pytest.fixture(params=SIZES, ids=lambda n: f"{n:,}")
+def account(request):
+    """A synthetic account that Earth Engine requests are routed to."""
+    account = SyntheticAccount(request.param)
+    with patch("taskee.fetch.iter_operations", account.iter_operations):
+        yield account
+
+
+def _make_taskee(account: SyntheticAccount) -> Taskee:
+    """Return a Taskee that has polled the account once and is watching all events."""
+    t = Taskee(notifiers=(), watch_for=tuple(EventEnum.__members__))
+    t.notifiers = [_StubNotifier()]
+    return t
+
+
+def _churn(t: Taskee, account: SyntheticAccount) -> Taskee:
+    account.churn()
+    return t
+
+
+@pytest.mark.benchmark()
+def test_benchmark_get_events(account):
+    """Polls after the first should only fetch and parse tasks that changed."""
+    n = len(account)
+
+    seconds, peak = measure(lambda: account, _make_taskee)
+    report("first update", n, seconds, peak)
+
+    seconds, peak = measure(
+        lambda: _churn(_make_taskee(account), account), Taskee._get_events
+    )
+    report("update after churn", n, seconds, peak)
+
+
+@pytest.mark.benchmark()
+def test_benchmark_dispatch(account):
+    """Dispatching the events from one poll with stub notifiers."""
+
+    def setup() -> Taskee:
+        t = _churn(_make_taskee(account), account)
+        t.update()
+        return t
+
+    t = setup()
+    n_events = len(t.event_queue)
+    seconds, peak = measure(setup, Taskee.dispatch)
+    report(f"dispatch {n_events:,} events", len(account), seconds, peak)
+
+    assert n_events > 0
+
+
+@pytest.mark.benchmark()
+def test_benchmark_create_task_table(account):
+    """Formatting a table of every task, as `taskee tasks -m` does with a high max."""
+    t = _make_taskee(account)
+    n = len(t.tasks)
+
+    seconds, peak = measure(lambda: t.tasks, lambda tasks: create_task_table(tasks, n))
+    report("create_task_table", n, seconds, peak)
+
+
+@pytest.mark.benchmark()
+def test_benchmark_update_display(account):
+    """Redrawing the dashboard should only format the visible tasks."""
+    t = _make_taskee(account)
+
+    seconds, peak = measure(lambda: _Dashboard(t), _Dashboard._update_display)
+    report("dashboard redraw", len(t.tasks), seconds, peak)
@@ -0,0 +1,43 @@
+"""Benchmarks for CLI startup time.
+
+Run with `pytest tests/benchmarks -m benchmark -s` to print the import profiles.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _get_import_profile(module: str) -> list[tuple[int, str]]:
+    """Return the cumulative import time in microseconds of each module imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.split("|"))
+        profile.append((int(cumulative), name.strip()))
+
+    return profile
+
+
+@pytest.mark.benchmark()
+def test_benchmark_cli_startup():
+    """Starting the CLI should take a fraction of the time to load Earth Engine."""
+    cli = _get_import_profile("taskee.cli.cli")
+    full = _get_import_profile("taskee.taskee")
+    cli_total = next(us for us, name in cli if name == "taskee.cli.cli")
+    full_total = next(us for us, name in full if name == "taskee.taskee")
+
+    print(f"\nimport taskee.cli.cli: {cli_total / 1000:.0f}ms")
+    for us, name in sorted(cli, reverse=True)[1:11]:
+        print(f"  {us / 1000:>6.1f}ms  {name}")
+    print(f"import taskee.taskee: {full_total / 1000:.0f}ms")
+
+    assert cli_total < full_total
@@ -50,14 +50,16 @@ def mock_service_account_credentials():
 @pytest.fixture()
 def mock_taskee(mock_task_list) -> Taskee:
     """A Taskee instance initialized with mock tasks."""
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [task.model_dump() for task in mock_task_list]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
         return Taskee(notifiers=["native", "pushbullet"])
 
 
 @pytest.fixture(autouse=True)
-def mock_native_notifier():
+def mock_native_notifier(monkeypatch):
     """Mock the native notifier."""
+    # Prevent notifications from being sent over a real session bus
+    monkeypatch.delenv("DBUS_SESSION_BUS_ADDRESS", raising=False)
     with patch("notifypy.Notify") as Notify:
         yield Notify.return_value
 
@@ -32,6 +32,7 @@ class MockOperation(Operation):
         update_time_ms=None,
         error_message: str | None = None,
         type: OperationType = OperationType.EXPORT_IMAGE,
+        project: str = "earthengine-legacy",
     ):
         now_ms = int(datetime.now().timestamp() * 1000)
         creation_time_ms = now_ms - time_since_creation_ms
@@ -44,7 +45,7 @@ class MockOperation(Operation):
             updateTime=update_time_ms or now_ms,
             type=type,
         )
-        super().__init__(name=_random_name(), metadata=meta)
+        super().__init__(name=_random_name(project), metadata=meta)
         self._set_metadata(error_message=error_message)
 
     def _set_metadata(self, error_message: str = None):
@@ -95,8 +96,8 @@ class MockOperation(Operation):
         return self
 
 
-def _random_name() -> str:
+def _random_name(project: str = "earthengine-legacy") -> str:
     """Return a randomized operation name that resembles a real one."""
     chars = string.ascii_uppercase + string.digits
     op_id = "".join([random.choice(chars) for i in range(24)])
-    return f"projects/earthengine-legacy/operations/{op_id}"
+    return f"projects/{project}/operations/{op_id}"
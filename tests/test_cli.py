@@ -1,10 +1,21 @@
+import csv
+import io
+import json
+import threading
+from dataclasses import replace
+from datetime import timedelta
 from time import sleep
 from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
+from rich.console import Console
 
 from taskee.cli.cli import taskee
+from taskee.cli.commands.dashboard import _Dashboard
+from taskee.events import ErrorEvent, FailedEvent
+from taskee.history import EventHistory
+from taskee.taskee import Taskee
 
 from .mock_operation import MockOperation
 
@@ -71,14 +82,14 @@ def test_start_log_command(
 
         mock_pending_task.update(state="RUNNING")
         mock_running_task.update(state="SUCCEEDED")
-        listOperations.return_value = [
+        iter_operations.return_value = [
             mock_pending_task.model_dump(),
             mock_running_task.model_dump(),
         ]
         update_count += 1
         sleep(SLEEP_TIME)
 
-    with patch("ee.data.listOperations") as listOperations, patch(
+    with patch("taskee.fetch.iter_operations") as iter_operations, patch(
         "taskee.cli.commands.log.time.sleep", side_effect=update_or_interrupt
     ), patch("taskee.cli.commands.log.logger.info") as info:
         args = ["--interval-mins", UPDATE_INTERVAL, "--notifier", notifier]
@@ -104,6 +115,66 @@ def test_start_log_command(
     assert result.exit_code == 0, result.output
 
 
+def test_start_log_timings(cli, mock_task_list):
+    """The `start log` command should log a phase breakdown after each update."""
+    with patch("taskee.fetch.iter_operations") as iter_operations, patch(
+        "taskee.cli.commands.log.time.sleep", side_effect=KeyboardInterrupt
+    ), patch("taskee.cli.commands.log.logger.info") as info:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        result = cli.invoke(taskee, ["start", "log", "--timings"])
+
+    assert result.exit_code == 0, result.output
+    timings = info.call_args_list[-1][0][0]
+    assert "Updated in" in timings
+    assert "request" in timings
+    assert "3 fetched" in timings
+
+
+def test_start_dashboard_timings_unsupported(cli):
+    """The --timings flag should only be accepted in log mode."""
+    result = cli.invoke(taskee, ["start", "dashboard", "--timings"])
+
+    assert result.exit_code == 2
+    assert "only supported in log mode" in result.output
+
+
+def test_start_state_filter_unsupported(cli):
+    """Monitored tasks change state, so they can't be filtered by state."""
+    result = cli.invoke(taskee, ["start", "log", "failed", "--state", "running"])
+
+    assert result.exit_code == 2
+    assert "--state" in result.output
+
+
+def test_start_command_metrics_port_in_use(cli):
+    """The `start` command should fail cleanly if the metrics port is unavailable."""
+    with patch(
+        "taskee.metrics.start_metrics_server", side_effect=OSError("Address in use")
+    ):
+        result = cli.invoke(taskee, ["start", "log", "--metrics-port", "9090"])
+
+    assert result.exit_code == 1
+    assert "Couldn't serve metrics on port 9090" in result.output
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        '{"events": ["faild"], "notifiers": ["native"]}',
+        '{"events": ["failed"], "notifiers": ["slack"]}',
+    ],
+)
+def test_start_command_invalid_subscriptions(cli, tmpdir, rule):
+    """The `start` command should reject invalid subscription files."""
+    path = tmpdir / "subscriptions.json"
+    path.write_text(f"[{rule}]", "utf-8")
+
+    result = cli.invoke(taskee, ["start", "log", "--subscriptions", str(path)])
+
+    assert result.exit_code == 2
+    assert "Invalid value for --subscriptions" in result.output
+
+
 @PARAMETRIZE_WATCH_FOR
 @PARAMETRIZE_NOTIFIER
 def test_start_dashboard_command(
@@ -135,14 +206,21 @@ def test_start_dashboard_command(
 
         mock_pending_task.update(state="RUNNING")
         mock_running_task.update(state="SUCCEEDED")
-        listOperations.return_value = [
+        iter_operations.return_value = [
             mock_pending_task.model_dump(),
             mock_running_task.model_dump(),
         ]
         update_count += 1
-        sleep(SLEEP_TIME)
 
-    with patch("ee.data.listOperations") as listOperations, patch(
+        # Updates run in the background, so wait until a poll that started after
+        # the tasks changed has finished, i.e. the next poll has started.
+        calls = iter_operations.call_count
+        for _ in range(100):
+            if iter_operations.call_count >= calls + 2:
+                break
+            sleep(SLEEP_TIME)
+
+    with patch("taskee.fetch.iter_operations") as iter_operations, patch(
         "taskee.cli.commands.log.time.sleep", side_effect=update_or_interrupt
     ):
         args = ["--interval-mins", UPDATE_INTERVAL, "--notifier", notifier]
@@ -177,8 +255,8 @@ def test_start_command_with_key(
     key_file = tmpdir / "key.json"
     key_file.write_text("mock_key_file", "utf-8")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [task.model_dump() for task in mock_task_list]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
 
         args = [mode, "--private-key", key_file]
         result = cli.invoke(taskee, ["start"] + args)
@@ -193,8 +271,8 @@ def test_start_command_with_key(
 @pytest.mark.usefixtures("_runtimeerror_on_sleep")
 def test_start_command_handles_crash(mode, cli, mock_native_notifier):
     """The `start` command should send an error notification on crash."""
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = []
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = []
         result = cli.invoke(taskee, ["start", mode, "--notifier", "all"])
 
     assert result.exit_code == 1, result.output
@@ -207,8 +285,8 @@ def test_tasks_command(cli, mock_task_list, mock_succeeded_task):
     """The `tasks` command should list tasks."""
     mock_succeeded_task.metadata.batchEecuUsageSeconds = 42.0
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [task.model_dump() for task in mock_task_list]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
         result = cli.invoke(taskee, ["tasks"])
 
     assert result.exit_code == 0, result.output
@@ -221,6 +299,44 @@ def test_tasks_command(cli, mock_task_list, mock_succeeded_task):
     assert "42" in result.output
 
 
+@pytest.mark.parametrize("output_format", ["json", "ndjson", "csv"])
+def test_tasks_command_formats(output_format, cli, mock_task_list):
+    """The `tasks` command should stream every task without building a table."""
+    with patch("taskee.fetch.iter_operations") as iter_operations, patch(
+        "taskee.cli.commands.tasks.create_task_table"
+    ) as create_task_table:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        result = cli.invoke(
+            taskee, ["tasks", "--format", output_format, "--max-tasks", 1]
+        )
+
+    assert result.exit_code == 0, result.output
+    create_task_table.assert_not_called()
+
+    if output_format == "json":
+        records = json.loads(result.output)
+    elif output_format == "ndjson":
+        records = [json.loads(line) for line in result.output.splitlines()]
+    else:
+        records = list(csv.DictReader(io.StringIO(result.output)))
+
+    assert [r["name"] for r in records] == [task.name for task in mock_task_list]
+    assert [r["state"] for r in records] == ["PENDING", "RUNNING", "SUCCEEDED"]
+
+
+def test_tasks_command_filters(cli, mock_task_list):
+    """The `tasks` command should only show tasks matching the filter options."""
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        args = ["--state", "running", "--description", "mock_*", "-t", "export_image"]
+        result = cli.invoke(taskee, ["tasks", *args])
+
+    assert result.exit_code == 0, result.output
+    assert "mock_running_task" in result.output
+    assert "mock_pending_task" not in result.output
+    assert "mock_succeeded_task" not in result.output
+
+
 def test_tasks_command_with_key(
     cli, tmpdir, mock_task_list, mock_service_account_credentials
 ):
@@ -228,8 +344,8 @@ def test_tasks_command_with_key(
     key_file = tmpdir / "key.json"
     key_file.write_text("mock_key_file", "utf-8")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [task.model_dump() for task in mock_task_list]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
         result = cli.invoke(taskee, ["tasks", "--private-key", key_file])
 
     assert result.exit_code == 0
@@ -241,8 +357,8 @@ def test_tasks_command_with_key(
 
 def test_tasks_truncates(cli, mock_task_list):
     """The `task` command should hide tasks beyond `--max-tasks`."""
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [task.model_dump() for task in mock_task_list]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
         result = cli.invoke(taskee, ["tasks", "--max-tasks", 2])
 
     assert result.exit_code == 0, result.output
@@ -256,8 +372,8 @@ def test_tasks_unknown_state(cli):
     """The `task` command should handle unknown task states."""
     unexpected_op = MockOperation(description="unexpected_task", state="Ddf!sD?sdfl")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [unexpected_op.model_dump()]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [unexpected_op.model_dump()]
         result = cli.invoke(taskee, ["tasks"])
 
     assert result.exit_code == 0, result.output
@@ -276,3 +392,162 @@ def test_test_command(notifier, cli, mock_native_notifier, mock_pushbullet_notif
         mock_native_notifier.send.assert_called_once()
     if notifier == "pushbullet" or notifier == "all":
         mock_pushbullet_notifier.push_note.assert_called_once()
+
+
+def test_tasks_since(cli, mock_task_list):
+    """The `tasks` command should hide tasks created before `--since`."""
+    old_task = MockOperation(description="old_task", state="SUCCEEDED")
+    old_task.metadata.createTime -= timedelta(days=3)
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [
+            task.model_dump() for task in [*mock_task_list, old_task]
+        ]
+        result = cli.invoke(taskee, ["tasks", "--since", 2])
+
+    assert result.exit_code == 0, result.output
+    assert "mock_pending_task" in result.output
+    assert "old_task" not in result.output
+
+
+def test_tasks_multiple_projects(cli, mock_task_list):
+    """The `tasks` command should show a project column for several projects."""
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        result = cli.invoke(taskee, ["tasks", "-p", "first", "-p", "second"])
+
+    assert result.exit_code == 0, result.output
+    assert "Project" in result.output
+    projects = [call.args[0] for call in iter_operations.call_args_list]
+    assert sorted(projects) == ["projects/first", "projects/second"]
+
+
+@pytest.mark.parametrize("mode", ["log", "dashboard"])
+def test_start_command_adaptive(mode, cli, mock_task_list):
+    """The `start` command should run with an adaptive interval."""
+
+    def interrupt_after_update(*_):
+        """Wait for the dashboard to update in the background, then interrupt."""
+        for _ in range(100):
+            if next_interval.called:
+                break
+            sleep(0.01)
+        raise KeyboardInterrupt
+
+    with patch("taskee.fetch.iter_operations") as iter_operations, patch(
+        "taskee.scheduler.AdaptiveScheduler.next_interval", return_value=60.0
+    ) as next_interval, patch("time.sleep", side_effect=interrupt_after_update):
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        args = [mode, "--adaptive", "-i", 0]
+        result = cli.invoke(taskee, ["start"] + args)
+
+    assert result.exit_code == 0, result.output
+    next_interval.assert_called_once()
+
+
+def test_history_command(cli, tmpdir, mock_running_task):
+    """The `history` command should search recorded events."""
+    history_file = str(tmpdir / "history.db")
+    history = EventHistory(history_file)
+    mock_running_task.update(state="FAILED")
+    history.add([FailedEvent(task=mock_running_task), ErrorEvent()])
+    history.close()
+
+    result = cli.invoke(
+        taskee, ["history", "failed", "--history-file", history_file, "-s", 7]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Event History" in result.output
+    assert "mock_running_task" in result.output
+    assert "restarted" not in result.output
+
+
+def test_history_command_without_history(cli, tmpdir):
+    """The `history` command should report missing history without creating it."""
+    history_file = tmpdir / "missing" / "history.db"
+
+    result = cli.invoke(taskee, ["history", "--history-file", str(history_file)])
+
+    assert result.exit_code == 0, result.output
+    assert "No history recorded" in result.output
+    assert not history_file.dirpath().exists()
+
+
+def test_dashboard_renders_while_updating(mock_taskee):
+    """The dashboard should keep rendering while an update runs in the background."""
+    release = threading.Event()
+    dashboard = _Dashboard(mock_taskee, interval_minutes=0)
+
+    def slow_update():
+        release.wait(5)
+        return ()
+
+    with patch.object(mock_taskee, "update", side_effect=slow_update):
+        poller = threading.Thread(target=dashboard._poll, daemon=True)
+        poller.start()
+        for _ in range(100):
+            if dashboard.updating:
+                break
+            sleep(0.01)
+
+        dashboard._update_display()
+        console = Console()
+        with console.capture() as capture:
+            console.print(dashboard._create_header(dashboard.state))
+        assert "Updating" in capture.get()
+
+        release.set()
+        for _ in range(100):
+            if dashboard.state.last_checked:
+                break
+            sleep(0.01)
+        dashboard._stopped.set()
+        poller.join(1)
+
+    assert dashboard.state.last_checked > 0
+    assert not poller.is_alive()
+
+
+def test_dashboard_scrolls_tasks(mock_taskee):
+    """The dashboard should page through tasks, formatting only visible rows."""
+    dashboard = _Dashboard(mock_taskee)
+    tasks = tuple(MockOperation(state="SUCCEEDED") for _ in range(100))
+    dashboard.state = replace(dashboard.state, tasks=tasks)
+
+    with patch.object(
+        dashboard._task_rows, "_format", wraps=dashboard._task_rows._format
+    ) as format_task:
+        task_table, _ = dashboard._create_tables(dashboard.state)
+    page = task_table.row_count
+    assert format_task.call_count == page
+    assert task_table.caption.startswith(f"1-{page} of 100 tasks")
+
+    dashboard._handle_key("page_down")
+    task_table, _ = dashboard._create_tables(dashboard.state)
+    assert dashboard.task_offset == page
+
+    dashboard._handle_key("end")
+    task_table, _ = dashboard._create_tables(dashboard.state)
+    assert task_table.caption.startswith(f"{101 - page}-100 of 100 tasks")
+
+    dashboard._handle_key("home")
+    dashboard._handle_key("up")
+    assert dashboard.task_offset == 0
+
+
+def test_dashboard_shows_rate_limits(mock_running_task):
+    """The dashboard header should show when a rate limited notifier backs off."""
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_running_task.model_dump()]
+        t = Taskee(notifiers=["native"], rate_limits={"native": (1, 0.001)})
+    dashboard = _Dashboard(t)
+
+    assert dashboard._get_rate_limits() == "[dim]native 1/1[/]"
+
+    t.notifiers[0].send_batch([("title", "first"), ("title", "second")])
+    t.notifiers[0].send("title", "third")
+
+    assert dashboard._get_rate_limits() == (
+        "[yellow]native backing off (1 deferred)[/]"
+    )
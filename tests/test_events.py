@@ -5,6 +5,7 @@ from taskee.events import (
     CancelledEvent,
     CompletedEvent,
     CreatedEvent,
+    DigestEvent,
     FailedEvent,
     StartedEvent,
 )
@@ -16,8 +17,8 @@ def test_failed_event(mock_taskee, mock_pending_task):
     """A Failed event should include the task description in the message."""
     mock_pending_task.update(state="FAILED", error_message="whoops")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [mock_pending_task.model_dump()]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_pending_task.model_dump()]
         event = mock_taskee.update()[0]
 
     assert isinstance(event, FailedEvent)
@@ -30,8 +31,8 @@ def test_succeeded_event(mock_taskee, mock_pending_task):
     """A Completed event should include the task description in the message."""
     mock_pending_task.update(state="SUCCEEDED")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [mock_pending_task.model_dump()]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_pending_task.model_dump()]
         event = mock_taskee.update()[0]
 
     assert isinstance(event, CompletedEvent)
@@ -44,8 +45,8 @@ def test_created_event(mock_taskee):
     """A Created event should include the task description in the message."""
     new_task = MockOperation(state="PENDING", description="mock_new_task")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [new_task.model_dump()]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [new_task.model_dump()]
         event = mock_taskee.update()[0]
 
     assert isinstance(event, CreatedEvent)
@@ -59,8 +60,8 @@ def test_created_and_completed_event(mock_taskee):
     new_task = MockOperation(state="PENDING", description="mock_new_task")
     new_task.update(state="SUCCEEDED")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [new_task.model_dump()]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [new_task.model_dump()]
         event = mock_taskee.update()[0]
 
     assert isinstance(event, CompletedEvent)
@@ -73,8 +74,8 @@ def test_attempted_event(mock_taskee, mock_running_task):
     """An Attempted event should include the number of attempts in the message."""
     mock_running_task.update(retry=True)
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [mock_running_task.model_dump()]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_running_task.model_dump()]
         event = mock_taskee.update()[0]
 
     assert isinstance(event, AttemptedEvent)
@@ -86,8 +87,8 @@ def test_cancelled_event(mock_taskee, mock_running_task):
     """A Cancelled event should include the task description in the message."""
     mock_running_task.update(state="CANCELLED")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [mock_running_task.model_dump()]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_running_task.model_dump()]
         event = mock_taskee.update()[0]
 
     assert isinstance(event, CancelledEvent)
@@ -100,8 +101,8 @@ def test_started_event(mock_taskee, mock_pending_task):
     """A Started event should include the task description in the message."""
     mock_pending_task.update(state="RUNNING")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [mock_pending_task.model_dump()]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_pending_task.model_dump()]
         event = mock_taskee.update()[0]
 
     assert isinstance(event, StartedEvent)
@@ -117,9 +118,31 @@ def test_succeeded_event_with_null_eecus(mock_taskee):
         description="mock_ingestion",
     )
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [mock_succeeded_ingestion.model_dump()]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_succeeded_ingestion.model_dump()]
         event = mock_taskee.update()[0]
 
     assert "'mock_ingestion' completed successfully" in event.message
     assert "used 0 EECU-seconds" in event.message
+
+
+def test_digest_event():
+    """A Digest event should summarize counts, top EECU tasks, and remaining tasks."""
+    small = MockOperation("SUCCEEDED", description="small_task")
+    big = MockOperation("SUCCEEDED", description="big_task")
+    failed = MockOperation("FAILED", description="failed_task")
+    small.metadata.batchEecuUsageSeconds = 10.0
+    big.metadata.batchEecuUsageSeconds = 12_345.0
+
+    event = DigestEvent(
+        events=(
+            CompletedEvent(task=small),
+            CompletedEvent(task=big),
+            FailedEvent(task=failed),
+        ),
+        active_tasks=4,
+    )
+
+    assert "3 task events (2 completed, 1 failed)." in event.message
+    assert "Top EECU-seconds: 'big_task' (12,345), 'small_task' (10)." in event.message
+    assert event.message.endswith("4 tasks remaining.")
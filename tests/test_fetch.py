@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import ee
+import pytest
+
+from taskee import fetch
+
+from .mock_operation import MockOperation
+
+
+@pytest.fixture()
+def mock_pages():
+    """Three pages of operations, each older than the last."""
+    return [
+        [
+            MockOperation(state="RUNNING", time_since_creation_ms=days * 86_400_000)
+            for days in page
+        ]
+        for page in ([0, 1], [2, 3], [4, 5])
+    ]
+
+
+@pytest.fixture()
+def mock_cloud_api(mock_pages):
+    """Patch the paged Earth Engine Cloud API to serve the mock pages."""
+    operations = MagicMock()
+    operations.list.return_value = 0
+    operations.list_next.side_effect = lambda i, _: i + 1 if i + 1 < 3 else None
+    responses = [{"operations": [op.model_dump() for op in p]} for p in mock_pages]
+
+    with patch("ee.data._get_cloud_projects") as projects, patch(
+        "ee.data._execute_cloud_call", side_effect=lambda i: responses[i]
+    ) as execute:
+        projects.return_value.operations.return_value = operations
+        yield execute
+
+
+def test_iter_operations_yields_all_pages(mock_cloud_api, mock_pages):
+    """Without a watermark, every page should be retrieved."""
+    ops = list(fetch.iter_operations("projects/mock"))
+
+    assert [op["name"] for op in ops] == [op.name for p in mock_pages for op in p]
+    assert mock_cloud_api.call_count == 3
+
+
+def test_iter_operations_is_lazy(mock_cloud_api):
+    """Pages should only be requested as they are consumed."""
+    ops = fetch.iter_operations("projects/mock")
+    assert mock_cloud_api.call_count == 0
+
+    next(ops)
+    assert mock_cloud_api.call_count == 1
+
+
+def test_iter_operations_stops_at_watermark(mock_cloud_api, mock_pages):
+    """Paging should stop after the first page that passes the watermark."""
+    since = datetime.now(tz=timezone.utc) - timedelta(days=2.5)
+    ops = list(fetch.iter_operations("projects/mock", since=since))
+
+    assert len(ops) == 4
+    assert mock_cloud_api.call_count == 2
+
+
+def test_get_create_time():
+    """Creation times should parse from raw and dumped payloads."""
+    payload = {"metadata": {"createTime": "2023-01-01T00:00:00.123456Z"}}
+    expected = datetime(2023, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc)
+
+    assert fetch.get_create_time(payload) == expected
+
+
+def test_cloud_projects_require_initialization():
+    """Listing operations with other credentials requires Earth Engine state."""
+    state = MagicMock(cloud_api_base_url=None, requests_session=None)
+
+    with patch("ee.data._get_state", return_value=state), pytest.raises(
+        ee.EEException, match="must be initialized"
+    ):
+        fetch._get_cloud_projects(MagicMock())
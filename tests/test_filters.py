@@ -0,0 +1,37 @@
+import pytest
+
+from taskee.filters import TaskFilter
+
+from .mock_operation import MockOperation
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        ({}, True),
+        ({"types": ["export_image"]}, True),
+        ({"types": ["EXPORT_TABLE", "INGEST"]}, False),
+        ({"states": ["running"]}, True),
+        ({"states": ["SUCCEEDED"]}, False),
+        ({"description": "nightly_*"}, True),
+        ({"description": "Nightly_*"}, False),
+        ({"script_uri": "users/me/*"}, True),
+        ({"script_uri": "users/you/*"}, False),
+        ({"types": ["EXPORT_IMAGE"], "states": ["FAILED"]}, False),
+    ],
+)
+def test_task_filter_matches(kwargs, expected):
+    """Filters should match raw payloads on every criterion that is set."""
+    payload = MockOperation(state="RUNNING", description="nightly_ndvi").model_dump(
+        mode="json"
+    )
+    payload["metadata"]["scriptUri"] = "users/me/exports:ndvi"
+
+    assert TaskFilter(**kwargs).matches(payload) is expected
+
+
+def test_task_filter_without_script_uri():
+    """Tasks without a script URI shouldn't match a script URI pattern."""
+    payload = MockOperation(state="RUNNING").model_dump(mode="json")
+
+    assert not TaskFilter(script_uri="*exports*").matches(payload)
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from taskee.events import CompletedEvent, ErrorEvent, FailedEvent
+from taskee.history import EventHistory
+from taskee.taskee import Taskee
+
+from .mock_operation import MockOperation
+
+
+@pytest.fixture()
+def event_history(tmpdir):
+    history = EventHistory(str(tmpdir / "history.db"))
+    yield history
+    history.close()
+
+
+@pytest.fixture()
+def mock_events():
+    image = MockOperation("FAILED", description="nightly_image", type="EXPORT_IMAGE")
+    table = MockOperation("FAILED", description="nightly_table", type="INGEST_TABLE")
+    done = MockOperation("SUCCEEDED", description="weekly_image", type="EXPORT_IMAGE")
+    return [
+        FailedEvent(task=image),
+        FailedEvent(task=table),
+        CompletedEvent(task=done),
+        ErrorEvent(),
+    ]
+
+
+def test_history_stores_events(event_history, mock_events):
+    """All events should be stored and returned newest first."""
+    event_history.add(mock_events)
+    records = event_history.query()
+
+    assert len(records) == 4
+    assert records[0].event == "ERROR"
+    assert records[0].task_name is None
+    assert records[-1].description == "nightly_image"
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ({"event_types": ["failed"]}, {"nightly_image", "nightly_table"}),
+        ({"event_types": ["FAILED"], "task_types": ["IMAGE"]}, set()),
+        (
+            {"event_types": ["failed"], "task_types": ["export_image"]},
+            {"nightly_image"},
+        ),
+        ({"description": "*_image"}, {"nightly_image", "weekly_image"}),
+        ({"task_types": ["INGEST_TABLE"], "limit": 5}, {"nightly_table"}),
+    ],
+)
+def test_history_query(event_history, mock_events, query, expected):
+    """Queries should filter by event type, task type, and description."""
+    event_history.add(mock_events)
+    records = event_history.query(**query)
+
+    assert {record.description for record in records} == expected
+
+
+def test_history_query_time(event_history, mock_events):
+    """Queries should filter by event time."""
+    mock_events[0].time -= timedelta(days=8)
+    event_history.add(mock_events)
+    last_week = datetime.now() - timedelta(days=7)
+
+    assert len(event_history.query(since=last_week)) == 3
+    assert len(event_history.query(until=last_week)) == 1
+
+
+def test_taskee_records_history(tmpdir, mock_task_list, mock_running_task):
+    """Taskee should record events to the history as they occur."""
+    history_path = str(tmpdir / "history.db")
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        t = Taskee(notifiers=tuple(), history_path=history_path)
+
+        mock_running_task.update(state="FAILED")
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        t.update()
+
+    records = t.history.query()
+    assert len(records) == 1
+    assert records[0].event == "FAILED"
+    assert records[0].task_name == mock_running_task.name
+
+
+def test_history_creates_directory(tmpdir, mock_events):
+    """The history database should be created along with its directory."""
+    path = str(tmpdir / "config" / "history.db")
+    history = EventHistory(path)
+    history.add(mock_events)
+    history.close()
+
+    history = EventHistory(path, read_only=True)
+    assert len(history.query()) == len(mock_events)
+    history.close()
@@ -0,0 +1,28 @@
+import io
+
+from taskee.cli.keys import KeyReader, parse_keys
+
+
+def test_parse_keys():
+    """Escape sequences and shortcut characters should be decoded into key names."""
+    data = "\x1b[A\x1b[Bjk\x1b[5~\x1b[6~ gG\x1b[Hx"
+
+    assert parse_keys(data) == [
+        "up",
+        "down",
+        "down",
+        "up",
+        "page_up",
+        "page_down",
+        "page_down",
+        "home",
+        "end",
+        "home",
+    ]
+
+
+def test_key_reader_is_inactive_without_terminal():
+    """Key readers should do nothing if the stream isn't an interactive terminal."""
+    with KeyReader(io.StringIO()) as keys:
+        assert not keys.active
+        assert keys.get_keys(0) == []
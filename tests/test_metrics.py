@@ -0,0 +1,109 @@
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from taskee.metrics import Metrics, start_metrics_server
+from taskee.notifiers import Measured
+from taskee.notifiers.notifier import Notifier
+from taskee.operation import OperationType
+from taskee.taskee import Taskee
+
+from .mock_operation import MockOperation
+
+
+def _get_samples(metrics: Metrics) -> dict[str, float]:
+    """Parse rendered metrics into a mapping of samples to values."""
+    samples = {}
+    for line in metrics.render().splitlines():
+        if not line.startswith("#"):
+            sample, value = line.rsplit(" ", 1)
+            samples[sample] = float(value)
+    return samples
+
+
+def test_metrics_track_task_changes(mock_task_list, mock_running_task):
+    """Task counts should follow state changes between updates."""
+    metrics = Metrics()
+    mock_running_task.metadata.batchEecuUsageSeconds = 10.0
+    new_task = MockOperation(state="PENDING", type=OperationType.INGEST)
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        t = Taskee(notifiers=tuple(), metrics=metrics)
+
+        samples = _get_samples(metrics)
+        assert samples['taskee_tasks{state="RUNNING",type="EXPORT_IMAGE"}'] == 1
+        assert samples["taskee_running_eecu_seconds"] == 10.0
+
+        mock_running_task.update(state="SUCCEEDED")
+        iter_operations.return_value = [
+            task.model_dump() for task in [new_task, *mock_task_list]
+        ]
+        t.update()
+
+    samples = _get_samples(metrics)
+    assert samples['taskee_tasks{state="PENDING",type="EXPORT_IMAGE"}'] == 1
+    assert samples['taskee_tasks{state="PENDING",type="INGEST"}'] == 1
+    assert samples['taskee_tasks{state="RUNNING",type="EXPORT_IMAGE"}'] == 0
+    assert samples['taskee_tasks{state="SUCCEEDED",type="EXPORT_IMAGE"}'] == 2
+    assert samples["taskee_running_eecu_seconds"] == 0.0
+    assert samples['taskee_events_total{event="completed"}'] == 1
+    assert samples['taskee_events_total{event="created"}'] == 1
+    assert samples["taskee_poll_duration_seconds_count"] == 2
+    assert samples['taskee_poll_duration_seconds_bucket{le="+Inf"}'] == 2
+
+
+def test_metrics_forget_removed_tasks(mock_task_list, mock_pending_task):
+    """Tasks that are no longer tracked should be removed from the counts."""
+    metrics = Metrics()
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        t = Taskee(notifiers=tuple(), metrics=metrics)
+
+        iter_operations.return_value = [mock_pending_task.model_dump()]
+        # Drop the watermark so that missing tasks aren't carried over
+        t._registries[0]._last_fetch = None
+        t.update()
+
+    samples = _get_samples(metrics)
+    assert samples['taskee_tasks{state="PENDING",type="EXPORT_IMAGE"}'] == 1
+    assert samples['taskee_tasks{state="RUNNING",type="EXPORT_IMAGE"}'] == 0
+    assert samples['taskee_tasks{state="SUCCEEDED",type="EXPORT_IMAGE"}'] == 0
+
+
+def test_measured_notifier_records_sends():
+    """Measured notifiers should record the latency and failures of each batch."""
+    metrics = Metrics()
+    notifier = MagicMock(spec=Notifier)
+    notifier.send_batch.side_effect = [None, ConnectionError]
+    measured = Measured(notifier, metrics)
+
+    measured.send("title", "message")
+    with pytest.raises(ConnectionError):
+        measured.send_batch([("title", "message"), ("title", "message")])
+
+    samples = _get_samples(metrics)
+    assert samples['taskee_notifier_send_seconds_count{notifier="notifier"}'] == 2
+    assert samples['taskee_notifier_notifications_total{notifier="notifier"}'] == 3
+    assert samples['taskee_notifier_failures_total{notifier="notifier"}'] == 1
+
+
+def test_metrics_server():
+    """Metrics should be served over HTTP."""
+    server = start_metrics_server(Metrics(), port=0)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        with urllib.request.urlopen(f"{url}/metrics") as response:
+            body = response.read().decode()
+            assert response.headers["Content-Type"].startswith("text/plain")
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{url}/missing")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "# TYPE taskee_poll_duration_seconds histogram" in body
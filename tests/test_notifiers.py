@@ -1,9 +1,17 @@
+import asyncio
 import configparser
-from unittest.mock import patch
+import threading
+import time
+from email.utils import formatdate
+from unittest.mock import MagicMock, patch
 
+import pushbullet
 import pytest
+from requests.exceptions import ConnectionError
 
-from taskee.notifiers import Pushbullet
+from taskee.notifiers import Native, Pushbullet, Queued, RateLimited
+from taskee.notifiers.limited import TokenBucket
+from taskee.notifiers.notifier import Notifier
 from taskee.taskee import Taskee
 
 
@@ -11,8 +19,8 @@ def test_native_notifier(mock_taskee, mock_running_task, mock_native_notifier):
     """Test that the Native notifier attempts to notify."""
     mock_running_task.update(state="FAILED", error_message="whoops")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [mock_running_task.model_dump()]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_running_task.model_dump()]
         mock_taskee.update()
 
     mock_taskee.dispatch()
@@ -28,8 +36,8 @@ def test_pushbullet_notifier(mock_taskee, mock_running_task, mock_pushbullet_not
     """Test that Pushbullet attempts to notify."""
     mock_running_task.update(state="FAILED", error_message="uh oh")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [mock_running_task.model_dump()]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_running_task.model_dump()]
         mock_taskee.update()
 
     mock_taskee.dispatch()
@@ -42,10 +50,10 @@ def test_pushbullet_notifier(mock_taskee, mock_running_task, mock_pushbullet_not
 
 def test_pushbullet_uninstalled():
     """An ImportError should be raised if the pushbullet package is not installed."""
-    with patch("ee.data.listOperations") as listOperations, patch.dict(
+    with patch("taskee.fetch.iter_operations") as iter_operations, patch.dict(
         "sys.modules", {"pushbullet": None}
     ):
-        listOperations.return_value = []
+        iter_operations.return_value = []
         with pytest.raises(ImportError, match="pip install pushbullet.py"):
             Taskee(notifiers=["pushbullet"])
 
@@ -69,3 +77,356 @@ def test_initialize_pushbullet_without_key(mock_config_path):
     config = configparser.ConfigParser()
     config.read(mock_config_path)
     assert config["Pushbullet"]["api_key"] == fake_key
+
+
+def test_native_notifier_send_async(mock_native_notifier):
+    """Blocking notifiers should be sendable from an event loop."""
+    asyncio.run(Native().send_async("title", "message"))
+
+    assert mock_native_notifier.title == "title"
+    mock_native_notifier.send.assert_called_once()
+
+
+def test_queued_notifier_does_not_block():
+    """Queued notifiers should return immediately and send in the background."""
+    release = threading.Event()
+    notifier = MagicMock(spec=Notifier)
+    notifier.send_batch.side_effect = lambda *_: release.wait()
+    queued = Queued(notifier)
+
+    queued.send("title", "message")
+    assert not queued.flush(timeout=0.01)
+
+    release.set()
+    assert queued.flush(timeout=1)
+    notifier.send_batch.assert_called_once_with([("title", "message")])
+
+
+def test_queued_notifier_batches_bursts():
+    """Notifications queued while the worker is busy should be sent as one batch."""
+    release = threading.Event()
+    notifier = MagicMock(spec=Notifier)
+    notifier.send_batch.side_effect = lambda *_: release.wait()
+    queued = Queued(notifier)
+
+    queued.send("first", "message")
+    # Wait for the worker to start sending the first notification
+    while not notifier.send_batch.called:
+        time.sleep(0.001)
+    queued.send("second", "message")
+    queued.send_batch([("third", "message")])
+    release.set()
+
+    assert queued.flush(timeout=1)
+    assert notifier.send_batch.call_count == 2
+    assert notifier.send_batch.call_args[0][0] == [
+        ("second", "message"),
+        ("third", "message"),
+    ]
+
+
+def test_queued_notifier_survives_failures():
+    """A failed send should not stop the queue from processing later sends."""
+    notifier = MagicMock(spec=Notifier)
+    notifier.send_batch.side_effect = [ConnectionError, None]
+    queued = Queued(notifier)
+
+    queued.send("first", "message")
+    assert queued.flush(timeout=1)
+    queued.send("second", "message")
+
+    assert queued.flush(timeout=1)
+    assert notifier.send_batch.call_count == 2
+
+
+def test_queued_notifier_survives_failures_in_bursts():
+    """A failed send shouldn't drop the other notifications it was batched with."""
+    release = threading.Event()
+    sent = []
+
+    class Flaky(Notifier):
+        def send(self, title, message):
+            release.wait()
+            if title == "second":
+                raise ConnectionError
+            sent.append(title)
+
+    queued = Queued(Flaky())
+    queued.send("first", "message")
+    queued.send("second", "message")
+    queued.send_batch([("third", "message")])
+    release.set()
+
+    assert queued.flush(timeout=1)
+    assert sent == ["first", "third"]
+
+
+def test_taskee_queued_dispatch(mock_running_task, mock_native_notifier):
+    """Queued notifiers should send after dispatching once flushed."""
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_running_task.model_dump()]
+        t = Taskee(notifiers=["native"], queued=True)
+
+        mock_running_task.update(state="FAILED")
+        iter_operations.return_value = [mock_running_task.model_dump()]
+        t.update()
+
+    t.dispatch()
+
+    assert t.flush()
+    mock_native_notifier.send.assert_called_once()
+    assert mock_native_notifier.title == "Task Failed"
+
+
+def test_pushbullet_retries_connection_errors(mock_pushbullet_notifier):
+    """Pushbullet should retry transient connection errors with backoff."""
+    mock_pushbullet_notifier.push_note.side_effect = [ConnectionError, None]
+
+    with patch("taskee.notifiers.pushbullet.time.sleep") as sleep:
+        Pushbullet().send("title", "message")
+
+    assert mock_pushbullet_notifier.push_note.call_count == 2
+    sleep.assert_called_once()
+
+
+def test_pushbullet_gives_up_after_retries(mock_pushbullet_notifier):
+    """Pushbullet should raise once it runs out of retries."""
+    mock_pushbullet_notifier.push_note.side_effect = ConnectionError
+
+    with patch("taskee.notifiers.pushbullet.time.sleep"), pytest.raises(
+        ConnectionError
+    ):
+        Pushbullet().send("title", "message")
+
+    assert mock_pushbullet_notifier.push_note.call_count == Pushbullet.MAX_RETRIES + 1
+
+
+def test_pushbullet_does_not_retry_bad_requests(mock_pushbullet_notifier):
+    """Pushbullet should not retry pushes that the server rejected."""
+    notifier = Pushbullet()
+
+    def reject(*_):
+        notifier._record_response(MagicMock(status_code=400, headers={}))
+        raise pushbullet.errors.PushError
+
+    mock_pushbullet_notifier.push_note.side_effect = reject
+
+    with pytest.raises(pushbullet.errors.PushError):
+        notifier.send("title", "message")
+
+    mock_pushbullet_notifier.push_note.assert_called_once()
+
+
+def test_pushbullet_waits_for_ratelimit(mock_pushbullet_notifier):
+    """Pushbullet should wait for an exhausted rate limit to reset before pushing."""
+    notifier = Pushbullet()
+    reset = time.time() + 5
+    headers = {"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": str(reset)}
+    notifier._record_response(MagicMock(status_code=200, headers=headers))
+
+    with patch("taskee.notifiers.pushbullet.time.sleep") as sleep:
+        notifier.send("title", "message")
+
+    assert 0 < sleep.call_args[0][0] <= 5
+    mock_pushbullet_notifier.push_note.assert_called_once()
+
+
+def test_pushbullet_parses_retry_after_dates(mock_pushbullet_notifier):
+    """Retry-After headers may be HTTP-dates, and invalid values should be ignored."""
+    notifier = Pushbullet()
+    retry_at = formatdate(time.time() + 30, usegmt=True)
+    notifier._record_response(
+        MagicMock(status_code=429, headers={"Retry-After": retry_at})
+    )
+    assert 0 < notifier._ratelimit_reset - time.time() <= 30
+
+    notifier._record_response(MagicMock(status_code=429, headers={"Retry-After": "?"}))
+    assert notifier._ratelimit_reset is None
+
+
+def test_pushbullet_retries_use_their_own_status(mock_pushbullet_notifier):
+    """Retry decisions shouldn't use the status of a concurrent send."""
+    notifier = Pushbullet()
+
+    def reject(*_):
+        notifier._record_response(MagicMock(status_code=400, headers={}))
+        # Another send fails with a retryable status at the same time
+        concurrent = threading.Thread(
+            target=notifier._record_response,
+            args=(MagicMock(status_code=503, headers={}),),
+        )
+        concurrent.start()
+        concurrent.join()
+        raise pushbullet.errors.PushError
+
+    mock_pushbullet_notifier.push_note.side_effect = reject
+
+    with pytest.raises(pushbullet.errors.PushError):
+        notifier.send("title", "message")
+
+    mock_pushbullet_notifier.push_note.assert_called_once()
+
+
+def test_native_notifier_collapses_titles(mock_native_notifier):
+    """Native notifications with identical titles should be collapsed into one."""
+    Native().send_batch(
+        [("Task Completed", "first"), ("Task Completed", "second"), ("Oops!", "x")]
+    )
+
+    assert mock_native_notifier.send.call_count == 2
+    assert mock_native_notifier.title == "Oops!"
+
+
+def test_native_notifier_concurrent_sends(mock_native_notifier):
+    """Concurrent sends shouldn't overwrite each other's shared notification."""
+    sent = []
+
+    def send():
+        title = mock_native_notifier.title
+        time.sleep(0.01)
+        sent.append((title, mock_native_notifier.message))
+
+    mock_native_notifier.send.side_effect = send
+    notifier = Native()
+
+    async def send_all():
+        await asyncio.gather(*(notifier.send_async(f"t{i}", f"m{i}") for i in range(5)))
+
+    asyncio.run(send_all())
+
+    assert sorted(sent) == [(f"t{i}", f"m{i}") for i in range(5)]
+
+
+def test_native_notifier_uses_dbus(mock_native_notifier, monkeypatch):
+    """Native notifications should reuse a D-Bus connection when one is available."""
+    monkeypatch.setattr("sys.platform", "linux")
+    monkeypatch.setenv("DBUS_SESSION_BUS_ADDRESS", "unix:path=/mock/bus")
+
+    with patch("jeepney.io.blocking.open_dbus_connection") as open_dbus_connection:
+        notifier = Native()
+        notifier.send("first", "message")
+        notifier.send("second", "message")
+
+    open_dbus_connection.assert_called_once()
+    connection = open_dbus_connection.return_value
+    assert connection.send_and_get_reply.call_count == 2
+    mock_native_notifier.send.assert_not_called()
+
+
+def test_token_bucket_refills():
+    """Token buckets should allow bursts and refill at a steady rate."""
+    now = 0.0
+    bucket = TokenBucket(burst=2, refill_per_second=0.5, clock=lambda: now)
+
+    assert bucket.take()
+    assert bucket.take()
+    assert not bucket.take()
+    assert bucket.get_wait() == 2.0
+
+    now = 3.0
+    assert bucket.tokens == 1.5
+    assert bucket.take()
+    now = 100.0
+    assert bucket.tokens == 2
+
+
+def test_rate_limited_notifier_summarizes_bursts():
+    """Notifications beyond the burst should be summarized instead of dropped."""
+    notifier = MagicMock(spec=Notifier)
+    limited = RateLimited(notifier, burst=3, refill_per_second=0.001)
+
+    limited.send_batch([("title", f"message {i}") for i in range(5)])
+
+    (batch,), _ = notifier.send_batch.call_args
+    assert batch[:2] == [("title", "message 0"), ("title", "message 1")]
+    assert batch[2] == (
+        "3 notifications (rate limited)",
+        "message 2\nmessage 3\nmessage 4",
+    )
+    assert limited.pending == 0
+
+
+def test_rate_limited_notifier_defers_when_empty():
+    """Notifications should be deferred until the bucket refills."""
+    notifier = MagicMock(spec=Notifier)
+    limited = RateLimited(notifier, burst=1, refill_per_second=20.0)
+
+    limited.send("first", "message")
+    limited.send("second", "message")
+    limited.send("third", "message")
+    assert notifier.send_batch.call_count == 1
+    assert limited.pending == 2
+
+    # The deferred notifications are summarized once a token refills
+    for _ in range(100):
+        if not limited.pending:
+            break
+        time.sleep(0.01)
+    assert limited.pending == 0
+    assert notifier.send_batch.call_args[0][0] == [
+        ("2 notifications (rate limited)", "message\nmessage")
+    ]
+
+
+def test_rate_limited_notifier_flushes_pending():
+    """Deferred notifications should be sent when flushing, regardless of the limit."""
+    notifier = MagicMock(spec=Notifier)
+    limited = RateLimited(notifier, burst=1, refill_per_second=0.001)
+
+    limited.send("first", "message")
+    limited.send("second", "message")
+    assert limited.flush()
+
+    notifier.send.assert_called_once_with("second", "message")
+    assert limited.pending == 0
+
+
+def test_rate_limited_notifier_sends_outside_lock():
+    """A slow send shouldn't block other notifications from being rate limited."""
+    release = threading.Event()
+    notifier = MagicMock(spec=Notifier)
+    notifier.send_batch.side_effect = lambda *_: release.wait()
+    limited = RateLimited(notifier, burst=1, refill_per_second=0.001)
+
+    sender = threading.Thread(target=limited.send, args=("first", "message"))
+    sender.start()
+    while not notifier.send_batch.called:
+        time.sleep(0.001)
+
+    # The first send is still in progress, but the next one is deferred immediately
+    deferred = threading.Thread(target=limited.send, args=("second", "message"))
+    deferred.start()
+    deferred.join(timeout=1)
+    release.set()
+    assert not deferred.is_alive()
+    assert limited.pending == 1
+
+    sender.join(timeout=1)
+    notifier.send_batch.assert_called_once_with([("first", "message")])
+
+
+def test_taskee_rate_limits(mock_running_task, mock_native_notifier):
+    """Taskee should rate limit notifiers by name."""
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_running_task.model_dump()]
+        t = Taskee(notifiers=["native"], rate_limits={"NATIVE": (5, 1.0)})
+
+    (notifier,) = t.notifiers
+    assert isinstance(notifier, RateLimited)
+    assert notifier.name == "native"
+    assert notifier.bucket.burst == 5
+    assert notifier.bucket.refill_per_second == 1 / 60
+
+
+def test_pushbullet_sets_default_timeout(mock_pushbullet_notifier):
+    """Pushbullet requests should time out rather than block forever."""
+    Pushbullet()
+    _, adapter = mock_pushbullet_notifier._session.mount.call_args[0]
+    request = MagicMock()
+
+    with patch("requests.adapters.HTTPAdapter.send") as send:
+        adapter.send(request)
+        assert send.call_args.kwargs["timeout"] == Pushbullet.TIMEOUT
+
+        adapter.send(request, timeout=1.0)
+        assert send.call_args.kwargs["timeout"] == 1.0
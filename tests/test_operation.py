@@ -1,3 +1,5 @@
+from taskee.operation import Operation, OperationStage
+
 from .mock_operation import MockOperation
 
 
@@ -7,3 +9,41 @@ def test_operation_with_unknown_type_and_state():
 
     assert op.metadata.state == "UNKNOWN"
     assert op.metadata.type == "UNKNOWN"
+
+
+def test_operation_hashes_on_name():
+    """Operations with the same name should be interchangeable as dict keys."""
+    op = MockOperation(state="RUNNING")
+    updated = op.model_copy(deep=True).update(state="SUCCEEDED")
+
+    assert hash(op) == hash(updated)
+    assert {op: "running"}[updated] == "running"
+    assert len({op, updated}) == 1
+
+
+def test_operation_metadata_is_shared():
+    """Identical stages and destinations should be stored once across operations."""
+    payloads = [MockOperation(state="SUCCEEDED").model_dump() for _ in range(2)]
+    for payload in payloads:
+        payload["metadata"]["stages"] = [
+            {"displayName": "Create Local Files", "description": "Computation."}
+        ]
+    a, b = (Operation(**payload) for payload in payloads)
+
+    assert a.metadata.stages == (
+        OperationStage(displayName="Create Local Files", description="Computation."),
+    )
+    assert a.metadata.stages is b.metadata.stages
+    assert a.metadata.destinationUris is b.metadata.destinationUris
+    assert a.metadata.description is b.metadata.description
+
+
+def test_operation_round_trips_through_payload():
+    """Compact operations should serialize and parse back to equal metadata."""
+    op = MockOperation(state="FAILED", error_message="Out of memory.")
+    parsed = Operation(**op.model_dump())
+
+    assert parsed.metadata == op.metadata
+    assert parsed.error.message == "Out of memory."
+    assert parsed.runtime == op.runtime
+
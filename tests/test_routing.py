@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from taskee.events import CompletedEvent, ErrorEvent, FailedEvent
+from taskee.routing import Router, Subscription, load_subscriptions
+
+from .mock_operation import MockOperation
+
+
+def _failed(description: str) -> FailedEvent:
+    return FailedEvent(task=MockOperation(state="FAILED", description=description))
+
+
+def test_router_routes_by_event_type():
+    """Subscriptions without patterns should route every event of their types."""
+    router = Router(
+        [
+            Subscription(events=["failed"], notifiers=["pushbullet"]),
+            Subscription(events=[], notifiers=["native"]),
+        ]
+    )
+
+    assert router.route(_failed("any")) == {"pushbullet", "native"}
+    assert router.route(ErrorEvent()) == {"native"}
+    assert router.notifiers == {"pushbullet", "native"}
+
+
+def test_router_routes_by_description():
+    """Description patterns should route only the events they match."""
+    router = Router(
+        [
+            Subscription(events=["failed"], notifiers=["native"], description="lc_*"),
+            Subscription(
+                events=["failed", "completed"],
+                notifiers=["pushbullet"],
+                description="*_2023",
+            ),
+        ]
+    )
+
+    assert router.route(_failed("lc_2023")) == {"native", "pushbullet"}
+    assert router.route(_failed("lc_2022")) == {"native"}
+    assert router.route(_failed("LC_2022")) == set()
+    task = MockOperation(state="SUCCEEDED", description="lc_2023")
+    completed = CompletedEvent(task=task)
+    assert router.route(completed) == {"pushbullet"}
+    # Events without tasks never match a pattern
+    assert router.route(ErrorEvent()) == set()
+
+
+def test_router_caches_descriptions():
+    """Routes should be cached by description."""
+    router = Router(
+        [
+            Subscription(events=["failed"], notifiers=[notifier], description=f"t{i}_*")
+            for i, notifier in enumerate(["native", "pushbullet"] * 50)
+        ]
+    )
+
+    assert router.route(_failed("t43_x")) == {"pushbullet"}
+    assert router.route(_failed("other")) == set()
+    assert router._routes[FailedEvent]._cache == {
+        "t43_x": frozenset({"pushbullet"}),
+        "other": frozenset(),
+    }
+
+
+def test_subscription_validates_names():
+    """Unknown event and notifier names should be rejected with a suggestion."""
+    with pytest.raises(ValueError, match="Did you mean 'FAILED'"):
+        Subscription(events=["faild"], notifiers=["native"])
+    with pytest.raises(ValueError, match="Did you mean 'NATIVE'"):
+        Subscription(events=["failed"], notifiers=["nativ"])
+    with pytest.raises(ValueError, match="NotifierEnum 'SLACK'"):
+        Subscription(events=["failed"], notifiers=["slack"])
+    with pytest.raises(ValueError, match="at least one notifier"):
+        Subscription(events=["failed"], notifiers=[])
+
+
+def test_load_subscriptions(tmpdir):
+    """Subscriptions should be loaded from a JSON list of rules."""
+    path = str(tmpdir / "subscriptions.json")
+    with open(path, "w") as dst:
+        json.dump(
+            [
+                {"events": ["failed"], "notifiers": ["pushbullet"], "description": "a"},
+                {"notifiers": ["native"]},
+            ],
+            dst,
+        )
+
+    assert load_subscriptions(path) == [
+        Subscription(events=("failed",), notifiers=("pushbullet",), description="a"),
+        Subscription(events=(), notifiers=("native",)),
+    ]
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [
+        {"notifiers": ["native"]},
+        [{"events": ["failed"]}],
+        [{"events": "failed", "notifiers": ["native"]}],
+        [{"events": ["faild"], "notifiers": ["native"]}],
+        [{"notifiers": ["slack"]}],
+    ],
+)
+def test_load_invalid_subscriptions(rules, tmpdir):
+    """Invalid subscription files should raise a ValueError."""
+    path = str(tmpdir / "subscriptions.json")
+    with open(path, "w") as dst:
+        json.dump(rules, dst)
+
+    with pytest.raises(ValueError, match="subscription"):
+        load_subscriptions(path)
@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+from taskee.cli.commands.tasks import TaskRows, create_task_table
+
+from .mock_operation import MockOperation
+
+
+def test_task_rows_are_reused(mock_task_list):
+    """Unchanged tasks should not be formatted again."""
+    rows = TaskRows()
+    first = rows.get_rows(mock_task_list)
+
+    with patch.object(rows, "_format", wraps=rows._format) as format_task:
+        second = rows.get_rows(mock_task_list)
+
+    assert format_task.call_count == 0
+    assert first == second
+
+
+def test_task_rows_refresh_changed_tasks():
+    """Tasks should be formatted again when their state changes."""
+    task = MockOperation(state="RUNNING")
+    rows = TaskRows()
+    rows.get_rows([task])
+
+    task.update(state="SUCCEEDED")
+    with patch.object(rows, "_format", wraps=rows._format) as format_task:
+        (row,) = rows.get_rows([task])
+
+    assert format_task.call_count == 1
+    assert "SUCCEEDED" in row[0]
+
+
+def test_task_rows_update_times_once_per_second(mock_task_list):
+    """Relative times should only be recomputed when the clock second changes."""
+    rows = TaskRows()
+
+    with patch("taskee.cli.rows.time.time", return_value=1_000.0), patch.object(
+        rows, "_format_time", wraps=rows._format_time
+    ) as format_time:
+        rows.get_rows(mock_task_list)
+        rows.get_rows(mock_task_list)
+    assert format_time.call_count == len(mock_task_list)
+
+    with patch("taskee.cli.rows.time.time", return_value=1_001.0), patch.object(
+        rows, "_format_time", wraps=rows._format_time
+    ) as format_time:
+        rows.get_rows(mock_task_list)
+    assert format_time.call_count == len(mock_task_list)
+
+
+def test_create_task_table_with_rows(mock_task_list):
+    """Tables built from a shared row cache should match uncached tables."""
+    rows = TaskRows(show_project=True)
+    cached = create_task_table(mock_task_list, 2, show_project=True, rows=rows)
+    uncached = create_task_table(mock_task_list, 2, show_project=True)
+
+    assert cached.row_count == uncached.row_count == 2
+    for cached_column, column in zip(cached.columns, uncached.columns):
+        assert list(cached_column.cells) == list(column.cells)
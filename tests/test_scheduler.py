@@ -0,0 +1,44 @@
+import pytest
+
+from taskee.events import StartedEvent
+from taskee.scheduler import AdaptiveScheduler
+
+from .mock_operation import MockOperation
+
+
+@pytest.fixture()
+def scheduler():
+    return AdaptiveScheduler(interval_seconds=300, min_seconds=60, max_seconds=3600)
+
+
+def test_scheduler_backs_off_when_idle(scheduler):
+    """Idle updates should back off exponentially up to the maximum interval."""
+    intervals = [scheduler.next_interval(active_tasks=()) for _ in range(5)]
+
+    assert intervals == [600, 1200, 2400, 3600, 3600]
+
+
+def test_scheduler_resets_after_events(scheduler, mock_running_task):
+    """Events should trigger the minimum interval and reset the idle backoff."""
+    scheduler.next_interval(active_tasks=())
+    event = StartedEvent(task=mock_running_task)
+
+    assert scheduler.next_interval((mock_running_task,), (event,)) == 60
+    assert scheduler.next_interval(active_tasks=()) == 600
+
+
+def test_scheduler_follows_progress(scheduler):
+    """Running tasks should be checked more often as they progress."""
+    task = MockOperation(state="RUNNING")
+
+    assert scheduler.next_interval((task,)) == 300
+    task.metadata.progress = 0.5
+    assert scheduler.next_interval((task,)) == 150
+    task.metadata.progress = 0.95
+    assert scheduler.next_interval((task,)) == 60
+
+
+def test_scheduler_validates_bounds():
+    """The base interval must be within the bounds."""
+    with pytest.raises(ValueError, match="between the minimum and maximum"):
+        AdaptiveScheduler(interval_seconds=30, min_seconds=60, max_seconds=3600)
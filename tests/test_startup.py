@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+
+# Modules that are slow to import and shouldn't be needed to start the CLI
+HEAVY_MODULES = ("ee", "pydantic", "requests", "notifypy", "taskee.taskee")
+
+CHECK_IMPORTS = """
+import sys
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from taskee.cli.cli import taskee
+
+with patch("taskee.notifiers.native.Native.send"):
+    result = CliRunner().invoke(taskee, {args!r})
+assert result.exit_code == 0, result.output
+
+print(",".join(m for m in {modules!r} if m in sys.modules))
+"""
+
+
+@pytest.mark.parametrize(
+    ("args", "allowed"),
+    [
+        (["--help"], ()),
+        (["test"], ("notifypy",)),
+        (["history", "--help"], ("pydantic",)),
+    ],
+)
+def test_cli_startup_imports(args, allowed):
+    """CLI commands shouldn't import heavy dependencies that they don't use."""
+    script = CHECK_IMPORTS.format(args=args, modules=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    imported = [m for m in result.stdout.strip().split(",") if m]
+
+    assert set(imported) <= set(allowed)
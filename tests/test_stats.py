@@ -0,0 +1,38 @@
+from taskee.stats import PHASES, CycleStats
+
+
+def test_cycle_stats_timed_iter():
+    """Time spent waiting for items should be recorded separately from processing."""
+    stats = CycleStats()
+
+    assert list(stats.timed_iter(range(3), "request")) == [0, 1, 2]
+    assert stats.durations["request"] > 0
+    assert stats.durations["diff"] == 0
+
+
+def test_cycle_stats_merge():
+    """Merging cycles should sum their durations and counts."""
+    first = CycleStats(fetched=2, changed=1, events=1)
+    second = CycleStats(fetched=3, events=2, notifications=1)
+    first.add("parse", 0.5)
+    second.add("parse", 0.25)
+
+    first.merge(second)
+
+    assert first.durations["parse"] == 0.75
+    assert (first.fetched, first.changed, first.events) == (5, 1, 3)
+    assert first.notifications == 1
+
+
+def test_cycle_stats_str():
+    """Stats should be summarized with every phase in order."""
+    stats = CycleStats(seconds=1.5, fetched=1000, changed=3, events=2)
+    stats.add("request", 1.25)
+
+    summary = str(stats)
+
+    assert summary.startswith("Updated in 1.50s: request 1.25s, parse 0.00s")
+    assert [summary.index(phase) for phase in PHASES] == sorted(
+        summary.index(phase) for phase in PHASES
+    )
+    assert "1,000 fetched, 3 changed, 2 events, 0 notifications" in summary
@@ -1,6 +1,17 @@
+import asyncio
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
+import pytest
+
 from taskee import events
+from taskee.filters import TaskFilter
+from taskee.notifiers.notifier import Notifier
+from taskee.operation import Operation
+from taskee.registry import Profile
+from taskee.routing import Subscription
+from taskee.snapshot import load_snapshot, save_snapshot
+from taskee.taskee import Taskee
 
 from .mock_operation import MockOperation
 
@@ -18,8 +29,8 @@ def test_taskee_stores_event_queue(mock_taskee, mock_pending_task, mock_running_
     mock_pending_task.update(state="SUCCEEDED")
     mock_running_task.update(state="FAILED")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [
             mock_pending_task.model_dump(),
             mock_running_task.model_dump(),
         ]
@@ -31,6 +42,40 @@ def test_taskee_stores_event_queue(mock_taskee, mock_pending_task, mock_running_
     assert len(mock_taskee.event_queue) == 0
 
 
+def test_taskee_records_stats(mock_taskee, mock_pending_task, mock_running_task):
+    """Each update and dispatch cycle should record phase durations and counts."""
+    mock_pending_task.update(state="RUNNING")
+    mock_running_task.update(state="SUCCEEDED")
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [
+            mock_pending_task.model_dump(),
+            mock_running_task.model_dump(),
+        ]
+        mock_taskee.update()
+    mock_taskee.dispatch()
+
+    # The initial update is the first cycle
+    assert len(mock_taskee.stats) == 2
+    cycle = mock_taskee.stats[-1]
+    assert (cycle.fetched, cycle.changed, cycle.events) == (2, 2, 2)
+    # Only the completed event is watched by default, and it's sent to both notifiers
+    assert cycle.notifications == 2
+    assert cycle.seconds >= sum(cycle.durations.values())
+    assert cycle.durations["notify"] > 0
+
+
+def test_taskee_stats_are_bounded(mock_taskee, mock_task_list):
+    """Only the most recent cycles should be kept."""
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        for _ in range(Taskee.MAX_STATS + 1):
+            mock_taskee.update()
+
+    assert len(mock_taskee.stats) == Taskee.MAX_STATS
+    assert mock_taskee.stats[-1].changed == 0
+
+
 def test_taskee_sorts_tasks(mock_taskee):
     """Test that tasks are sorted by activity, then creation time."""
     new_active_task = MockOperation(
@@ -51,8 +96,8 @@ def test_taskee_sorts_tasks(mock_taskee):
     # Note that these are not in the correct sorted order
     tasks = [old_inactive_task, new_active_task, new_inactive_task, old_active_task]
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [t.model_dump() for t in tasks]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [t.model_dump() for t in tasks]
         mock_taskee.update()
 
     assert mock_taskee.tasks == (
@@ -67,8 +112,8 @@ def test_taskee_ignores_unchanged_tasks(mock_taskee, mock_task_list):
     """Taskee should not register events for unchanged tasks."""
     assert len(mock_taskee.tasks) == 3
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [task.model_dump() for task in mock_task_list]
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
         mock_taskee.update()
 
     assert len(mock_taskee.tasks) == 3
@@ -84,8 +129,8 @@ def test_taskee_only_notifies_watched_tasks(
     mock_running_task.update(state="FAILED")
     new_task = MockOperation(state="PENDING", description="mock_new_task")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [
             mock_pending_task.model_dump(),
             mock_running_task.model_dump(),
             new_task.model_dump(),
@@ -107,8 +152,8 @@ def test_taskee_reports_remaining(
     mock_taskee.watch_for = [events.CompletedEvent]
     mock_pending_task.update(state="SUCCEEDED")
 
-    with patch("ee.data.listOperations") as listOperations:
-        listOperations.return_value = [
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [
             mock_pending_task.model_dump(),
             mock_running_task.model_dump(),
         ]
@@ -118,3 +163,372 @@ def test_taskee_reports_remaining(
 
     expected_msg = "(1 tasks remaining)"
     assert expected_msg in mock_native_notifier.message
+
+
+def test_taskee_registry_is_keyed_by_name(mock_taskee, mock_task_list):
+    """Tasks should be registered by their unique operation name."""
+    registry = mock_taskee._registries[0].operations
+    assert set(registry) == {task.name for task in mock_task_list}
+    assert set(mock_taskee.tasks) == set(mock_task_list)
+
+
+def test_taskee_reuses_unchanged_tasks(mock_taskee, mock_task_list, mock_pending_task):
+    """Unchanged operations should be reused rather than parsed again."""
+    prev_tasks = {task.name: task for task in mock_taskee.tasks}
+    mock_pending_task.update(state="RUNNING")
+
+    with patch("taskee.fetch.iter_operations") as iter_operations, patch(
+        "taskee.registry.Operation", wraps=Operation
+    ) as operation:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        mock_taskee.update()
+
+    # Only the updated task should be parsed
+    parsed = [call.kwargs["name"] for call in operation.call_args_list]
+    assert parsed == [mock_pending_task.name]
+    for task in mock_taskee.tasks:
+        if task.name == mock_pending_task.name:
+            assert task is not prev_tasks[task.name]
+        else:
+            assert task is prev_tasks[task.name]
+
+
+def test_taskee_ignores_tasks_older_than_max_age(mock_task_list):
+    """Tasks created before the max age should not be tracked."""
+    old_task = MockOperation(state="FAILED", time_since_creation_ms=2 * 86_400_000)
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [
+            task.model_dump() for task in [*mock_task_list, old_task]
+        ]
+        t = Taskee(notifiers=tuple(), max_age=timedelta(days=1))
+
+    assert len(t.tasks) == 3
+    assert old_task not in t.tasks
+
+
+def test_taskee_fetches_since_watermark(mock_task_list):
+    """Subsequent updates should only fetch back to the oldest active task."""
+    old_task = MockOperation(state="SUCCEEDED", time_since_creation_ms=86_400_000)
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [
+            task.model_dump() for task in [*mock_task_list, old_task]
+        ]
+        t = Taskee(notifiers=tuple())
+
+        # The old task is beyond the watermark, so it won't be fetched again
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        t.update()
+
+    oldest_active = min(task.metadata.createTime for task in t.active_tasks)
+    assert iter_operations.call_args.kwargs["since"] == oldest_active
+    assert old_task in t.tasks
+
+
+def test_taskee_drops_tasks_that_age_past_max_age(mock_task_list):
+    """Tasks carried over from earlier updates should be dropped after max age."""
+    old_task = MockOperation(state="SUCCEEDED", time_since_creation_ms=82_800_000)
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [
+            task.model_dump() for task in [*mock_task_list, old_task]
+        ]
+        t = Taskee(notifiers=tuple(), max_age=timedelta(days=1))
+        assert old_task in t.tasks
+
+        class Later(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime.now(tz) + timedelta(hours=2)
+
+        # The old task is beyond the watermark, so it's only carried over
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        with patch("taskee.registry.datetime", Later):
+            t.update()
+
+    assert len(t.tasks) == 3
+    assert old_task not in t.tasks
+
+
+def test_taskee_update_async(mock_taskee, mock_pending_task):
+    """Async updates should register events like blocking updates."""
+    mock_pending_task.update(state="RUNNING")
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_pending_task.model_dump()]
+        new_events = asyncio.run(mock_taskee.update_async())
+
+    assert len(new_events) == 1
+    assert isinstance(new_events[0], events.StartedEvent)
+    assert len(mock_taskee.event_queue) == 1
+
+
+def test_taskee_dispatch_async_is_concurrent(mock_taskee, mock_running_task):
+    """Async dispatch should send notifications concurrently."""
+    in_flight = 0
+    max_in_flight = 0
+
+    class SlowNotifier(Notifier):
+        def send(self, title: str, message: str) -> None:
+            raise NotImplementedError
+
+        async def send_async(self, title: str, message: str) -> None:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    mock_taskee.notifiers = [SlowNotifier(), SlowNotifier()]
+    mock_running_task.update(state="FAILED")
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_running_task.model_dump()]
+        mock_taskee.update()
+
+    asyncio.run(mock_taskee.dispatch_async())
+
+    assert max_in_flight == 2
+    assert len(mock_taskee.event_queue) == 0
+
+
+def test_taskee_digests_events(mock_task_list, mock_native_notifier):
+    """Digest mode should combine a burst of events into one notification."""
+    tasks = [MockOperation(state="RUNNING", description=f"t{i}") for i in range(3)]
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in tasks]
+        t = Taskee(notifiers=["native"], digest_window=60)
+
+        tasks[0].update(state="SUCCEEDED")
+        tasks[1].update(state="SUCCEEDED")
+        tasks[2].update(state="FAILED")
+        iter_operations.return_value = [task.model_dump() for task in tasks]
+        t.update()
+
+    t.dispatch()
+
+    mock_native_notifier.send.assert_called_once()
+    assert mock_native_notifier.title == "Task Digest"
+    assert "3 task events (2 completed, 1 failed)" in mock_native_notifier.message
+    assert "0 tasks remaining" in mock_native_notifier.message
+
+
+def test_taskee_digest_window(mock_taskee, mock_pending_task, mock_native_notifier):
+    """Events within the digest window should wait for the next digest or flush."""
+    mock_taskee.notifiers = mock_taskee.notifiers[:1]
+    mock_taskee.watch_for = [events.StartedEvent, events.CompletedEvent]
+    mock_taskee.digest_window = 60
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_pending_task.model_dump()]
+        mock_pending_task.update(state="RUNNING")
+        iter_operations.return_value = [mock_pending_task.model_dump()]
+        mock_taskee.update()
+        mock_taskee.dispatch()
+
+        mock_pending_task.update(state="SUCCEEDED")
+        iter_operations.return_value = [mock_pending_task.model_dump()]
+        mock_taskee.update()
+        mock_taskee.dispatch()
+
+    # A lone event in a digest is sent as-is
+    assert mock_native_notifier.send.call_count == 1
+    assert mock_native_notifier.title == "Task Started"
+
+    mock_taskee.flush()
+    assert mock_native_notifier.send.call_count == 2
+    assert mock_native_notifier.title == "Task Completed"
+
+
+def test_taskee_digest_bypass(mock_taskee, mock_running_task, mock_native_notifier):
+    """Bypassed events should be sent immediately in digest mode."""
+    mock_taskee.notifiers = mock_taskee.notifiers[:1]
+    mock_taskee.digest_window = 60
+    mock_taskee.digest_bypass = [events.FailedEvent]
+    mock_running_task.update(state="FAILED")
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [mock_running_task.model_dump()]
+        mock_taskee.update()
+
+    mock_taskee.dispatch()
+
+    mock_native_notifier.send.assert_called_once()
+    assert mock_native_notifier.title == "Task Failed"
+
+
+def test_taskee_monitors_multiple_projects():
+    """Tasks and events from several projects should be tracked and merged."""
+    first = MockOperation(state="PENDING", project="first-project")
+    second = MockOperation(state="RUNNING", project="second-project")
+    payloads = {"projects/first-project": [first], "projects/second-project": [second]}
+
+    def iter_project_operations(project, **_):
+        return [task.model_dump() for task in payloads[project]]
+
+    with patch(
+        "taskee.fetch.iter_operations", side_effect=iter_project_operations
+    ) as iter_operations:
+        t = Taskee(
+            notifiers=tuple(),
+            profiles=[
+                Profile(project="first-project"),
+                Profile(credentials="mock-credentials", project="second-project"),
+            ],
+        )
+        assert set(t.tasks) == {first, second}
+
+        first.update(state="RUNNING")
+        second.update(state="SUCCEEDED")
+        new_events = t.update()
+
+    assert {event.task.project for event in new_events} == {
+        "first-project",
+        "second-project",
+    }
+    assert [registry.tasks for registry in t._registries] == [(first,), (second,)]
+    # Only the additional profiles need their own credentials
+    calls = iter_operations.call_args_list
+    assert {call.kwargs["credentials"] for call in calls} == {None, "mock-credentials"}
+
+
+def test_taskee_restores_snapshot(tmpdir, mock_task_list, mock_running_task):
+    """Restarting from a snapshot should report events missed while stopped."""
+    snapshot_path = str(tmpdir / "snapshot.json")
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        Taskee(notifiers=tuple(), snapshot_path=snapshot_path)
+
+        # These changes occur while taskee is stopped
+        mock_running_task.update(state="SUCCEEDED")
+        new_task = MockOperation(state="PENDING", time_since_creation_ms=-1000)
+        iter_operations.return_value = [
+            task.model_dump() for task in [*mock_task_list, new_task]
+        ]
+        t = Taskee(notifiers=tuple(), snapshot_path=snapshot_path)
+
+    assert len(t.tasks) == 4
+    assert {type(event) for event in t.event_queue} == {
+        events.CompletedEvent,
+        events.CreatedEvent,
+    }
+
+
+def test_taskee_restores_snapshot_with_update_times(
+    tmpdir, mock_task_list, mock_running_task
+):
+    """Snapshots that also stored update times should still be restored."""
+    snapshot_path = str(tmpdir / "snapshot.json")
+    tasks = {
+        task.name: [task.metadata.state.value, task.metadata.attempt, 0.0]
+        for task in mock_task_list
+    }
+    save_snapshot(snapshot_path, {"default": {"last_fetch": 0.0, "tasks": tasks}})
+    mock_running_task.update(state="FAILED")
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        t = Taskee(notifiers=tuple(), snapshot_path=snapshot_path)
+
+    assert [type(event) for event in t.event_queue] == [events.FailedEvent]
+    assert load_snapshot(snapshot_path)["default"]["tasks"][mock_running_task.name] == [
+        "FAILED",
+        1,
+    ]
+
+
+def test_taskee_ignores_invalid_snapshot(tmpdir, mock_task_list):
+    """A missing or unreadable snapshot should be ignored."""
+    snapshot_path = tmpdir / "snapshot.json"
+    snapshot_path.write_text("not json", "utf-8")
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        t = Taskee(notifiers=tuple(), snapshot_path=str(snapshot_path))
+
+    assert len(t.tasks) == 3
+    assert len(t.event_queue) == 0
+    # The snapshot should be replaced after the first update
+    assert len(load_snapshot(str(snapshot_path))["default"]["tasks"]) == 3
+
+
+def test_taskee_filters_before_parsing(mock_task_list, mock_running_task):
+    """Tasks that don't match the filter should be skipped before parsing."""
+    with patch("taskee.fetch.iter_operations") as iter_operations, patch(
+        "taskee.registry.Operation", wraps=Operation
+    ) as operation:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        task_filter = TaskFilter(description="mock_running_*")
+        t = Taskee(notifiers=tuple(), task_filter=task_filter)
+
+    assert [task.name for task in t.tasks] == [mock_running_task.name]
+    parsed = [call.kwargs["name"] for call in operation.call_args_list]
+    assert parsed == [mock_running_task.name]
+
+
+def test_taskee_filtered_tasks_change_state(
+    mock_task_list, mock_pending_task, mock_running_task
+):
+    """Filtered tasks should stay tracked and report events as their states change."""
+    running = MockOperation(state="RUNNING", type="EXPORT_FEATURES")
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        tasks = [*mock_task_list, running]
+        iter_operations.return_value = [task.model_dump() for task in tasks]
+        t = Taskee(notifiers=tuple(), task_filter=TaskFilter(types=["export_image"]))
+
+        mock_pending_task.update(state="RUNNING")
+        running.update(state="FAILED")
+        mock_running_task.update(state="FAILED")
+        iter_operations.return_value = [task.model_dump() for task in tasks]
+        t.update()
+
+    assert len(t.tasks) == 3
+    assert sorted(type(event).__name__ for event in t.event_queue) == [
+        "FailedEvent",
+        "StartedEvent",
+    ]
+
+
+def test_taskee_rejects_state_filters(mock_task_list):
+    """Tracking tasks by state would lose their events when their states change."""
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        iter_operations.return_value = [task.model_dump() for task in mock_task_list]
+        with pytest.raises(ValueError, match="can't be tracked by state"):
+            Taskee(notifiers=tuple(), task_filter=TaskFilter(states=["running"]))
+
+
+def test_taskee_routes_subscriptions(
+    mock_native_notifier, mock_pushbullet_notifier, mock_pending_task
+):
+    """Subscribed events should only go to the notifiers they're routed to."""
+    landcover = MockOperation(state="RUNNING", description="landcover_2023")
+    other = MockOperation(state="RUNNING", description="other")
+    subscriptions = [
+        Subscription(events=["failed"], notifiers=["pushbullet"], description="land*"),
+        Subscription(events=["started"], notifiers=["native"]),
+    ]
+
+    with patch("taskee.fetch.iter_operations") as iter_operations:
+        tasks = [landcover, other, mock_pending_task]
+        iter_operations.return_value = [task.model_dump() for task in tasks]
+        t = Taskee(notifiers=["native"], subscriptions=subscriptions)
+
+        landcover.update(state="FAILED")
+        other.update(state="FAILED")
+        mock_pending_task.update(state="RUNNING")
+        iter_operations.return_value = [task.model_dump() for task in tasks]
+        t.update()
+
+    t.dispatch()
+
+    # Both failures are watched and the started event is subscribed. Native collapses
+    # the failures into one notification.
+    assert mock_native_notifier.send.call_count == 2
+    assert t.stats[-1].notifications == 4
+    # Only the landcover failure is routed to Pushbullet
+    mock_pushbullet_notifier.push_note.assert_called_once()
+    assert "landcover_2023" in mock_pushbullet_notifier.push_note.call_args[0][1]